@@ -0,0 +1,104 @@
+"""Benchmark KnowledgeRepository batch inserts: row-by-row loop vs. binary COPY.
+
+Requires a migrated database reachable through the usual POSTGRES_* settings.
+A throwaway project and document are created for the run and removed afterwards.
+
+Usage:
+    poetry run python -m benchmarks.knowledge_create_batch --rows 500 --repeat 3
+"""
+
+import argparse
+import asyncio
+import random
+import time
+from datetime import datetime, timezone
+from uuid import UUID, uuid4
+
+from src.domain.models.knowledge import KnowledgeItem
+from src.infrastructure.database.repositories.knowledge_repository import KnowledgeRepository
+from src.shared.infrastructure.database.connection import close_pool, init_pool
+
+
+def _make_items(document_id: UUID, rows: int, dimensions: int) -> list[KnowledgeItem]:
+    """Build synthetic knowledge items with random embeddings."""
+    now = datetime.now(timezone.utc)
+    return [
+        KnowledgeItem(
+            id=uuid4(),
+            document_id=document_id,
+            chunk_text=f"Benchmark chunk {i} " + "lorem ipsum " * 150,
+            chunk_index=i,
+            embedding=[random.uniform(-1.0, 1.0) for _ in range(dimensions)],
+            metadata={"chunk_index": i, "token_count": 512},
+            created_at=now,
+        )
+        for i in range(rows)
+    ]
+
+
+async def _run(rows: int, repeat: int, dimensions: int) -> None:
+    pool = await init_pool()
+    repo = KnowledgeRepository(pool)
+    project_id = uuid4()
+    document_id = uuid4()
+
+    async with pool.acquire() as conn:
+        await conn.execute(
+            "INSERT INTO projects (id, name, description, status, tags) VALUES ($1, $2, $3, $4, $5)",
+            project_id,
+            "create_batch benchmark",
+            "Temporary project created by benchmarks/knowledge_create_batch.py",
+            "Active",
+            [],
+        )
+        await conn.execute(
+            """
+            INSERT INTO documents (id, project_id, name, type, version, content_hash)
+            VALUES ($1, $2, $3, $4, $5, $6)
+            """,
+            document_id,
+            project_id,
+            "benchmark.md",
+            "markdown",
+            "1.0.0",
+            "0" * 64,
+        )
+
+    modes = {
+        "rowwise": repo._create_batch_rowwise,
+        "copy": repo._create_batch_copy,
+    }
+
+    try:
+        for name, insert in modes.items():
+            timings: list[float] = []
+            for _ in range(repeat):
+                items = _make_items(document_id, rows, dimensions)
+                now = datetime.now(timezone.utc).replace(tzinfo=None)
+                start = time.perf_counter()
+                await insert(items, now)
+                timings.append(time.perf_counter() - start)
+                await repo.delete_by_document(document_id)
+
+            best = min(timings)
+            print(
+                f"{name:>8}: {rows} rows, best {best * 1000:8.1f} ms "
+                f"({rows / best:10.1f} rows/s) over {repeat} run(s)"
+            )
+    finally:
+        async with pool.acquire() as conn:
+            await conn.execute("DELETE FROM projects WHERE id = $1", project_id)
+        await close_pool()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rows", type=int, default=500, help="Rows per batch")
+    parser.add_argument("--repeat", type=int, default=3, help="Runs per mode")
+    parser.add_argument("--dimensions", type=int, default=1536, help="Embedding dimensions")
+    args = parser.parse_args()
+    asyncio.run(_run(args.rows, args.repeat, args.dimensions))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,194 @@
+"""Benchmark ANN recall@k, latency and index size per vector index mode.
+
+Compares the float32 HNSW index with the halfvec and binary-quantized indexes
+(rescored at full precision) against exact search as ground truth, and fails
+when a quantized mode loses more recall than the given tolerance.
+
+Requires a migrated database reachable through the usual POSTGRES_* settings.
+A throwaway project is filled with clustered synthetic embeddings and removed
+afterwards. Quantized indexes missing from the database are built for the run
+and dropped again.
+
+Usage:
+    poetry run python -m benchmarks.vector_index_recall --rows 5000 --queries 50 --top-k 10
+"""
+
+import argparse
+import asyncio
+import math
+import random
+import sys
+import time
+from datetime import datetime, timezone
+from uuid import UUID, uuid4
+
+from src.domain.models.knowledge import KnowledgeItem, SearchEffort, VectorIndexMode
+from src.infrastructure.database.repositories.knowledge_repository import (
+    EMBEDDING_DIMENSIONS,
+    KnowledgeRepository,
+)
+from src.shared.infrastructure.database.connection import close_pool, init_pool
+
+_INDEXES = {
+    VectorIndexMode.FULL: (
+        "idx_knowledge_items_embedding_hnsw",
+        "USING hnsw (embedding vector_cosine_ops)",
+    ),
+    VectorIndexMode.HALFVEC: (
+        "idx_knowledge_items_embedding_halfvec_hnsw",
+        f"USING hnsw ((embedding::halfvec({EMBEDDING_DIMENSIONS})) halfvec_cosine_ops)",
+    ),
+    VectorIndexMode.BINARY: (
+        "idx_knowledge_items_embedding_bit_hnsw",
+        f"USING hnsw ((binary_quantize(embedding)::bit({EMBEDDING_DIMENSIONS})) bit_hamming_ops)",
+    ),
+}
+
+_INDEX_SIZE_QUERY = """
+    SELECT COALESCE(SUM(pg_relation_size(i.inhrelid)), 0)
+    FROM pg_inherits i
+    WHERE i.inhparent = to_regclass($1)
+"""
+
+
+def _unit_vector(center: list[float], spread: float) -> list[float]:
+    """Sample a normalized vector around a cluster center."""
+    values = [c + random.gauss(0.0, spread) for c in center]
+    norm = math.sqrt(sum(v * v for v in values)) or 1.0
+    return [v / norm for v in values]
+
+
+def _make_dataset(rows: int, queries: int, clusters: int) -> tuple[list[list[float]], list[list[float]]]:
+    """Build clustered embeddings and queries drawn from the same distribution."""
+    centers = [_unit_vector([0.0] * EMBEDDING_DIMENSIONS, 1.0) for _ in range(clusters)]
+    spread = 1.0 / math.sqrt(EMBEDDING_DIMENSIONS)
+    vectors = [_unit_vector(random.choice(centers), spread) for _ in range(rows)]
+    probes = [_unit_vector(random.choice(centers), spread) for _ in range(queries)]
+    return vectors, probes
+
+
+async def _run(args: argparse.Namespace) -> int:
+    random.seed(args.seed)
+    pool = await init_pool()
+    project_id = uuid4()
+    document_id = uuid4()
+    created_indexes: list[str] = []
+
+    async with pool.acquire() as conn:
+        await conn.execute(
+            "INSERT INTO projects (id, name, description, status, tags) VALUES ($1, $2, $3, $4, $5)",
+            project_id,
+            "vector index benchmark",
+            "Temporary project created by benchmarks/vector_index_recall.py",
+            "Active",
+            [],
+        )
+        await conn.execute(
+            """
+            INSERT INTO documents (id, project_id, name, type, version, content_hash)
+            VALUES ($1, $2, $3, $4, $5, $6)
+            """,
+            document_id,
+            project_id,
+            "benchmark.md",
+            "markdown",
+            "1.0.0",
+            "0" * 64,
+        )
+
+    try:
+        vectors, probes = _make_dataset(args.rows, args.queries, args.clusters)
+        now = datetime.now(timezone.utc)
+        await KnowledgeRepository(pool).create_batch(
+            [
+                KnowledgeItem(
+                    id=uuid4(),
+                    document_id=document_id,
+                    chunk_text=f"Benchmark chunk {i}",
+                    chunk_index=i,
+                    embedding=vector,
+                    metadata={},
+                    created_at=now,
+                    project_id=project_id,
+                )
+                for i, vector in enumerate(vectors)
+            ]
+        )
+
+        async with pool.acquire() as conn:
+            for name, definition in _INDEXES.values():
+                if await conn.fetchval("SELECT to_regclass($1)", name) is None:
+                    print(f"building {name} for this run...")
+                    await conn.execute(f"CREATE INDEX {name} ON knowledge_items {definition}")
+                    created_indexes.append(name)
+            await conn.execute("ANALYZE knowledge_items")
+
+        exact_repo = KnowledgeRepository(pool, exact_search_max_chunks=args.rows)
+        truth: list[set[UUID]] = []
+        for probe in probes:
+            hits = await exact_repo.vector_search(project_id, probe, args.top_k)
+            truth.append({item.id for item, _ in hits})
+
+        # As in production: quantized modes raise ef_search to cover the shortlist
+        effort = SearchEffort(ef_search=args.ef_search)
+        recalls: dict[VectorIndexMode, float] = {}
+        print(f"\n{'mode':>8} {'recall@k':>9} {'p50 ms':>8} {'index MB':>9}")
+        for mode in VectorIndexMode:
+            repo = KnowledgeRepository(
+                pool,
+                exact_search_max_chunks=0,
+                vector_index_mode=mode,
+                rescore_factor=args.rescore_factor,
+            )
+            latencies: list[float] = []
+            found = 0
+            for probe, expected in zip(probes, truth):
+                start = time.perf_counter()
+                hits = await repo.vector_search(project_id, probe, args.top_k, effort=effort)
+                latencies.append((time.perf_counter() - start) * 1000)
+                found += len(expected & {item.id for item, _ in hits})
+
+            async with pool.acquire() as conn:
+                index_bytes = await conn.fetchval(_INDEX_SIZE_QUERY, _INDEXES[mode][0])
+
+            recalls[mode] = found / (len(probes) * args.top_k)
+            latencies.sort()
+            print(
+                f"{mode.value:>8} {recalls[mode]:9.3f} {latencies[len(latencies) // 2]:8.2f} "
+                f"{index_bytes / 1024 / 1024:9.1f}"
+            )
+    finally:
+        async with pool.acquire() as conn:
+            await conn.execute("DELETE FROM projects WHERE id = $1", project_id)
+            for name in created_indexes:
+                await conn.execute(f"DROP INDEX IF EXISTS {name}")
+        await close_pool()
+
+    failed = [
+        mode.value
+        for mode in (VectorIndexMode.HALFVEC, VectorIndexMode.BINARY)
+        if recalls[VectorIndexMode.FULL] - recalls[mode] > args.tolerance
+    ]
+    if failed:
+        print(f"\nrecall drop above tolerance {args.tolerance}: {', '.join(failed)}")
+        return 1
+    print(f"\nall modes within recall tolerance {args.tolerance}")
+    return 0
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rows", type=int, default=5000, help="Embeddings to index")
+    parser.add_argument("--queries", type=int, default=50, help="Query vectors")
+    parser.add_argument("--top-k", type=int, default=10, help="Results per query")
+    parser.add_argument("--clusters", type=int, default=50, help="Synthetic topic clusters")
+    parser.add_argument("--ef-search", type=int, default=40, help="hnsw.ef_search")
+    parser.add_argument("--rescore-factor", type=int, default=4, help="Shortlist multiplier")
+    parser.add_argument("--tolerance", type=float, default=0.02, help="Allowed recall@k drop")
+    parser.add_argument("--seed", type=int, default=7, help="Random seed")
+    args = parser.parse_args()
+    sys.exit(asyncio.run(_run(args)))
+
+
+if __name__ == "__main__":
+    main()
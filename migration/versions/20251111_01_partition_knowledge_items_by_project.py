@@ -0,0 +1,160 @@
+"""Denormalize project_id onto knowledge_items and hash-partition by project.
+
+Project-filtered searches previously joined knowledge_items to documents to
+filter on documents.project_id, which the HNSW index cannot see. The table is
+rebuilt as a hash-partitioned table keyed by project_id (backfilled from
+documents), so each partition carries its own, smaller HNSW index and a
+project filter prunes the search to a single partition.
+
+Revision ID: 20251111_01
+Revises: 20251110_01
+Create Date: 2025-11-11
+"""
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = "20251111_01"
+down_revision = "20251110_01"
+branch_labels = None
+depends_on = None
+
+PARTITION_COUNT = 16
+
+
+def upgrade() -> None:
+    """Rebuild knowledge_items partitioned by project_id."""
+    op.execute("ALTER TABLE knowledge_items RENAME TO knowledge_items_unpartitioned;")
+    op.execute(
+        "ALTER TABLE knowledge_items_unpartitioned "
+        "RENAME CONSTRAINT knowledge_items_pkey TO knowledge_items_unpartitioned_pkey;"
+    )
+    op.execute("DROP INDEX IF EXISTS idx_knowledge_items_document_id;")
+    op.execute("DROP INDEX IF EXISTS idx_knowledge_items_chunk_index;")
+    op.execute("DROP INDEX IF EXISTS idx_knowledge_items_embedding_hnsw;")
+    op.execute("DROP INDEX IF EXISTS idx_knowledge_items_fulltext;")
+
+    op.execute(
+        """
+        CREATE TABLE knowledge_items (
+            id UUID NOT NULL,
+            project_id UUID NOT NULL REFERENCES projects(id) ON DELETE CASCADE,
+            document_id UUID NOT NULL REFERENCES documents(id) ON DELETE CASCADE,
+            chunk_text TEXT NOT NULL,
+            chunk_index INTEGER NOT NULL,
+            embedding vector(1536) NOT NULL,
+            metadata JSONB NOT NULL DEFAULT '{}'::jsonb,
+            created_at TIMESTAMP NOT NULL DEFAULT NOW(),
+            PRIMARY KEY (project_id, id)
+        ) PARTITION BY HASH (project_id);
+        """
+    )
+    for remainder in range(PARTITION_COUNT):
+        op.execute(
+            f"""
+            CREATE TABLE knowledge_items_p{remainder:02d}
+            PARTITION OF knowledge_items
+            FOR VALUES WITH (MODULUS {PARTITION_COUNT}, REMAINDER {remainder});
+            """
+        )
+
+    # Backfill project_id from the parent documents
+    op.execute(
+        """
+        INSERT INTO knowledge_items (
+            id, project_id, document_id, chunk_text, chunk_index, embedding, metadata, created_at
+        )
+        SELECT ki.id, d.project_id, ki.document_id, ki.chunk_text, ki.chunk_index,
+               ki.embedding, ki.metadata, ki.created_at
+        FROM knowledge_items_unpartitioned ki
+        JOIN documents d ON ki.document_id = d.id;
+        """
+    )
+    op.execute("DROP TABLE knowledge_items_unpartitioned;")
+
+    # Indexes are created on the parent and propagate to every partition
+    op.execute("CREATE INDEX idx_knowledge_items_id ON knowledge_items(id);")
+    op.execute(
+        "CREATE INDEX idx_knowledge_items_document_id ON knowledge_items(document_id);"
+    )
+    op.execute(
+        """
+        CREATE INDEX idx_knowledge_items_project_document
+        ON knowledge_items(project_id, document_id, chunk_index);
+        """
+    )
+    op.execute(
+        """
+        CREATE INDEX idx_knowledge_items_embedding_hnsw
+        ON knowledge_items
+        USING hnsw (embedding vector_cosine_ops);
+        """
+    )
+    op.execute(
+        """
+        CREATE INDEX idx_knowledge_items_fulltext
+        ON knowledge_items
+        USING gin(to_tsvector('english', chunk_text));
+        """
+    )
+
+
+def downgrade() -> None:
+    """Restore the unpartitioned knowledge_items table without project_id."""
+    op.execute("ALTER TABLE knowledge_items RENAME TO knowledge_items_partitioned;")
+    op.execute(
+        "ALTER TABLE knowledge_items_partitioned "
+        "RENAME CONSTRAINT knowledge_items_pkey TO knowledge_items_partitioned_pkey;"
+    )
+    op.execute("DROP INDEX IF EXISTS idx_knowledge_items_id;")
+    op.execute("DROP INDEX IF EXISTS idx_knowledge_items_document_id;")
+    op.execute("DROP INDEX IF EXISTS idx_knowledge_items_project_document;")
+    op.execute("DROP INDEX IF EXISTS idx_knowledge_items_embedding_hnsw;")
+    op.execute("DROP INDEX IF EXISTS idx_knowledge_items_fulltext;")
+
+    op.execute(
+        """
+        CREATE TABLE knowledge_items (
+            id UUID PRIMARY KEY,
+            document_id UUID NOT NULL REFERENCES documents(id) ON DELETE CASCADE,
+            chunk_text TEXT NOT NULL,
+            chunk_index INTEGER NOT NULL,
+            embedding vector(1536) NOT NULL,
+            metadata JSONB NOT NULL DEFAULT '{}'::jsonb,
+            created_at TIMESTAMP NOT NULL DEFAULT NOW()
+        );
+        """
+    )
+    op.execute(
+        """
+        INSERT INTO knowledge_items (
+            id, document_id, chunk_text, chunk_index, embedding, metadata, created_at
+        )
+        SELECT id, document_id, chunk_text, chunk_index, embedding, metadata, created_at
+        FROM knowledge_items_partitioned;
+        """
+    )
+    op.execute("DROP TABLE knowledge_items_partitioned CASCADE;")
+
+    op.execute(
+        "CREATE INDEX idx_knowledge_items_document_id ON knowledge_items(document_id);"
+    )
+    op.execute(
+        "CREATE INDEX idx_knowledge_items_chunk_index ON knowledge_items(document_id, chunk_index);"
+    )
+    op.execute(
+        """
+        CREATE INDEX idx_knowledge_items_embedding_hnsw
+        ON knowledge_items
+        USING hnsw (embedding vector_cosine_ops);
+        """
+    )
+    op.execute(
+        """
+        CREATE INDEX idx_knowledge_items_fulltext
+        ON knowledge_items
+        USING gin(to_tsvector('english', chunk_text));
+        """
+    )
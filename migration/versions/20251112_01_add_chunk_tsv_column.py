@@ -0,0 +1,53 @@
+"""Add a stored tsvector column for keyword search on knowledge_items.
+
+chunk_tsv is generated from chunk_text when a row is written, so keyword
+search filters and ranks against precomputed lexemes instead of calling
+to_tsvector() per candidate row. The GIN expression index from 20251110_01
+is replaced by a GIN index on the column.
+
+Revision ID: 20251112_01
+Revises: 20251111_01
+Create Date: 2025-11-12
+"""
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = "20251112_01"
+down_revision = "20251111_01"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    """Add generated chunk_tsv column and index it."""
+    op.execute(
+        """
+        ALTER TABLE knowledge_items
+        ADD COLUMN chunk_tsv tsvector
+        GENERATED ALWAYS AS (to_tsvector('english', chunk_text)) STORED;
+        """
+    )
+    op.execute(
+        """
+        CREATE INDEX idx_knowledge_items_chunk_tsv
+        ON knowledge_items
+        USING gin(chunk_tsv);
+        """
+    )
+    op.execute("DROP INDEX IF EXISTS idx_knowledge_items_fulltext;")
+
+
+def downgrade() -> None:
+    """Restore the expression index and drop chunk_tsv."""
+    op.execute(
+        """
+        CREATE INDEX IF NOT EXISTS idx_knowledge_items_fulltext
+        ON knowledge_items
+        USING gin(to_tsvector('english', chunk_text));
+        """
+    )
+    op.execute("DROP INDEX IF EXISTS idx_knowledge_items_chunk_tsv;")
+    op.execute("ALTER TABLE knowledge_items DROP COLUMN IF EXISTS chunk_tsv;")
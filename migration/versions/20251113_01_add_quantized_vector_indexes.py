@@ -0,0 +1,76 @@
+"""Add quantized HNSW indexes for halfvec / binary ANN search.
+
+Builds an expression HNSW index over the existing embeddings for the mode
+selected by RAG_VECTOR_INDEX_MODE (the same variable the API reads):
+
+- halfvec: embedding::halfvec(1536), half the size of the float32 index
+- binary:  binary_quantize(embedding)::bit(1536), 1/32 of the size
+
+Rows keep their full-precision embedding, which the repository uses to rescore
+the quantized shortlist. In a quantized mode the float32 HNSW index is dropped,
+which is where the memory is saved; with "full" this migration is a no-op. To
+switch modes later, downgrade this revision, change the variable and upgrade.
+Requires pgvector >= 0.7.
+
+Revision ID: 20251113_01
+Revises: 20251112_01
+Create Date: 2025-11-13
+"""
+
+import os
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = "20251113_01"
+down_revision = "20251112_01"
+branch_labels = None
+depends_on = None
+
+EMBEDDING_DIMENSIONS = 1536
+
+
+def _index_mode() -> str:
+    mode = os.getenv("RAG_VECTOR_INDEX_MODE", "full").lower()
+    if mode not in ("full", "halfvec", "binary"):
+        raise ValueError(f"Unsupported RAG_VECTOR_INDEX_MODE: {mode}")
+    return mode
+
+
+def upgrade() -> None:
+    """Build the quantized index for the configured mode."""
+    mode = _index_mode()
+    if mode == "halfvec":
+        op.execute(
+            f"""
+            CREATE INDEX IF NOT EXISTS idx_knowledge_items_embedding_halfvec_hnsw
+            ON knowledge_items
+            USING hnsw ((embedding::halfvec({EMBEDDING_DIMENSIONS})) halfvec_cosine_ops);
+            """
+        )
+    elif mode == "binary":
+        op.execute(
+            f"""
+            CREATE INDEX IF NOT EXISTS idx_knowledge_items_embedding_bit_hnsw
+            ON knowledge_items
+            USING hnsw ((binary_quantize(embedding)::bit({EMBEDDING_DIMENSIONS})) bit_hamming_ops);
+            """
+        )
+
+    if mode != "full":
+        op.execute("DROP INDEX IF EXISTS idx_knowledge_items_embedding_hnsw;")
+
+
+def downgrade() -> None:
+    """Restore the float32 HNSW index and drop the quantized ones."""
+    op.execute(
+        """
+        CREATE INDEX IF NOT EXISTS idx_knowledge_items_embedding_hnsw
+        ON knowledge_items
+        USING hnsw (embedding vector_cosine_ops);
+        """
+    )
+    op.execute("DROP INDEX IF EXISTS idx_knowledge_items_embedding_halfvec_hnsw;")
+    op.execute("DROP INDEX IF EXISTS idx_knowledge_items_embedding_bit_hnsw;")
@@ -2,15 +2,17 @@
 
 from __future__ import annotations
 
+import os
 from typing import Callable, List
+from uuid import UUID
 
 from fastapi import Depends, HTTPException, status
 from fastapi.security import OAuth2PasswordBearer
 from jose import JWTError
 
 from src.domain.models.document import IDocumentRepository
-from src.domain.models.knowledge import IKnowledgeRepository
-from src.domain.models.project import IProjectRepository
+from src.domain.models.knowledge import IKnowledgeRepository, VectorIndexMode
+from src.domain.models.project import IProjectRepository, Project
 from src.domain.models.task import ITaskRepository
 from src.domain.models.user import IUserRepository, User
 from src.infrastructure.database.repositories.document_repository import DocumentRepository
@@ -18,10 +20,16 @@ from src.infrastructure.database.repositories.knowledge_repository import Knowle
 from src.infrastructure.database.repositories.project_repository import ProjectRepository
 from src.infrastructure.database.repositories.task_repository import TaskRepository
 from src.infrastructure.database.repositories.user_repository import UserRepository
+from src.infrastructure.cache.connection import init_cache_service
+from src.infrastructure.cache.local_cache import LocalCache
+from src.infrastructure.cache.redis_cache import RedisCacheService
+from src.infrastructure.cache.semantic_query_cache import SemanticQueryCache
 from src.infrastructure.external.llm import ILLMProvider, ProviderFactory
 from src.infrastructure.external.crawler.crawler_client import WebCrawler
+from src.application.services.embedding_batcher import EmbeddingBatcher
 from src.application.services.text_chunker import TextChunker
-from src.application.services.text_extractor import TextExtractor
+from src.application.services.text_extractor import TextExtractor, get_process_pool
+from src.application.use_cases.knowledge.query_knowledge import CacheEntry
 from src.shared.infrastructure.database.connection import init_pool
 from src.shared.utils.security import verify_token
 from src.shared.config.settings import load_settings
@@ -29,21 +37,53 @@ from src.shared.config.settings import load_settings
 # OAuth2 scheme for token extraction
 oauth2_scheme = OAuth2PasswordBearer(tokenUrl="/api/v1/auth/token")
 
+# Process-wide index of recent query embeddings, shared across requests
+_semantic_query_cache: SemanticQueryCache | None = None
+
+# Process-wide tier of deserialized RAG query results, shared across requests
+_local_query_cache: LocalCache[str, CacheEntry] | None = None
+
+# Process-wide caches of the project and user rows read to authorize requests
+_project_cache: LocalCache[UUID, Project] | None = None
+_user_cache: LocalCache[str, User] | None = None
+
 
 async def get_user_repository() -> IUserRepository:
     """
     Dependency to get the user repository instance.
+
+    Active users are cached per process for CACHE_USERS_TTL seconds (0 disables).
     """
+    global _user_cache
     pool = await init_pool()
-    return UserRepository(pool)
+    settings = load_settings()
+    if settings.cache.user_cache_ttl <= 0:
+        return UserRepository(pool)
+    if _user_cache is None:
+        _user_cache = LocalCache(
+            max_entries=settings.cache.user_cache_max_entries,
+            ttl=settings.cache.user_cache_ttl,
+        )
+    return UserRepository(pool, cache=_user_cache)
 
 
 async def get_project_repository() -> IProjectRepository:
     """
     Dependency to get the project repository instance.
+
+    Projects are cached per process for CACHE_PROJECTS_TTL seconds (0 disables).
     """
+    global _project_cache
     pool = await init_pool()
-    return ProjectRepository()
+    settings = load_settings()
+    if settings.cache.project_cache_ttl <= 0:
+        return ProjectRepository()
+    if _project_cache is None:
+        _project_cache = LocalCache(
+            max_entries=settings.cache.project_cache_max_entries,
+            ttl=settings.cache.project_cache_ttl,
+        )
+    return ProjectRepository(cache=_project_cache)
 
 
 async def get_document_repository() -> IDocumentRepository:
@@ -67,14 +107,35 @@ async def get_knowledge_repository() -> IKnowledgeRepository:
     Dependency to get the knowledge repository instance.
     """
     pool = await init_pool()
-    return KnowledgeRepository(pool)
+    settings = load_settings()
+    return KnowledgeRepository(
+        pool,
+        exact_search_max_chunks=settings.rag.exact_search_max_chunks,
+        vector_index_mode=VectorIndexMode(settings.rag.vector_index_mode),
+        rescore_factor=settings.rag.vector_rescore_factor,
+        collect_candidates_scanned=settings.rag.collect_candidates_scanned,
+    )
 
 
 async def get_text_extractor() -> TextExtractor:
     """
-    Dependency to get the text extractor service.
+    Dependency to get the text extractor service with configured settings.
+
+    CPU-bound parsing runs in a shared process pool unless
+    EXTRACTION_PROCESS_POOL_ENABLED is false or only one worker would run
+    (a single worker process only adds pickling overhead over threads).
     """
-    return TextExtractor()
+    settings = load_settings()
+    workers = settings.file_upload.extraction_process_workers or os.cpu_count() or 1
+    executor = None
+    if settings.file_upload.extraction_process_pool_enabled and workers > 1:
+        executor = get_process_pool(workers)
+    return TextExtractor(
+        executor=executor,
+        pdf_pages_per_task=settings.file_upload.extraction_pdf_pages_per_task,
+        offload_min_bytes=settings.file_upload.extraction_offload_min_bytes,
+        max_workers=workers,
+    )
 
 
 async def get_text_chunker() -> TextChunker:
@@ -89,6 +150,65 @@ async def get_text_chunker() -> TextChunker:
     )
 
 
+async def get_embedding_batcher() -> EmbeddingBatcher:
+    """
+    Dependency to get the embedding batcher with configured request limits.
+    """
+    settings = load_settings()
+    return EmbeddingBatcher(
+        max_items=settings.llm.embedding_batch_max_items,
+        max_tokens=settings.llm.embedding_batch_max_tokens,
+    )
+
+
+async def get_cache_service() -> RedisCacheService | None:
+    """
+    Dependency to get the shared Redis cache service for RAG query results.
+
+    Returns None when RAG_CACHE_ENABLED is false.
+    """
+    settings = load_settings()
+    if not settings.rag.cache_enabled:
+        return None
+    return await init_cache_service()
+
+
+async def get_local_query_cache() -> LocalCache[str, CacheEntry] | None:
+    """
+    Dependency to get the process-wide in-process tier of RAG query results.
+
+    Returns None when RAG_CACHE_ENABLED or RAG_LOCAL_CACHE_ENABLED is false.
+    """
+    global _local_query_cache
+    settings = load_settings()
+    if not (settings.rag.cache_enabled and settings.rag.local_cache_enabled):
+        return None
+    if _local_query_cache is None:
+        _local_query_cache = LocalCache(
+            max_entries=settings.rag.local_cache_max_entries,
+            ttl=settings.rag.local_cache_ttl,
+            max_bytes=settings.rag.local_cache_max_bytes,
+        )
+    return _local_query_cache
+
+
+async def get_semantic_query_cache() -> SemanticQueryCache:
+    """
+    Dependency to get the process-wide semantic query cache.
+
+    Only consulted by the RAG use case when RAG_SEMANTIC_CACHE_ENABLED is set.
+    """
+    global _semantic_query_cache
+    if _semantic_query_cache is None:
+        settings = load_settings()
+        _semantic_query_cache = SemanticQueryCache(
+            threshold=settings.rag.semantic_cache_threshold,
+            max_entries=settings.rag.semantic_cache_max_entries,
+            ttl=settings.rag.cache_ttl,
+        )
+    return _semantic_query_cache
+
+
 async def get_web_crawler() -> WebCrawler:
     """
     Dependency to get the web crawler service with configured settings.
@@ -1,7 +1,10 @@
 from contextlib import asynccontextmanager
 import logging
-from fastapi import FastAPI
+from fastapi import Depends, FastAPI
 
+from src.api.dependencies import get_current_user
+from src.application.services.text_extractor import shutdown_process_pool
+from src.infrastructure.cache.connection import close_cache_service, init_cache_service
 from src.infrastructure.external.llm import ProviderFactory
 from src.shared.config.logging import configure_logging
 from src.shared.infrastructure.database.connection import init_pool, close_pool, ping
@@ -16,11 +19,14 @@ async def lifespan(_: FastAPI):
     Handles startup and shutdown tasks:
     - Initialize logging
     - Initialize database connection pool
+    - Initialize Redis cache connection pool
     - Initialize LLM providers (lazy initialization via factory)
+    - Start the text extraction process pool (lazily, on first upload)
     - Clean up resources on shutdown
     """
     configure_logging(logging.INFO)
     await init_pool()
+    await init_cache_service()
     
     # Note: LLM providers are initialized lazily via ProviderFactory
     # on first use. We just log that they're available.
@@ -31,7 +37,9 @@ async def lifespan(_: FastAPI):
     finally:
         # Close all provider instances and release resources
         await ProviderFactory.close_all()
+        await close_cache_service()
         await close_pool()
+        shutdown_process_pool()
 
 
 app = FastAPI(title="Contextiva API", docs_url="/api/docs", openapi_url="/api/openapi.json", lifespan=lifespan)
@@ -52,3 +60,12 @@ async def health() -> dict:
     return {"status": "ok", "db": "ok" if db_ok else "down"}
 
 
+@app.get("/api/v1/metrics/embeddings", dependencies=[Depends(get_current_user)])
+async def embedding_metrics() -> dict:
+    """Scheduler state per embedding provider and embedding cache hit rates."""
+    return {
+        "providers": ProviderFactory.embedding_metrics(),
+        "cache": ProviderFactory.embedding_cache_metrics(),
+    }
+
+
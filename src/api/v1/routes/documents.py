@@ -6,7 +6,7 @@ from uuid import UUID, uuid4
 
 from fastapi import APIRouter, Depends, HTTPException, Response, status
 
-from src.api.dependencies import get_current_user, get_document_repository
+from src.api.dependencies import get_cache_service, get_current_user, get_document_repository
 from src.api.v1.schemas.document import (
     DocumentCreate,
     DocumentListResponse,
@@ -16,6 +16,7 @@ from src.api.v1.schemas.document import (
 )
 from src.domain.models.document import Document, IDocumentRepository
 from src.domain.models.user import User
+from src.infrastructure.cache.redis_cache import RedisCacheService
 from src.shared.utils.versioning import bump_version
 
 router = APIRouter(prefix="/documents", tags=["Documents"])
@@ -197,6 +198,7 @@ async def delete_document(
     document_id: UUID,
     current_user: User = Depends(get_current_user),
     document_repo: IDocumentRepository = Depends(get_document_repository),
+    cache_service: RedisCacheService | None = Depends(get_cache_service),
 ) -> Response:
     """
     Delete a document (CASCADE deletes all linked knowledge items).
@@ -205,6 +207,7 @@ async def delete_document(
         document_id: Document identifier
         current_user: The authenticated user (from JWT token)
         document_repo: The document repository dependency
+        cache_service: RAG query cache invalidated for the document's project
         
     Returns:
         204 No Content
@@ -212,8 +215,11 @@ async def delete_document(
     Raises:
         HTTPException: 401 if unauthorized, 404 if document not found
     """
+    # Retrieve the document for its project before it is gone
+    document = await document_repo.get_by_id(document_id)
+    
     # Delete document
-    deleted = await document_repo.delete(document_id)
+    deleted = document is not None and await document_repo.delete(document_id)
     
     if not deleted:
         raise HTTPException(
@@ -221,6 +227,10 @@ async def delete_document(
             detail=f"Document {document_id} not found",
         )
     
+    # Cached answers may cite the deleted knowledge items
+    if cache_service:
+        await cache_service.bump_generation(document.project_id)
+    
     return Response(status_code=status.HTTP_204_NO_CONTENT)
 
 
@@ -15,8 +15,10 @@ from fastapi import (
 )
 
 from src.api.dependencies import (
+    get_cache_service,
     get_current_user,
     get_document_repository,
+    get_embedding_batcher,
     get_embedding_provider,
     get_knowledge_repository,
     get_text_chunker,
@@ -24,6 +26,7 @@ from src.api.dependencies import (
     get_web_crawler,
 )
 from src.api.v1.schemas.knowledge import KnowledgeCrawlRequest, KnowledgeUploadResponse
+from src.application.services.embedding_batcher import EmbeddingBatcher
 from src.application.services.text_chunker import TextChunker
 from src.application.services.text_extractor import TextExtractor
 from src.application.use_cases.ingest_knowledge import IngestKnowledgeUseCase
@@ -31,6 +34,7 @@ from src.application.use_cases.crawl_knowledge import CrawlKnowledgeUseCase
 from src.domain.models.document import IDocumentRepository
 from src.domain.models.knowledge import IKnowledgeRepository
 from src.domain.models.user import User
+from src.infrastructure.cache.redis_cache import RedisCacheService
 from src.infrastructure.external.crawler.crawler_client import WebCrawler
 from src.infrastructure.external.llm.providers.base import ILLMProvider
 from src.shared.config.settings import load_settings
@@ -52,6 +56,8 @@ async def upload_knowledge(
     text_extractor: TextExtractor = Depends(get_text_extractor),
     text_chunker: TextChunker = Depends(get_text_chunker),
     embedding_provider: ILLMProvider = Depends(get_embedding_provider),
+    embedding_batcher: EmbeddingBatcher = Depends(get_embedding_batcher),
+    cache_service: RedisCacheService | None = Depends(get_cache_service),
 ) -> KnowledgeUploadResponse:
     """
     Upload a file for knowledge ingestion and processing.
@@ -70,6 +76,8 @@ async def upload_knowledge(
         text_extractor: Text extraction service dependency
         text_chunker: Text chunking service dependency
         embedding_provider: Embedding provider dependency
+        embedding_batcher: Embedding request batching dependency
+        cache_service: RAG query cache invalidated once the knowledge is saved
 
     Returns:
         Upload response with document ID and processing status
@@ -117,6 +125,9 @@ async def upload_knowledge(
         text_extractor=text_extractor,
         text_chunker=text_chunker,
         llm_provider=embedding_provider,
+        embedding_batcher=embedding_batcher,
+        cache_service=cache_service,
+        max_pending_batches=settings.file_upload.ingest_max_pending_batches,
     )
 
     # Schedule background processing
@@ -154,6 +165,8 @@ async def crawl_knowledge(
     web_crawler: WebCrawler = Depends(get_web_crawler),
     text_chunker: TextChunker = Depends(get_text_chunker),
     embedding_provider: ILLMProvider = Depends(get_embedding_provider),
+    embedding_batcher: EmbeddingBatcher = Depends(get_embedding_batcher),
+    cache_service: RedisCacheService | None = Depends(get_cache_service),
 ) -> KnowledgeUploadResponse:
     """
     Crawl a web page for knowledge ingestion and processing.
@@ -171,6 +184,8 @@ async def crawl_knowledge(
         web_crawler: Web crawler service dependency
         text_chunker: Text chunking service dependency
         embedding_provider: Embedding provider dependency
+        embedding_batcher: Embedding request batching dependency
+        cache_service: RAG query cache invalidated once the knowledge is saved
 
     Returns:
         Upload response with document ID and processing status
@@ -189,6 +204,8 @@ async def crawl_knowledge(
         web_crawler=web_crawler,
         text_chunker=text_chunker,
         llm_provider=embedding_provider,
+        embedding_batcher=embedding_batcher,
+        cache_service=cache_service,
     )
 
     # Schedule background processing
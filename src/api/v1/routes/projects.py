@@ -7,10 +7,11 @@ from uuid import UUID
 
 from fastapi import APIRouter, Depends, HTTPException, Response, status
 
-from src.api.dependencies import get_current_user, get_project_repository
+from src.api.dependencies import get_cache_service, get_current_user, get_project_repository
 from src.api.v1.schemas.project import ProjectCreate, ProjectResponse, ProjectUpdate
 from src.domain.models.project import IProjectRepository, Project
 from src.domain.models.user import User
+from src.infrastructure.cache.redis_cache import RedisCacheService
 from src.shared.utils.errors import ProjectNotFoundError
 
 
@@ -189,6 +190,7 @@ async def delete_project(
     project_id: UUID,
     current_user: User = Depends(get_current_user),
     project_repo: IProjectRepository = Depends(get_project_repository),
+    cache_service: RedisCacheService | None = Depends(get_cache_service),
 ) -> Response:
     """
     Delete a project.
@@ -197,6 +199,7 @@ async def delete_project(
         project_id: The project UUID
         current_user: The authenticated user (from JWT token)
         project_repo: The project repository dependency
+        cache_service: RAG query cache invalidated for the project
         
     Returns:
         204 No Content on success
@@ -212,4 +215,7 @@ async def delete_project(
             detail=f"Project with id {project_id} not found",
         )
     
+    if cache_service:
+        await cache_service.bump_generation(project_id)
+    
     return Response(status_code=status.HTTP_204_NO_CONTENT)
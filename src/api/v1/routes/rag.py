@@ -1,34 +1,97 @@
 """RAG (Retrieval-Augmented Generation) API routes."""
 
+import json
+import logging
+from typing import Any, AsyncIterator, Optional
+
 from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi.responses import StreamingResponse
 
-from src.api.dependencies import get_current_user, get_knowledge_repository, get_project_repository
-from src.api.v1.schemas.rag import KnowledgeItemResult, RAGQueryRequest, RAGQueryResponse
-from src.application.use_cases.knowledge.query_knowledge import QueryKnowledgeUseCase
+from src.api.dependencies import (
+    get_cache_service,
+    get_current_user,
+    get_knowledge_repository,
+    get_local_query_cache,
+    get_project_repository,
+    get_semantic_query_cache,
+)
+from src.api.v1.schemas.rag import (
+    KnowledgeItemResult,
+    RAGBatchQueryRequest,
+    RAGBatchQueryResponse,
+    RAGQueryRequest,
+    RAGQueryResponse,
+)
+from src.application.use_cases.knowledge.query_knowledge import (
+    CacheEntry,
+    QueryKnowledgeResult,
+    QueryKnowledgeUseCase,
+)
 from src.domain.models.knowledge import IKnowledgeRepository
 from src.domain.models.project import IProjectRepository
 from src.domain.models.user import User
+from src.infrastructure.cache.local_cache import LocalCache
+from src.infrastructure.cache.redis_cache import RedisCacheService
+from src.infrastructure.cache.semantic_query_cache import SemanticQueryCache
 from src.shared.config.settings import load_settings
 from src.shared.utils.errors import ProjectNotFoundError, UnauthorizedAccessError
 
+logger = logging.getLogger(__name__)
+
 router = APIRouter(prefix="/rag", tags=["RAG"])
 
 
+def _to_response(result: QueryKnowledgeResult) -> RAGQueryResponse:
+    """Map a domain query result to the API response."""
+    return RAGQueryResponse(
+        results=[
+            KnowledgeItemResult(
+                id=item.id,
+                chunk_text=item.chunk_text,
+                similarity_score=similarity_score,
+                bm25_score=bm25_score,
+                rerank_score=rerank_score,
+                metadata=item.metadata,
+                document_id=item.document_id,
+            )
+            for item, similarity_score, bm25_score, rerank_score in result.results
+        ],
+        query_id=result.query_id,
+        total_results=result.total_results,
+        synthesized_answer=result.synthesized_answer,
+        candidates_scanned=result.candidates_scanned,
+        search_plan=result.search_plan,
+        search_duration_ms=result.search_duration_ms,
+    )
+
+
+def _sse_event(event: str, data: dict[str, Any]) -> str:
+    """Format one server-sent event with a JSON payload."""
+    return f"event: {event}\ndata: {json.dumps(data)}\n\n"
+
+
 @router.post("/query", response_model=RAGQueryResponse, status_code=status.HTTP_200_OK)
 async def query_knowledge(
     request: RAGQueryRequest,
     current_user: User = Depends(get_current_user),
     knowledge_repo: IKnowledgeRepository = Depends(get_knowledge_repository),
     project_repo: IProjectRepository = Depends(get_project_repository),
+    cache_service: Optional[RedisCacheService] = Depends(get_cache_service),
+    local_cache: Optional[LocalCache[str, CacheEntry]] = Depends(get_local_query_cache),
+    semantic_cache: SemanticQueryCache = Depends(get_semantic_query_cache),
 ) -> RAGQueryResponse:
     """Query knowledge items using RAG (vector similarity search with optional hybrid/re-ranking).
     
     Args:
         request: RAG query request containing project_id, query_text, optional top_k,
-                 use_hybrid_search, and use_re_ranking flags.
+                 use_hybrid_search, and use_re_ranking flags, and optional HNSW
+                 search effort (ef_search, iterative_scan, max_scan_tuples).
         current_user: Authenticated user making the request.
         knowledge_repo: Knowledge repository dependency.
         project_repo: Project repository dependency.
+        cache_service: Query result cache dependency (None when caching is disabled).
+        local_cache: In-process query result cache dependency (None when disabled).
+        semantic_cache: Near-duplicate query cache dependency.
         
     Returns:
         RAGQueryResponse containing matched knowledge items with scores.
@@ -45,7 +108,9 @@ async def query_knowledge(
             knowledge_repo=knowledge_repo,
             project_repo=project_repo,
             settings=settings,
-            cache_service=None,  # TODO: Initialize Redis cache service from dependency
+            cache_service=cache_service,
+            local_cache=local_cache,
+            semantic_cache=semantic_cache,
         )
         
         result = await use_case.execute(
@@ -56,25 +121,89 @@ async def query_knowledge(
             use_hybrid_search=request.use_hybrid_search,
             use_re_ranking=request.use_re_ranking,
             use_agentic_rag=request.use_agentic_rag,
+            ef_search=request.ef_search,
+            iterative_scan=request.iterative_scan,
+            max_scan_tuples=request.max_scan_tuples,
         )
         
         # Map domain result to API response
-        return RAGQueryResponse(
-            results=[
-                KnowledgeItemResult(
-                    id=item.id,
-                    chunk_text=item.chunk_text,
-                    similarity_score=similarity_score,
-                    bm25_score=bm25_score,
-                    rerank_score=rerank_score,
-                    metadata=item.metadata,
-                    document_id=item.document_id,
-                )
-                for item, similarity_score, bm25_score, rerank_score in result.results
-            ],
-            query_id=result.query_id,
-            total_results=result.total_results,
-            synthesized_answer=result.synthesized_answer,
+        return _to_response(result)
+    except ProjectNotFoundError as e:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=str(e),
+        )
+    except UnauthorizedAccessError as e:
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail=str(e),
+        )
+    except ValueError as e:
+        raise HTTPException(
+            status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
+            detail=str(e),
+        )
+
+
+@router.post("/query/batch", response_model=RAGBatchQueryResponse, status_code=status.HTTP_200_OK)
+async def query_knowledge_batch(
+    request: RAGBatchQueryRequest,
+    current_user: User = Depends(get_current_user),
+    knowledge_repo: IKnowledgeRepository = Depends(get_knowledge_repository),
+    project_repo: IProjectRepository = Depends(get_project_repository),
+    cache_service: Optional[RedisCacheService] = Depends(get_cache_service),
+    local_cache: Optional[LocalCache[str, CacheEntry]] = Depends(get_local_query_cache),
+    semantic_cache: SemanticQueryCache = Depends(get_semantic_query_cache),
+) -> RAGBatchQueryResponse:
+    """Run several RAG queries against one project in a single request.
+    
+    The project is authorized once, the queries are embedded in one provider call
+    and the searches run concurrently (bounded by RAG_BATCH_MAX_CONCURRENCY and
+    by POSTGRES_POOL_MAX_SIZE - 1).
+    
+    Args:
+        request: Batch query request containing project_id, the queries and the
+                 same options as the single query endpoint.
+        current_user: Authenticated user making the request.
+        knowledge_repo: Knowledge repository dependency.
+        project_repo: Project repository dependency.
+        cache_service: Query result cache dependency (None when caching is disabled).
+        local_cache: In-process query result cache dependency (None when disabled).
+        semantic_cache: Near-duplicate query cache dependency.
+        
+    Returns:
+        RAGBatchQueryResponse with one response per query, in request order.
+        
+    Raises:
+        HTTPException: 404 if project not found, 403 if unauthorized, 422 if validation
+                       fails or the batch exceeds RAG_BATCH_MAX_QUERIES.
+    """
+    try:
+        use_case = QueryKnowledgeUseCase(
+            knowledge_repo=knowledge_repo,
+            project_repo=project_repo,
+            settings=load_settings(),
+            cache_service=cache_service,
+            local_cache=local_cache,
+            semantic_cache=semantic_cache,
+        )
+
+        results = await use_case.execute_batch(
+            project_id=request.project_id,
+            query_texts=request.queries,
+            user_id=current_user.id,
+            top_k=request.top_k,
+            use_hybrid_search=request.use_hybrid_search,
+            use_re_ranking=request.use_re_ranking,
+            use_agentic_rag=request.use_agentic_rag,
+            ef_search=request.ef_search,
+            iterative_scan=request.iterative_scan,
+            max_scan_tuples=request.max_scan_tuples,
+        )
+
+        return RAGBatchQueryResponse(
+            responses=[_to_response(result) for result in results],
+            total_queries=len(results),
         )
     except ProjectNotFoundError as e:
         raise HTTPException(
@@ -91,3 +220,107 @@ async def query_knowledge(
             status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
             detail=str(e),
         )
+
+
+@router.post(
+    "/query/stream",
+    response_class=StreamingResponse,
+    status_code=status.HTTP_200_OK,
+    responses={200: {"content": {"text/event-stream": {}}}},
+)
+async def query_knowledge_stream(
+    request: RAGQueryRequest,
+    current_user: User = Depends(get_current_user),
+    knowledge_repo: IKnowledgeRepository = Depends(get_knowledge_repository),
+    project_repo: IProjectRepository = Depends(get_project_repository),
+    cache_service: Optional[RedisCacheService] = Depends(get_cache_service),
+    local_cache: Optional[LocalCache[str, CacheEntry]] = Depends(get_local_query_cache),
+    semantic_cache: SemanticQueryCache = Depends(get_semantic_query_cache),
+) -> StreamingResponse:
+    """Query knowledge items and stream the synthesized answer as server-sent events.
+    
+    Retrieval runs before the stream opens, so authorization and validation errors
+    are returned as regular HTTP errors. The stream then carries these events:
+    
+    - ``results``: the retrieved chunks, shaped like the /rag/query response
+      (without ``synthesized_answer``).
+    - ``token``: ``{"text": ...}`` for each piece of the answer as the LLM produces
+      it (only when agentic RAG is enabled).
+    - ``done``: ``{"query_id": ..., "synthesized_answer": ...}`` with the full answer.
+    - ``error``: ``{"detail": ...}`` if synthesis fails mid-stream; the stream ends
+      after it.
+    
+    Args:
+        request: RAG query request, identical to the /rag/query body.
+        current_user: Authenticated user making the request.
+        knowledge_repo: Knowledge repository dependency.
+        project_repo: Project repository dependency.
+        cache_service: Query result cache dependency (None when caching is disabled).
+        local_cache: In-process query result cache dependency (None when disabled).
+        semantic_cache: Near-duplicate query cache dependency.
+        
+    Returns:
+        StreamingResponse with media type text/event-stream.
+        
+    Raises:
+        HTTPException: 404 if project not found, 403 if unauthorized, 422 if validation fails.
+    """
+    try:
+        use_case = QueryKnowledgeUseCase(
+            knowledge_repo=knowledge_repo,
+            project_repo=project_repo,
+            settings=load_settings(),
+            cache_service=cache_service,
+            local_cache=local_cache,
+            semantic_cache=semantic_cache,
+        )
+
+        result, tokens = await use_case.execute_stream(
+            project_id=request.project_id,
+            query_text=request.query_text,
+            user_id=current_user.id,
+            top_k=request.top_k,
+            use_hybrid_search=request.use_hybrid_search,
+            use_re_ranking=request.use_re_ranking,
+            use_agentic_rag=request.use_agentic_rag,
+            ef_search=request.ef_search,
+            iterative_scan=request.iterative_scan,
+            max_scan_tuples=request.max_scan_tuples,
+        )
+    except ProjectNotFoundError as e:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=str(e),
+        )
+    except UnauthorizedAccessError as e:
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail=str(e),
+        )
+    except ValueError as e:
+        raise HTTPException(
+            status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
+            detail=str(e),
+        )
+
+    async def events(tokens: Optional[AsyncIterator[str]]) -> AsyncIterator[str]:
+        yield _sse_event("results", _to_response(result).model_dump(mode="json"))
+        if tokens is not None:
+            try:
+                async for token in tokens:
+                    yield _sse_event("token", {"text": token})
+            except Exception as e:
+                logger.error(f"Streaming synthesis failed for query {result.query_id}: {e}")
+                yield _sse_event("error", {"detail": "Answer synthesis failed"})
+                return
+        yield _sse_event(
+            "done",
+            {"query_id": str(result.query_id), "synthesized_answer": result.synthesized_answer},
+        )
+
+    return StreamingResponse(
+        events(tokens),
+        media_type="text/event-stream",
+        # Disable proxy buffering so tokens reach the client as they are produced
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
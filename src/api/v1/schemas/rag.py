@@ -1,6 +1,6 @@
 """Pydantic schemas for RAG (Retrieval-Augmented Generation) endpoints."""
 
-from typing import Any, Optional
+from typing import Annotated, Any, Literal, Optional
 from uuid import UUID
 
 from pydantic import BaseModel, Field
@@ -15,6 +15,9 @@ class RAGQueryRequest(BaseModel):
         top_k: Optional number of results to return (uses settings default if not provided).
         use_hybrid_search: Optional flag to enable hybrid vector + keyword search.
         use_re_ranking: Optional flag to enable LLM-based re-ranking of results.
+        ef_search: Optional HNSW candidate list size (uses settings default if not provided).
+        iterative_scan: Optional HNSW iterative scan mode (uses settings default if not provided).
+        max_scan_tuples: Optional iterative scan tuple limit (uses settings default if not provided).
     """
 
     project_id: UUID = Field(..., description="UUID of the project to query against")
@@ -41,6 +44,21 @@ class RAGQueryRequest(BaseModel):
         False,
         description="Enable agentic RAG to generate a synthesized natural language answer"
     )
+    ef_search: Optional[int] = Field(
+        None,
+        description="HNSW candidate list size; higher improves recall at the cost of latency",
+        ge=1,
+        le=1000
+    )
+    iterative_scan: Optional[Literal["off", "strict_order", "relaxed_order"]] = Field(
+        None,
+        description="HNSW iterative scan mode, keeps scanning when the project filter removes candidates"
+    )
+    max_scan_tuples: Optional[int] = Field(
+        None,
+        description="Maximum tuples an iterative HNSW scan may visit",
+        gt=0
+    )
 
 
 class KnowledgeItemResult(BaseModel):
@@ -86,6 +104,9 @@ class RAGQueryResponse(BaseModel):
         results: List of matching knowledge items ordered by similarity.
         query_id: UUID identifier for this query (for tracking/debugging).
         total_results: Total number of results returned.
+        candidates_scanned: Number of knowledge item rows visited by the search.
+        search_plan: How the search ran: "exact" scan or "ann" (HNSW index).
+        search_duration_ms: Round-trip time of the search query in milliseconds.
     """
 
     results: list[KnowledgeItemResult] = Field(
@@ -105,3 +126,96 @@ class RAGQueryResponse(BaseModel):
         None,
         description="Optional synthesized natural language answer (when use_agentic_rag=true)"
     )
+    candidates_scanned: Optional[int] = Field(
+        None,
+        description=(
+            "Number of knowledge item rows visited by the search (null when served "
+            "from cache or when RAG_COLLECT_CANDIDATES_SCANNED is off, the default)"
+        ),
+        ge=0
+    )
+    search_plan: Optional[Literal["exact", "ann"]] = Field(
+        None,
+        description="How the search ran: exact scan or HNSW index (null when served from cache)"
+    )
+    search_duration_ms: Optional[float] = Field(
+        None,
+        description="Round-trip time of the search query in milliseconds (null when served from cache)",
+        ge=0.0
+    )
+
+
+class RAGBatchQueryRequest(BaseModel):
+    """Request schema for the batch RAG query endpoint.
+    
+    All queries run against the same project with the same options.
+    
+    Attributes:
+        project_id: UUID of the project to query against.
+        queries: The text queries to search for (each 1-10000 characters).
+        top_k: Optional number of results per query (uses settings default if not provided).
+        use_hybrid_search: Optional flag to enable hybrid vector + keyword search.
+        use_re_ranking: Optional flag to enable LLM-based re-ranking of results.
+        use_agentic_rag: Optional flag to synthesize an answer per query.
+        ef_search: Optional HNSW candidate list size (uses settings default if not provided).
+        iterative_scan: Optional HNSW iterative scan mode (uses settings default if not provided).
+        max_scan_tuples: Optional iterative scan tuple limit (uses settings default if not provided).
+    """
+
+    project_id: UUID = Field(..., description="UUID of the project to query against")
+    queries: list[Annotated[str, Field(min_length=1, max_length=10000)]] = Field(
+        ...,
+        min_length=1,
+        description="The text queries to search for, answered in the same order"
+    )
+    top_k: Optional[int] = Field(
+        None,
+        description="Number of results per query (uses settings default if not provided)",
+        gt=0
+    )
+    use_hybrid_search: bool = Field(
+        False,
+        description="Enable hybrid search combining vector and keyword (BM25) search"
+    )
+    use_re_ranking: bool = Field(
+        False,
+        description="Enable LLM-based re-ranking of search results"
+    )
+    use_agentic_rag: bool = Field(
+        False,
+        description="Enable agentic RAG to generate a synthesized answer per query"
+    )
+    ef_search: Optional[int] = Field(
+        None,
+        description="HNSW candidate list size; higher improves recall at the cost of latency",
+        ge=1,
+        le=1000
+    )
+    iterative_scan: Optional[Literal["off", "strict_order", "relaxed_order"]] = Field(
+        None,
+        description="HNSW iterative scan mode, keeps scanning when the project filter removes candidates"
+    )
+    max_scan_tuples: Optional[int] = Field(
+        None,
+        description="Maximum tuples an iterative HNSW scan may visit",
+        gt=0
+    )
+
+
+class RAGBatchQueryResponse(BaseModel):
+    """Response schema for the batch RAG query endpoint.
+    
+    Attributes:
+        responses: One query response per request query, in request order.
+        total_queries: Number of queries answered.
+    """
+
+    responses: list[RAGQueryResponse] = Field(
+        ...,
+        description="One query response per request query, in request order"
+    )
+    total_queries: int = Field(
+        ...,
+        description="Number of queries answered",
+        ge=0
+    )
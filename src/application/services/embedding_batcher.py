@@ -0,0 +1,136 @@
+"""Service for embedding many texts with as few provider requests as possible."""
+
+import asyncio
+import logging
+from typing import AsyncIterable, AsyncIterator, Callable, TypeVar
+
+from src.infrastructure.external.llm.providers.base import ILLMProvider
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+
+class EmbeddingBatcher:
+    """Service for splitting texts into provider-sized embedding batches.
+
+    Embedding providers cap both the number of inputs and the total tokens of a
+    single request. Texts are packed greedily, in order, into batches that stay
+    under both limits, and each batch is sent with one ``embed_texts`` call.
+    Batches are submitted together; the provider from ``ProviderFactory`` skips
+    cached texts and sits on an ``EmbeddingScheduler`` that bounds how many run
+    at once and retries those that are rate limited.
+    """
+
+    def __init__(
+        self,
+        max_items: int = 256,
+        max_tokens: int = 100_000,
+    ):
+        """
+        Initialize the embedding batcher.
+
+        Args:
+            max_items: Maximum number of texts per request
+            max_tokens: Maximum estimated tokens per request (1 token ≈ 4 characters)
+        """
+        self.max_items = max(1, max_items)
+        self.max_tokens = max(1, max_tokens)
+
+    @staticmethod
+    def estimate_tokens(text: str) -> int:
+        """
+        Estimate the token count of a text.
+
+        Args:
+            text: Text to measure
+
+        Returns:
+            Approximate number of tokens (rough: 1 token ≈ 4 characters)
+        """
+        return max(1, len(text) // 4)
+
+    def split(self, texts: list[str]) -> list[list[str]]:
+        """
+        Split texts into batches that respect the item and token limits.
+
+        A single text larger than ``max_tokens`` is sent in a batch of its own.
+
+        Args:
+            texts: Texts to batch, in order
+
+        Returns:
+            Batches of texts; concatenated they equal ``texts``
+        """
+        batches: list[list[str]] = []
+        current: list[str] = []
+        current_tokens = 0
+
+        for text in texts:
+            tokens = self.estimate_tokens(text)
+            if current and self._is_full(len(current), current_tokens, tokens):
+                batches.append(current)
+                current = []
+                current_tokens = 0
+            current.append(text)
+            current_tokens += tokens
+
+        if current:
+            batches.append(current)
+        return batches
+
+    async def iter_batches(
+        self, items: AsyncIterable[T], text_of: Callable[[T], str]
+    ) -> AsyncIterator[list[T]]:
+        """
+        Group a stream of items into batches that respect the item and token limits.
+
+        Batches match ``split`` on the items' texts, but each is yielded as
+        soon as it is full, so only one batch is held at a time.
+
+        Args:
+            items: Items to batch, in order
+            text_of: Returns the text an item is embedded by
+
+        Yields:
+            Batches of items
+        """
+        current: list[T] = []
+        current_tokens = 0
+
+        async for item in items:
+            tokens = self.estimate_tokens(text_of(item))
+            if current and self._is_full(len(current), current_tokens, tokens):
+                yield current
+                current = []
+                current_tokens = 0
+            current.append(item)
+            current_tokens += tokens
+
+        if current:
+            yield current
+
+    def _is_full(self, count: int, tokens: int, next_tokens: int) -> bool:
+        """Whether a batch of ``count`` texts and ``tokens`` tokens cannot take another text."""
+        return count >= self.max_items or tokens + next_tokens > self.max_tokens
+
+    async def embed(self, provider: ILLMProvider, texts: list[str]) -> list[list[float]]:
+        """
+        Embed texts with one provider request per batch.
+
+        Args:
+            provider: Embedding provider
+            texts: Texts to embed
+
+        Returns:
+            One embedding per text, in input order
+
+        Raises:
+            Same errors as ``ILLMProvider.embed_texts``
+        """
+        batches = self.split(texts)
+        results = await asyncio.gather(*(provider.embed_texts(batch) for batch in batches))
+        embeddings = [embedding for batch in results for embedding in batch]
+
+        logger.debug(f"Embedded {len(texts)} texts in {len(batches)} requests")
+        return embeddings
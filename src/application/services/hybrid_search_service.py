@@ -19,17 +19,19 @@ class HybridSearchService:
         keyword_results: list[tuple[KnowledgeItem, float]],
         weight_vector: float,
         weight_bm25: float,
+        k: int = 60,
     ) -> list[tuple[KnowledgeItem, float]]:
         """Merge vector and keyword search results using Reciprocal Rank Fusion.
         
         Uses the RRF algorithm with configurable weights:
-        score = weight_vector * (1 / (rank_vector + 60)) + weight_bm25 * (1 / (rank_bm25 + 60))
+        score = weight_vector * (1 / (rank_vector + k)) + weight_bm25 * (1 / (rank_bm25 + k))
         
         Args:
             vector_results: List of (KnowledgeItem, similarity_score) from vector search
             keyword_results: List of (KnowledgeItem, bm25_score) from keyword search
             weight_vector: Weight for vector search results (typically 0.7)
             weight_bm25: Weight for keyword search results (typically 0.3)
+            k: RRF smoothing constant (60 is the standard value)
             
         Returns:
             Merged list of (KnowledgeItem, combined_score) sorted by score (descending)
@@ -52,7 +54,6 @@ class HybridSearchService:
 
         # Calculate RRF scores
         rrf_scores: dict[UUID, float] = {}
-        k = 60  # Standard RRF constant
 
         for item_id in items_by_id:
             score = 0.0
@@ -1,7 +1,7 @@
 """Synthesis service for generating natural language answers from retrieved chunks."""
 
 import logging
-from typing import Optional
+from typing import AsyncIterator, Optional
 
 from src.domain.models.knowledge import KnowledgeItem
 from src.infrastructure.external.llm.providers.base import ILLMProvider
@@ -61,6 +61,48 @@ class SynthesisService:
             logger.warning(f"Failed to synthesize answer: {e}")
             return None
 
+    async def synthesize_stream(
+        self,
+        query: str,
+        chunks: list[KnowledgeItem],
+        llm_provider: ILLMProvider,
+        settings: RAGSettings,
+    ) -> AsyncIterator[str]:
+        """Stream a synthesized answer token by token as the LLM generates it.
+        
+        Uses the same prompt and settings as ``synthesize``. Unlike ``synthesize``,
+        provider errors are not swallowed: by the time one occurs, part of the
+        answer may already have been sent, so the caller decides how to signal it.
+        
+        Args:
+            query: The original user query/question.
+            chunks: List of retrieved KnowledgeItem objects containing relevant context.
+            llm_provider: The LLM provider to use for synthesis.
+            settings: RAG settings containing synthesis configuration.
+            
+        Yields:
+            Non-empty chunks of the answer text. Nothing is yielded when no chunks
+            are provided.
+        
+        Raises:
+            LLMProviderError: If the provider fails before or during streaming.
+        """
+        if not chunks:
+            logger.warning("No chunks provided for synthesis")
+            return
+
+        messages = self._build_synthesis_prompt(query, chunks, settings)
+        async for token in llm_provider.generate_completion_stream(
+            messages=messages,
+            model=settings.agentic_rag_model,
+            max_tokens=settings.agentic_rag_max_tokens,
+            temperature=settings.agentic_rag_temperature,
+        ):
+            if token:
+                yield token
+
+        logger.info(f"Finished streaming synthesized answer for query: {query[:50]}...")
+
     def _build_synthesis_prompt(
         self,
         query: str,
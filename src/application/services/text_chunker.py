@@ -1,6 +1,6 @@
 """Text chunking service for breaking text into semantic segments."""
 import re
-from typing import Any
+from typing import Any, AsyncIterable, AsyncIterator
 
 
 class TextChunk:
@@ -69,42 +69,78 @@ class TextChunker:
         if not text or not text.strip():
             return []
 
-        chunks: list[TextChunk] = []
+        return [chunk async for chunk in self.iter_chunks(_single(text))]
+
+    async def iter_chunks(self, fragments: AsyncIterable[str]) -> AsyncIterator[TextChunk]:
+        """
+        Chunk a text that arrives in fragments, yielding each chunk once it is complete.
+
+        Produces the same chunks as ``semantic_chunk`` on the concatenated
+        fragments, with positions relative to that concatenation, but keeps
+        only about one chunk of text buffered.
+
+        Args:
+            fragments: Pieces of the text, in order
+
+        Yields:
+            TextChunk objects with metadata
+        """
+        fragment_iter = fragments.__aiter__()
+        exhausted = False
+        buffer = ""
+        base = 0  # position of buffer[0] in the whole text
         chunk_index = 0
+        last_start: int | None = None
         start_pos = 0
 
-        while start_pos < len(text):
+        while True:
+            # Read until this chunk's window is complete or the text ends
+            while not exhausted and base + len(buffer) <= start_pos + self.chunk_size_chars:
+                try:
+                    buffer += await fragment_iter.__anext__()
+                except StopAsyncIteration:
+                    exhausted = True
+            text_end = base + len(buffer)
+            if start_pos >= text_end:
+                break
+
             # Calculate end position for this chunk
-            end_pos = min(start_pos + self.chunk_size_chars, len(text))
+            end_pos = min(start_pos + self.chunk_size_chars, text_end)
 
             # If preserving sentences and not at end, adjust to sentence boundary
-            if self.preserve_sentences and end_pos < len(text):
-                end_pos = self._find_sentence_boundary(text, start_pos, end_pos)
+            if self.preserve_sentences and end_pos < text_end:
+                end_pos = base + self._find_sentence_boundary(
+                    buffer, start_pos - base, end_pos - base
+                )
 
             # Extract chunk text
-            chunk_text = text[start_pos:end_pos].strip()
+            chunk_text = buffer[start_pos - base : end_pos - base].strip()
 
             if chunk_text:
                 # Estimate token count (rough: 1 token ≈ 4 characters)
                 token_count = len(chunk_text) // 4
 
-                chunk = TextChunk(
+                yield TextChunk(
                     text=chunk_text,
                     chunk_index=chunk_index,
                     start_char=start_pos,
                     end_char=end_pos,
                     token_count=token_count,
                 )
-                chunks.append(chunk)
+                last_start = start_pos
                 chunk_index += 1
 
             # Move start position forward, with overlap
             start_pos = end_pos - self.overlap_chars
-            if start_pos <= chunks[-1].start_char if chunks else 0:
+            if last_start is not None and start_pos <= last_start:
                 # Avoid infinite loop - move forward at least a bit
                 start_pos = end_pos
 
-        return chunks
+            # Drop text no later chunk can reach, once it is most of the buffer
+            consumed = start_pos - self.overlap_chars - base
+            if consumed > len(buffer) // 2:
+                buffer = buffer[consumed:]
+                base += consumed
 
     def _find_sentence_boundary(self, text: str, start: int, ideal_end: int) -> int:
         """
@@ -132,3 +168,7 @@ class TextChunker:
 
         # If no sentence boundary found, return ideal end
         return ideal_end
+
+
+async def _single(text: str) -> AsyncIterator[str]:
+    yield text
@@ -1,7 +1,13 @@
 """Text extraction service for multiple file formats."""
 import asyncio
+import multiprocessing
+import os
+from collections import deque
+from concurrent.futures import Executor, ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from io import BytesIO
 from pathlib import Path
-from typing import BinaryIO
+from typing import Any, AsyncIterator, BinaryIO, Callable, Optional, TypeVar
 
 from bs4 import BeautifulSoup
 from docx import Document
@@ -9,10 +15,127 @@ from pypdf import PdfReader
 
 from src.shared.utils.errors import TextExtractionError
 
+T = TypeVar("T")
+
+# Process-wide pool for CPU-bound parsing, shared across requests
+_process_pool: Optional[ProcessPoolExecutor] = None
+
+
+def get_process_pool(max_workers: Optional[int] = None) -> ProcessPoolExecutor:
+    """Get the shared extraction process pool, creating it on first use.
+
+    Workers are spawned rather than forked, so they do not inherit the API
+    worker's event loop, threads or open connections.
+
+    Args:
+        max_workers: Number of worker processes; None uses the CPU count
+
+    Returns:
+        The shared ProcessPoolExecutor
+    """
+    global _process_pool
+    if _process_pool is None:
+        _process_pool = ProcessPoolExecutor(
+            max_workers=max_workers, mp_context=multiprocessing.get_context("spawn")
+        )
+    return _process_pool
+
+
+def shutdown_process_pool() -> None:
+    """Shut down the shared extraction process pool, if it was started."""
+    global _process_pool
+    if _process_pool is not None:
+        _process_pool.shutdown(cancel_futures=True)
+        _process_pool = None
+
+
+def _discard_broken_pool(executor: Executor) -> None:
+    """Drop a pool broken by a crashed worker so the next caller starts a new one."""
+    global _process_pool
+    if executor is _process_pool:
+        _process_pool = None
+    executor.shutdown(wait=False, cancel_futures=True)
+
+
+# Parsing functions live at module level so they can run in worker processes
+
+
+def _count_pdf_pages(file_content: bytes) -> int:
+    return len(PdfReader(BytesIO(file_content)).pages)
+
+
+def _extract_pdf_pages(file_content: bytes, start: int = 0, stop: Optional[int] = None) -> list[str]:
+    reader = PdfReader(BytesIO(file_content))
+    pages = reader.pages[start:stop]
+    return [text for text in (page.extract_text() for page in pages) if text]
+
+
+def _extract_docx_text(file_content: bytes) -> str:
+    doc = Document(BytesIO(file_content))
+    text_parts = []
+
+    # Extract text from paragraphs
+    for paragraph in doc.paragraphs:
+        if paragraph.text.strip():
+            text_parts.append(paragraph.text)
+
+    # Extract text from tables
+    for table in doc.tables:
+        for row in table.rows:
+            row_text = " | ".join(cell.text.strip() for cell in row.cells)
+            if row_text.strip():
+                text_parts.append(row_text)
+
+    return "\n\n".join(text_parts)
+
+
+def _extract_html_text(file_content: bytes) -> str:
+    html_content = file_content.decode("utf-8")
+    soup = BeautifulSoup(html_content, "html.parser")
+
+    # Remove script and style elements
+    for script in soup(["script", "style"]):
+        script.decompose()
+
+    # Get text
+    text = soup.get_text()
+
+    # Clean up whitespace
+    lines = (line.strip() for line in text.splitlines())
+    chunks = (phrase.strip() for line in lines for phrase in line.split("  "))
+    return "\n".join(chunk for chunk in chunks if chunk)
+
 
 class TextExtractor:
     """Service for extracting text from various file formats."""
 
+    def __init__(
+        self,
+        executor: Optional[Executor] = None,
+        pdf_pages_per_task: int = 25,
+        offload_min_bytes: int = 256 * 1024,
+        max_workers: Optional[int] = None,
+    ):
+        """
+        Initialize the text extractor.
+
+        Args:
+            executor: Executor for CPU-bound parsing, typically ``get_process_pool()``
+                so pure-Python parsers do not hold the API worker's GIL. None
+                parses in the event loop's default thread pool.
+            pdf_pages_per_task: PDFs are split into ranges of this many pages,
+                extracted in parallel in ``executor``
+            offload_min_bytes: DOCX and HTML files of at least this size are
+                parsed in ``executor``; smaller ones in the default thread pool
+            max_workers: Number of workers in ``executor``, which bounds the PDF
+                page ranges extracted ahead of the consumer; None uses the CPU
+                count, matching ``get_process_pool()``
+        """
+        self.executor = executor
+        self.pdf_pages_per_task = max(1, pdf_pages_per_task)
+        self.offload_min_bytes = offload_min_bytes
+        self.max_workers = max(1, max_workers or os.cpu_count() or 1)
+
     async def extract(self, file_content: bytes, filename: str) -> str:
         """
         Extract text from file based on file extension.
@@ -45,6 +168,36 @@ class TextExtractor:
                 raise
             raise TextExtractionError(f"Failed to extract text from {filename}: {str(e)}")
 
+    async def iter_text(self, file_content: bytes, filename: str) -> AsyncIterator[str]:
+        """
+        Extract text from a file piece by piece.
+
+        The pieces concatenate to the result of ``extract``. PDFs are yielded
+        as their page ranges are extracted, so the whole text is never held at
+        once; other formats are yielded in one piece.
+
+        Args:
+            file_content: File content as bytes
+            filename: Name of the file with extension
+
+        Yields:
+            Consecutive pieces of the extracted text
+
+        Raises:
+            TextExtractionError: If extraction fails or format is unsupported
+        """
+        if Path(filename).suffix.lower() != ".pdf":
+            yield await self.extract(file_content, filename)
+            return
+
+        separator = ""
+        try:
+            async for page_text in self._iter_pdf_pages(file_content):
+                yield separator + page_text
+                separator = "\n\n"
+        except Exception as e:
+            raise TextExtractionError(f"Failed to extract text from PDF: {str(e)}")
+
     async def extract_markdown(self, file_content: bytes) -> str:
         """
         Extract text from Markdown file.
@@ -71,27 +224,44 @@ class TextExtractor:
             TextExtractionError: If PDF is corrupted or cannot be read
         """
         try:
-            # Run CPU-intensive PDF parsing in thread pool
-            loop = asyncio.get_event_loop()
-            text = await loop.run_in_executor(None, self._extract_pdf_sync, file_content)
-            return text
+            if self.executor is None:
+                # Threads share the GIL, so splitting into page ranges would not help
+                return await self._run(None, self._extract_pdf_sync, file_content)
+
+            # Run CPU-intensive PDF parsing in the pool, one task per page range
+            return "\n\n".join([text async for text in self._iter_pdf_pages(file_content)])
         except Exception as e:
             raise TextExtractionError(f"Failed to extract text from PDF: {str(e)}")
 
-    def _extract_pdf_sync(self, file_content: bytes) -> str:
-        """Synchronous PDF extraction (run in thread pool)."""
-        from io import BytesIO
-
-        pdf_file = BytesIO(file_content)
-        reader = PdfReader(pdf_file)
-        text_parts = []
+    async def _iter_pdf_pages(self, file_content: bytes) -> AsyncIterator[str]:
+        """Yield the non-empty page texts of a PDF in order, extracting page ranges in ``executor``."""
+        page_count = await self._run(self.executor, _count_pdf_pages, file_content)
 
-        for page in reader.pages:
-            text = page.extract_text()
-            if text:
-                text_parts.append(text)
+        # Keep enough ranges in flight to occupy the pool, but no more, so
+        # extracted text does not pile up ahead of a slow consumer
+        max_pending = 1 if self.executor is None else 2 * self.max_workers
+        pending: deque[asyncio.Future[list[str]]] = deque()
+        try:
+            for start in range(0, page_count, self.pdf_pages_per_task):
+                stop = min(start + self.pdf_pages_per_task, page_count)
+                pending.append(
+                    asyncio.ensure_future(
+                        self._run(self.executor, _extract_pdf_pages, file_content, start, stop)
+                    )
+                )
+                if len(pending) >= max_pending:
+                    for text in await pending.popleft():
+                        yield text
+            while pending:
+                for text in await pending.popleft():
+                    yield text
+        finally:
+            for future in pending:
+                future.cancel()
 
-        return "\n\n".join(text_parts)
+    def _extract_pdf_sync(self, file_content: bytes) -> str:
+        """Synchronous PDF extraction (run in thread pool)."""
+        return "\n\n".join(_extract_pdf_pages(file_content))
 
     async def extract_docx(self, file_content: bytes) -> str:
         """
@@ -107,35 +277,13 @@ class TextExtractor:
             TextExtractionError: If DOCX is corrupted or cannot be read
         """
         try:
-            # Run CPU-intensive DOCX parsing in thread pool
-            loop = asyncio.get_event_loop()
-            text = await loop.run_in_executor(None, self._extract_docx_sync, file_content)
-            return text
+            # Run CPU-intensive DOCX parsing off the event loop
+            return await self._run(
+                self._executor_for(file_content), _extract_docx_text, file_content
+            )
         except Exception as e:
             raise TextExtractionError(f"Failed to extract text from DOCX: {str(e)}")
 
-    def _extract_docx_sync(self, file_content: bytes) -> str:
-        """Synchronous DOCX extraction (run in thread pool)."""
-        from io import BytesIO
-
-        docx_file = BytesIO(file_content)
-        doc = Document(docx_file)
-        text_parts = []
-
-        # Extract text from paragraphs
-        for paragraph in doc.paragraphs:
-            if paragraph.text.strip():
-                text_parts.append(paragraph.text)
-
-        # Extract text from tables
-        for table in doc.tables:
-            for row in table.rows:
-                row_text = " | ".join(cell.text.strip() for cell in row.cells)
-                if row_text.strip():
-                    text_parts.append(row_text)
-
-        return "\n\n".join(text_parts)
-
     async def extract_html(self, file_content: bytes) -> str:
         """
         Extract text from HTML file.
@@ -150,21 +298,25 @@ class TextExtractor:
             TextExtractionError: If HTML is malformed or cannot be parsed
         """
         try:
-            html_content = file_content.decode("utf-8")
-            soup = BeautifulSoup(html_content, "html.parser")
-
-            # Remove script and style elements
-            for script in soup(["script", "style"]):
-                script.decompose()
-
-            # Get text
-            text = soup.get_text()
-
-            # Clean up whitespace
-            lines = (line.strip() for line in text.splitlines())
-            chunks = (phrase.strip() for line in lines for phrase in line.split("  "))
-            text = "\n".join(chunk for chunk in chunks if chunk)
-
-            return text
+            # Run HTML parsing off the event loop
+            return await self._run(
+                self._executor_for(file_content), _extract_html_text, file_content
+            )
         except Exception as e:
             raise TextExtractionError(f"Failed to extract text from HTML: {str(e)}")
+
+    @staticmethod
+    async def _run(executor: Optional[Executor], fn: Callable[..., T], *args: Any) -> T:
+        """Run a parsing function in an executor (None: the default thread pool)."""
+        loop = asyncio.get_running_loop()
+        try:
+            return await loop.run_in_executor(executor, fn, *args)
+        except BrokenProcessPool:
+            _discard_broken_pool(executor)
+            raise
+
+    def _executor_for(self, file_content: bytes) -> Optional[Executor]:
+        """Pick the executor for a file: small files are not worth sending to a process."""
+        if len(file_content) >= self.offload_min_bytes:
+            return self.executor
+        return None
@@ -4,9 +4,11 @@ import logging
 from datetime import datetime, timezone
 from uuid import UUID, uuid4
 
+from src.application.services.embedding_batcher import EmbeddingBatcher
 from src.application.services.text_chunker import TextChunker
 from src.domain.models.document import Document, DocumentType, IDocumentRepository
 from src.domain.models.knowledge import IKnowledgeRepository, KnowledgeItem
+from src.infrastructure.cache.redis_cache import RedisCacheService
 from src.infrastructure.external.crawler.crawler_client import WebCrawler
 from src.infrastructure.external.llm.providers.base import ILLMProvider
 from src.shared.utils.errors import CrawlError, DatabaseError, EmbeddingError
@@ -24,6 +26,8 @@ class CrawlKnowledgeUseCase:
         web_crawler: WebCrawler,
         text_chunker: TextChunker,
         llm_provider: ILLMProvider,
+        embedding_batcher: EmbeddingBatcher | None = None,
+        cache_service: RedisCacheService | None = None,
     ):
         """
         Initialize the use case with required dependencies.
@@ -34,12 +38,17 @@ class CrawlKnowledgeUseCase:
             web_crawler: Service for crawling web pages
             text_chunker: Service for chunking text
             llm_provider: LLM provider for generating embeddings
+            embedding_batcher: Splits chunk texts into batched embedding requests
+            cache_service: RAG query cache to invalidate for the project once
+                new knowledge is saved
         """
         self.document_repository = document_repository
         self.knowledge_repository = knowledge_repository
         self.web_crawler = web_crawler
         self.text_chunker = text_chunker
         self.llm_provider = llm_provider
+        self.embedding_batcher = embedding_batcher or EmbeddingBatcher()
+        self.cache_service = cache_service
 
     async def execute_crawl(
         self, url: str, project_id: UUID, user_id: UUID, respect_robots_txt: bool = True
@@ -90,20 +99,23 @@ class CrawlKnowledgeUseCase:
             chunks = await self.text_chunker.semantic_chunk(crawled_content.text)
             logger.info(f"Created {len(chunks)} chunks from crawled document {created_doc.id}")
 
-            # Step 5: Generate embeddings and create knowledge items
-            knowledge_items: list[KnowledgeItem] = []
-
-            for chunk in chunks:
-                try:
-                    # Generate embedding for chunk
-                    embedding = await self.llm_provider.embed_text(chunk.text)
+            # Step 5: Generate embeddings in batched provider requests
+            try:
+                embeddings = await self.embedding_batcher.embed(
+                    self.llm_provider, [chunk.text for chunk in chunks]
+                )
+            except Exception as e:
+                logger.error(f"Failed to generate embeddings for document {created_doc.id}: {e}")
+                raise EmbeddingError(f"Failed to generate embedding: {str(e)}")
 
-                    # Merge chunk metadata with crawled metadata
-                    chunk_metadata = chunk.to_metadata()
-                    chunk_metadata.update(crawled_content.metadata)
+            # Create knowledge items, merging chunk metadata with crawled metadata
+            knowledge_items: list[KnowledgeItem] = []
+            for chunk, embedding in zip(chunks, embeddings):
+                chunk_metadata = chunk.to_metadata()
+                chunk_metadata.update(crawled_content.metadata)
 
-                    # Create knowledge item
-                    knowledge_item = KnowledgeItem(
+                knowledge_items.append(
+                    KnowledgeItem(
                         id=uuid4(),
                         document_id=created_doc.id,
                         chunk_text=chunk.text,
@@ -111,12 +123,9 @@ class CrawlKnowledgeUseCase:
                         embedding=embedding,
                         metadata=chunk_metadata,
                         created_at=datetime.now(timezone.utc),
+                        project_id=created_doc.project_id,
                     )
-                    knowledge_items.append(knowledge_item)
-
-                except Exception as e:
-                    logger.error(f"Failed to generate embedding for chunk {chunk.chunk_index}: {e}")
-                    raise EmbeddingError(f"Failed to generate embedding: {str(e)}")
+                )
 
             # Step 6: Batch save knowledge items
             if knowledge_items:
@@ -124,6 +133,8 @@ class CrawlKnowledgeUseCase:
                 logger.info(
                     f"Saved {len(knowledge_items)} knowledge items for document {created_doc.id}"
                 )
+                if self.cache_service:
+                    await self.cache_service.bump_generation(created_doc.project_id)
             else:
                 logger.warning(f"No text content extracted from URL {url}")
 
@@ -1,16 +1,20 @@
 """Use case for ingesting knowledge from files."""
+import asyncio
 import hashlib
 import logging
 from datetime import datetime, timezone
 from pathlib import Path
+from typing import AsyncIterator
 from uuid import UUID, uuid4
 
 from fastapi import UploadFile
 
-from src.application.services.text_chunker import TextChunker
+from src.application.services.embedding_batcher import EmbeddingBatcher
+from src.application.services.text_chunker import TextChunk, TextChunker
 from src.application.services.text_extractor import TextExtractor
 from src.domain.models.document import Document, DocumentType, IDocumentRepository
 from src.domain.models.knowledge import IKnowledgeRepository, KnowledgeItem
+from src.infrastructure.cache.redis_cache import RedisCacheService
 from src.infrastructure.external.llm.providers.base import ILLMProvider
 from src.shared.utils.errors import DatabaseError, EmbeddingError, TextExtractionError
 
@@ -27,6 +31,9 @@ class IngestKnowledgeUseCase:
         text_extractor: TextExtractor,
         text_chunker: TextChunker,
         llm_provider: ILLMProvider,
+        embedding_batcher: EmbeddingBatcher | None = None,
+        cache_service: RedisCacheService | None = None,
+        max_pending_batches: int = 4,
     ):
         """
         Initialize the use case with required dependencies.
@@ -37,12 +44,20 @@ class IngestKnowledgeUseCase:
             text_extractor: Service for extracting text from files
             text_chunker: Service for chunking text
             llm_provider: LLM provider for generating embeddings
+            embedding_batcher: Splits chunk texts into batched embedding requests
+            cache_service: RAG query cache to invalidate for the project once
+                new knowledge is saved
+            max_pending_batches: Maximum number of chunk batches being embedded
+                and saved at once; bounds memory use for large files
         """
         self.document_repository = document_repository
         self.knowledge_repository = knowledge_repository
         self.text_extractor = text_extractor
         self.text_chunker = text_chunker
         self.llm_provider = llm_provider
+        self.embedding_batcher = embedding_batcher or EmbeddingBatcher()
+        self.cache_service = cache_service
+        self.max_pending_batches = max(1, max_pending_batches)
 
     async def execute(self, file: UploadFile, project_id: UUID) -> UUID:
         """
@@ -91,44 +106,15 @@ class IngestKnowledgeUseCase:
             created_doc = await self.document_repository.create(document)
             logger.info(f"Created document {created_doc.id} for file {file.filename}")
 
-            # Extract text from file
-            text = await self.text_extractor.extract(file_content, file.filename or "")
-            logger.info(f"Extracted {len(text)} characters from {file.filename}")
-
-            # Chunk text into segments
-            chunks = await self.text_chunker.semantic_chunk(text)
-            logger.info(f"Created {len(chunks)} chunks from document {created_doc.id}")
-
-            # Generate embeddings and create knowledge items
-            knowledge_items: list[KnowledgeItem] = []
-
-            for chunk in chunks:
-                try:
-                    # Generate embedding for chunk
-                    embedding = await self.llm_provider.embed_text(chunk.text)
-
-                    # Create knowledge item
-                    knowledge_item = KnowledgeItem(
-                        id=uuid4(),
-                        document_id=created_doc.id,
-                        chunk_text=chunk.text,
-                        chunk_index=chunk.chunk_index,
-                        embedding=embedding,
-                        metadata=chunk.to_metadata(),
-                        created_at=datetime.now(timezone.utc),
-                    )
-                    knowledge_items.append(knowledge_item)
-
-                except Exception as e:
-                    logger.error(f"Failed to generate embedding for chunk {chunk.chunk_index}: {e}")
-                    raise EmbeddingError(f"Failed to generate embedding: {str(e)}")
+            # Stream text through chunking, embedding and saving in bounded
+            # batches, so memory use does not grow with the size of the file
+            fragments = self.text_extractor.iter_text(file_content, file.filename or "")
+            chunks = self.text_chunker.iter_chunks(fragments)
+            saved = await self._save_chunks(created_doc, chunks)
+            logger.info(f"Saved {saved} knowledge items for document {created_doc.id}")
 
-            # Batch save knowledge items
-            if knowledge_items:
-                await self.knowledge_repository.create_batch(knowledge_items)
-                logger.info(
-                    f"Saved {len(knowledge_items)} knowledge items for document {created_doc.id}"
-                )
+            if saved and self.cache_service:
+                await self.cache_service.bump_generation(created_doc.project_id)
 
             return created_doc.id
 
@@ -139,3 +125,88 @@ class IngestKnowledgeUseCase:
         except Exception as e:
             logger.error(f"Failed to ingest knowledge from {file.filename}: {e}")
             raise DatabaseError(f"Knowledge ingestion failed: {str(e)}")
+
+    async def _save_chunks(self, document: Document, chunks: AsyncIterator[TextChunk]) -> int:
+        """
+        Embed and save chunks batch by batch as they are produced.
+
+        At most ``max_pending_batches`` batches are in progress; reading more
+        chunks waits until one of them is saved. If any batch fails, the
+        knowledge already saved for the document is deleted again.
+
+        Args:
+            document: Document the chunks belong to
+            chunks: Chunks of the document's text, in order
+
+        Returns:
+            Number of knowledge items saved
+        """
+        pending: set[asyncio.Task[int]] = set()
+        saved = 0
+        try:
+            async for batch in self.embedding_batcher.iter_batches(chunks, lambda c: c.text):
+                if len(pending) >= self.max_pending_batches:
+                    done, pending = await asyncio.wait(
+                        pending, return_when=asyncio.FIRST_COMPLETED
+                    )
+                    saved += sum(task.result() for task in done)
+                pending.add(asyncio.create_task(self._save_batch(document, batch)))
+            saved += sum(await asyncio.gather(*pending))
+            return saved
+        except Exception:
+            for task in pending:
+                task.cancel()
+            await asyncio.gather(*pending, return_exceptions=True)
+            await self._discard_knowledge(document)
+            raise
+        finally:
+            for task in pending:
+                task.cancel()
+
+    async def _save_batch(self, document: Document, chunks: list[TextChunk]) -> int:
+        """
+        Embed one batch of chunks in a single provider request and save them.
+
+        Args:
+            document: Document the chunks belong to
+            chunks: Chunks to embed and save
+
+        Returns:
+            Number of knowledge items saved
+
+        Raises:
+            EmbeddingError: If embedding generation fails
+        """
+        try:
+            embeddings = await self.embedding_batcher.embed(
+                self.llm_provider, [chunk.text for chunk in chunks]
+            )
+        except Exception as e:
+            logger.error(f"Failed to generate embeddings for document {document.id}: {e}")
+            raise EmbeddingError(f"Failed to generate embedding: {str(e)}")
+
+        knowledge_items = [
+            KnowledgeItem(
+                id=uuid4(),
+                document_id=document.id,
+                chunk_text=chunk.text,
+                chunk_index=chunk.chunk_index,
+                embedding=embedding,
+                metadata=chunk.to_metadata(),
+                created_at=datetime.now(timezone.utc),
+                project_id=document.project_id,
+            )
+            for chunk, embedding in zip(chunks, embeddings)
+        ]
+        await self.knowledge_repository.create_batch(knowledge_items)
+        return len(knowledge_items)
+
+    async def _discard_knowledge(self, document: Document) -> None:
+        """Delete the knowledge saved so far for a document whose ingestion failed."""
+        try:
+            deleted = await self.knowledge_repository.delete_by_document(document.id)
+        except Exception as e:
+            logger.error(f"Failed to remove partial knowledge of document {document.id}: {e}")
+            return
+        if deleted and self.cache_service:
+            await self.cache_service.bump_generation(document.project_id)
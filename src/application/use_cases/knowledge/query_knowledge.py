@@ -1,21 +1,42 @@
 """Query knowledge use case for RAG retrieval."""
 
+import asyncio
+import base64
+import binascii
+import contextlib
+import copy
+import json
 import logging
-from typing import Any, Optional
+import math
+import random
+import struct
+import time
+from dataclasses import dataclass, replace
+from datetime import datetime
+from typing import Any, AsyncIterator, Awaitable, Callable, Optional, TypeVar
 from uuid import UUID, uuid4
 
-from src.application.services.hybrid_search_service import HybridSearchService
 from src.application.services.reranking_service import RerankingService
 from src.application.services.synthesis_service import SynthesisService
-from src.domain.models.knowledge import IKnowledgeRepository, KnowledgeItem
+from src.domain.models.knowledge import (
+    IKnowledgeRepository,
+    IterativeScanMode,
+    KnowledgeItem,
+    SearchEffort,
+    SearchStats,
+)
 from src.domain.models.project import IProjectRepository
+from src.infrastructure.cache.local_cache import LocalCache
 from src.infrastructure.cache.redis_cache import RedisCacheService
+from src.infrastructure.cache.semantic_query_cache import SemanticQueryCache
 from src.infrastructure.external.llm.provider_factory import ProviderFactory
 from src.shared.config.settings import Settings
 from src.shared.utils.errors import ProjectNotFoundError, UnauthorizedAccessError
 
 logger = logging.getLogger(__name__)
 
+T = TypeVar("T")
+
 
 class QueryKnowledgeResult:
     """Result of a knowledge query operation.
@@ -25,6 +46,9 @@ class QueryKnowledgeResult:
         results: List of tuples (KnowledgeItem, similarity_score, bm25_score, rerank_score).
         total_results: Total number of results returned.
         synthesized_answer: Optional synthesized natural language answer.
+        candidates_scanned: Number of knowledge item rows the search visited.
+        search_plan: How the search ran ("exact" or "ann").
+        search_duration_ms: Round-trip time of the search query in milliseconds.
     """
 
     def __init__(
@@ -33,6 +57,9 @@ class QueryKnowledgeResult:
         results: list[tuple[KnowledgeItem, float, Optional[float], Optional[float]]],
         total_results: int,
         synthesized_answer: Optional[str] = None,
+        candidates_scanned: Optional[int] = None,
+        search_plan: Optional[str] = None,
+        search_duration_ms: Optional[float] = None,
     ) -> None:
         """Initialize query result.
         
@@ -41,22 +68,170 @@ class QueryKnowledgeResult:
             results: List of tuples (KnowledgeItem, similarity_score, bm25_score, rerank_score).
             total_results: Total number of results returned.
             synthesized_answer: Optional synthesized natural language answer.
+            candidates_scanned: Number of knowledge item rows the search visited.
+            search_plan: How the search ran ("exact" or "ann").
+            search_duration_ms: Round-trip time of the search query in milliseconds.
         """
         self.query_id = query_id
         self.results = results
         self.total_results = total_results
         self.synthesized_answer = synthesized_answer
+        self.candidates_scanned = candidates_scanned
+        self.search_plan = search_plan
+        self.search_duration_ms = search_duration_ms
+
+
+# A cached result with its compute time in seconds and expiry as Unix time
+CacheEntry = tuple[QueryKnowledgeResult, Optional[float], Optional[float]]
+
+# Cache entries are stored as this prefix followed by a base64 encoded binary
+# record; entries without it are in the earlier JSON format and still read.
+_CACHE_FORMAT_PREFIX = "v2:"
+# query_id, total_results, compute_seconds, expires_at, number of results
+_ENTRY_HEADER = struct.Struct("<16sIddI")
+# id, document_id, project_id, chunk_index, similarity, bm25 and rerank scores
+_ITEM_HEADER = struct.Struct("<16s16s16siddd")
+_TEXT_LENGTH = struct.Struct("<I")
+# Text length marking a missing (None) string
+_NO_TEXT = 0xFFFFFFFF
+_NO_UUID = bytes(16)
+
+
+def _pack_float(value: Optional[float]) -> float:
+    return math.nan if value is None else value
+
+
+def _unpack_float(value: float) -> Optional[float]:
+    return None if math.isnan(value) else value
+
+
+def _write_text(buffer: bytearray, text: Optional[str]) -> None:
+    if text is None:
+        buffer += _TEXT_LENGTH.pack(_NO_TEXT)
+        return
+    encoded = text.encode("utf-8")
+    buffer += _TEXT_LENGTH.pack(len(encoded))
+    buffer += encoded
+
+
+def _read_text(data: bytes, offset: int) -> tuple[Optional[str], int]:
+    (length,) = _TEXT_LENGTH.unpack_from(data, offset)
+    offset += _TEXT_LENGTH.size
+    if length == _NO_TEXT:
+        return None, offset
+    end = offset + length
+    if end > len(data):
+        raise ValueError("Truncated text field")
+    return data[offset:end].decode("utf-8"), end
+
+
+def _encode_cache_entry(
+    result: QueryKnowledgeResult,
+    compute_seconds: Optional[float],
+    expires_at: Optional[float],
+) -> str:
+    """Encode a cache entry in the compact binary format.
+
+    Embeddings are left out: results are served without them, and at 1536
+    floats per item they would dominate the entry's size.
+    """
+    buffer = bytearray(
+        _ENTRY_HEADER.pack(
+            result.query_id.bytes,
+            result.total_results,
+            _pack_float(compute_seconds),
+            _pack_float(expires_at),
+            len(result.results),
+        )
+    )
+    _write_text(buffer, result.synthesized_answer)
+    for item, similarity_score, bm25_score, rerank_score in result.results:
+        buffer += _ITEM_HEADER.pack(
+            item.id.bytes,
+            item.document_id.bytes,
+            item.project_id.bytes if item.project_id else _NO_UUID,
+            item.chunk_index,
+            _pack_float(similarity_score),
+            _pack_float(bm25_score),
+            _pack_float(rerank_score),
+        )
+        _write_text(buffer, item.chunk_text)
+        _write_text(buffer, json.dumps(item.metadata, separators=(",", ":")))
+        _write_text(buffer, item.created_at.isoformat())
+    return _CACHE_FORMAT_PREFIX + base64.b64encode(buffer).decode("ascii")
+
+
+def _decode_cache_entry(cached_data: str) -> CacheEntry:
+    """Decode a cache entry written by ``_encode_cache_entry``.
+
+    Raises:
+        ValueError: If the entry is malformed
+    """
+    try:
+        data = base64.b64decode(cached_data[len(_CACHE_FORMAT_PREFIX):], validate=True)
+        query_id, total_results, compute_seconds, expires_at, count = (
+            _ENTRY_HEADER.unpack_from(data, 0)
+        )
+        synthesized_answer, offset = _read_text(data, _ENTRY_HEADER.size)
+        results = []
+        for _ in range(count):
+            item_id, document_id, project_id, chunk_index, similarity, bm25, rerank = (
+                _ITEM_HEADER.unpack_from(data, offset)
+            )
+            chunk_text, offset = _read_text(data, offset + _ITEM_HEADER.size)
+            metadata, offset = _read_text(data, offset)
+            created_at, offset = _read_text(data, offset)
+            item = KnowledgeItem(
+                id=UUID(bytes=item_id),
+                document_id=UUID(bytes=document_id),
+                chunk_text=chunk_text,
+                chunk_index=chunk_index,
+                embedding=None,
+                metadata=json.loads(metadata),
+                created_at=datetime.fromisoformat(created_at),
+                project_id=None if project_id == _NO_UUID else UUID(bytes=project_id),
+            )
+            results.append((item, similarity, _unpack_float(bm25), _unpack_float(rerank)))
+    except (binascii.Error, struct.error, TypeError) as e:
+        raise ValueError(str(e)) from e
+    if offset != len(data):
+        raise ValueError("Trailing bytes after cache entry")
+
+    result = QueryKnowledgeResult(
+        query_id=UUID(bytes=query_id),
+        results=results,
+        total_results=total_results,
+        synthesized_answer=synthesized_answer,
+    )
+    return result, _unpack_float(compute_seconds), _unpack_float(expires_at)
+
+
+@dataclass(frozen=True, slots=True)
+class _QueryOptions:
+    """Query parameters after applying settings defaults and limits."""
+
+    top_k: int
+    use_hybrid_search: bool
+    use_re_ranking: bool
+    use_agentic_rag: bool
+    effort: SearchEffort
 
 
 class QueryKnowledgeUseCase:
     """Use case for querying knowledge items using RAG."""
 
+    # Queries being computed in this process, by result cache key, shared by
+    # concurrent requests for the same key (single-flight)
+    _in_flight: dict[str, "asyncio.Future[QueryKnowledgeResult]"] = {}
+
     def __init__(
         self,
         knowledge_repo: IKnowledgeRepository,
         project_repo: IProjectRepository,
         settings: Settings,
         cache_service: Optional[RedisCacheService] = None,
+        semantic_cache: Optional[SemanticQueryCache] = None,
+        local_cache: Optional[LocalCache[str, CacheEntry]] = None,
     ) -> None:
         """Initialize use case with dependencies.
         
@@ -65,12 +240,17 @@ class QueryKnowledgeUseCase:
             project_repo: Repository for project operations.
             settings: Application settings.
             cache_service: Optional Redis cache service for query result caching.
+            semantic_cache: Optional index of recent query embeddings used to reuse
+                            cached results of near-duplicate queries.
+            local_cache: Optional in-process tier of deserialized results in front
+                         of the Redis cache.
         """
         self.knowledge_repo = knowledge_repo
         self.project_repo = project_repo
         self.settings = settings
         self.cache_service = cache_service
-        self.hybrid_search_service = HybridSearchService()
+        self.semantic_cache = semantic_cache
+        self.local_cache = local_cache
         self.reranking_service = RerankingService()
         self.synthesis_service = SynthesisService()
 
@@ -83,6 +263,9 @@ class QueryKnowledgeUseCase:
         use_hybrid_search: bool = False,
         use_re_ranking: bool = False,
         use_agentic_rag: bool = False,
+        ef_search: Optional[int] = None,
+        iterative_scan: Optional[str] = None,
+        max_scan_tuples: Optional[int] = None,
     ) -> QueryKnowledgeResult:
         """Execute RAG query to retrieve relevant knowledge items.
         
@@ -94,15 +277,464 @@ class QueryKnowledgeUseCase:
             use_hybrid_search: Enable hybrid vector + keyword search.
             use_re_ranking: Enable LLM-based re-ranking of results.
             use_agentic_rag: Enable synthesis of natural language answer.
+            ef_search: Optional HNSW candidate list size (uses settings default if not provided).
+            iterative_scan: Optional HNSW iterative scan mode (uses settings default if not provided).
+            max_scan_tuples: Optional iterative scan tuple limit (uses settings default if not provided).
             
         Returns:
             QueryKnowledgeResult containing matched knowledge items and scores.
             
+        Raises:
+            ProjectNotFoundError: If the project doesn't exist.
+            UnauthorizedAccessError: If user doesn't have access to the project.
+            ValueError: If the search effort parameters are invalid.
+        """
+        # Step 1: Resolve top_k, search flags and HNSW effort against settings
+        options = self._resolve_options(
+            top_k=top_k,
+            use_hybrid_search=use_hybrid_search,
+            use_re_ranking=use_re_ranking,
+            use_agentic_rag=use_agentic_rag,
+            ef_search=ef_search,
+            iterative_scan=iterative_scan,
+            max_scan_tuples=max_scan_tuples,
+        )
+
+        # Steps 2-3: Validate that project exists and user has access while the
+        # cache is checked and, on a miss, the query embedding is started unless
+        # another request is already computing this query
+        embedding_task: Optional[asyncio.Task[list[float]]] = None
+        async with self._authorizing(project_id, user_id) as speculative:
+            generation = await self._cache_generation(project_id)
+            cache_key = self._cache_key(project_id, query_text, options, generation)
+            cached_result = await self._get_cached_result(project_id, cache_key)
+            if not cached_result and cache_key not in self._in_flight:
+                embedding_task = self._start_task(self._embed_query(query_text))
+                speculative.append(embedding_task)
+        if cached_result:
+            return cached_result
+
+        async def compute() -> QueryKnowledgeResult:
+            # Step 4: Wait for the query embedding
+            if embedding_task is not None:
+                query_embedding = await embedding_task
+            else:
+                query_embedding = await self._embed_query(query_text)
+
+            # Step 4b: Reuse the cached result of a near-duplicate query, also
+            # under this query's key so workers waiting on it find the result
+            similar_result = await self._get_similar_result(
+                project_id, generation, query_embedding, options
+            )
+            if similar_result:
+                if cache_key:
+                    await self._cache_result(cache_key, similar_result)
+                return similar_result
+
+            # Steps 5-8: Search, re-rank, synthesize and build the result
+            started = time.monotonic()
+            result = await self._run_query(project_id, query_text, query_embedding, options)
+
+            # Step 9: Cache result if enabled
+            if cache_key:
+                await self._cache_result(cache_key, result, time.monotonic() - started)
+                self._remember_query(project_id, generation, query_embedding, options, cache_key)
+
+            return result
+
+        if not cache_key:
+            return await compute()
+
+        # Concurrent misses for the same key share one computation, so a request
+        # that joins one drops the embedding it started
+        if embedding_task is not None and cache_key in self._in_flight:
+            embedding_task.cancel()
+        return await self._single_flight(project_id, cache_key, compute)
+
+    async def execute_batch(
+        self,
+        project_id: UUID,
+        query_texts: list[str],
+        user_id: UUID,
+        top_k: Optional[int] = None,
+        use_hybrid_search: bool = False,
+        use_re_ranking: bool = False,
+        use_agentic_rag: bool = False,
+        ef_search: Optional[int] = None,
+        iterative_scan: Optional[str] = None,
+        max_scan_tuples: Optional[int] = None,
+    ) -> list[QueryKnowledgeResult]:
+        """Execute several RAG queries against one project.
+        
+        The project is authorized once, all cache misses are embedded in a single
+        provider call and the searches run concurrently, bounded by
+        ``settings.rag.batch_max_concurrency`` and by one less than the database
+        pool size, since each search holds a connection.
+        
+        Args:
+            project_id: UUID of the project to query against.
+            query_texts: The text queries to search for.
+            user_id: UUID of the user making the queries.
+            top_k: Optional number of results per query (uses settings default if not provided).
+            use_hybrid_search: Enable hybrid vector + keyword search.
+            use_re_ranking: Enable LLM-based re-ranking of results.
+            use_agentic_rag: Enable synthesis of natural language answers.
+            ef_search: Optional HNSW candidate list size (uses settings default if not provided).
+            iterative_scan: Optional HNSW iterative scan mode (uses settings default if not provided).
+            max_scan_tuples: Optional iterative scan tuple limit (uses settings default if not provided).
+            
+        Returns:
+            One QueryKnowledgeResult per query, in the order of ``query_texts``.
+            
+        Raises:
+            ProjectNotFoundError: If the project doesn't exist.
+            UnauthorizedAccessError: If user doesn't have access to the project.
+            ValueError: If the batch is empty or too large, or the search effort
+                        parameters are invalid.
+        """
+        if not query_texts:
+            raise ValueError("At least one query is required")
+        if len(query_texts) > self.settings.rag.batch_max_queries:
+            raise ValueError(
+                f"Batch of {len(query_texts)} queries exceeds the maximum of "
+                f"{self.settings.rag.batch_max_queries}"
+            )
+
+        options = self._resolve_options(
+            top_k=top_k,
+            use_hybrid_search=use_hybrid_search,
+            use_re_ranking=use_re_ranking,
+            use_agentic_rag=use_agentic_rag,
+            ef_search=ef_search,
+            iterative_scan=iterative_scan,
+            max_scan_tuples=max_scan_tuples,
+        )
+
+        # Check access while the cache is checked and the misses are embedded
+        async with self._authorizing(project_id, user_id) as speculative:
+            generation = await self._cache_generation(project_id)
+            cache_keys = [
+                self._cache_key(project_id, text, options, generation) for text in query_texts
+            ]
+            results: list[Optional[QueryKnowledgeResult]] = list(
+                await asyncio.gather(
+                    *(self._get_cached_result(project_id, key) for key in cache_keys)
+                )
+            )
+            misses = [i for i, result in enumerate(results) if result is None]
+            if misses:
+                # One provider call embeds every query that missed the cache
+                embeddings_task = self._start_task(
+                    self._embed_queries([query_texts[i] for i in misses])
+                )
+                speculative.append(embeddings_task)
+        if not misses:
+            return results
+
+        embeddings = await embeddings_task
+
+        # Near-duplicates of recent queries are matched in one pass over the index
+        similar_results = await self._get_similar_results(
+            project_id, generation, embeddings, options
+        )
+        for index, similar_result in zip(misses, similar_results):
+            results[index] = similar_result
+
+        semaphore = asyncio.Semaphore(self._batch_concurrency())
+
+        async def run(index: int, query_embedding: list[float]) -> None:
+            async with semaphore:
+                started = time.monotonic()
+                result = await self._run_query(
+                    project_id, query_texts[index], query_embedding, options
+                )
+                compute_seconds = time.monotonic() - started
+            results[index] = result
+            if cache_keys[index]:
+                await self._cache_result(cache_keys[index], result, compute_seconds)
+                self._remember_query(
+                    project_id, generation, query_embedding, options, cache_keys[index]
+                )
+
+        await asyncio.gather(
+            *(
+                run(i, emb)
+                for i, emb in zip(misses, embeddings)
+                if results[i] is None
+            )
+        )
+        return results
+
+    async def execute_stream(
+        self,
+        project_id: UUID,
+        query_text: str,
+        user_id: UUID,
+        top_k: Optional[int] = None,
+        use_hybrid_search: bool = False,
+        use_re_ranking: bool = False,
+        use_agentic_rag: bool = False,
+        ef_search: Optional[int] = None,
+        iterative_scan: Optional[str] = None,
+        max_scan_tuples: Optional[int] = None,
+    ) -> tuple[QueryKnowledgeResult, Optional[AsyncIterator[str]]]:
+        """Execute RAG retrieval now and return the synthesized answer as a stream.
+        
+        Authorization, search and re-ranking complete before this method returns,
+        so their errors surface as usual. The answer is generated lazily while the
+        returned iterator is consumed; once it is exhausted, the result's
+        ``synthesized_answer`` is filled in and the result is cached.
+        
+        Args:
+            project_id: UUID of the project to query against.
+            query_text: The text query to search for.
+            user_id: UUID of the user making the query.
+            top_k: Optional number of results to return (uses settings default if not provided).
+            use_hybrid_search: Enable hybrid vector + keyword search.
+            use_re_ranking: Enable LLM-based re-ranking of results.
+            use_agentic_rag: Enable streaming synthesis of a natural language answer.
+            ef_search: Optional HNSW candidate list size (uses settings default if not provided).
+            iterative_scan: Optional HNSW iterative scan mode (uses settings default if not provided).
+            max_scan_tuples: Optional iterative scan tuple limit (uses settings default if not provided).
+            
+        Returns:
+            Tuple of the query result (without ``synthesized_answer``) and an async
+            iterator of answer tokens, or None when no answer will be synthesized.
+            
+        Raises:
+            ProjectNotFoundError: If the project doesn't exist.
+            UnauthorizedAccessError: If user doesn't have access to the project.
+            ValueError: If the search effort parameters are invalid.
+        """
+        options = self._resolve_options(
+            top_k=top_k,
+            use_hybrid_search=use_hybrid_search,
+            use_re_ranking=use_re_ranking,
+            use_agentic_rag=use_agentic_rag,
+            ef_search=ef_search,
+            iterative_scan=iterative_scan,
+            max_scan_tuples=max_scan_tuples,
+        )
+
+        # Check access while the cache is checked and, on a miss, the query embedded
+        async with self._authorizing(project_id, user_id) as speculative:
+            generation = await self._cache_generation(project_id)
+            cache_key = self._cache_key(project_id, query_text, options, generation)
+            cached_result = await self._get_cached_result(project_id, cache_key)
+            if not cached_result:
+                embedding_task = self._start_task(self._embed_query(query_text))
+                speculative.append(embedding_task)
+        if not cached_result:
+            query_embedding = await embedding_task
+            cached_result = await self._get_similar_result(
+                project_id, generation, query_embedding, options
+            )
+
+        if cached_result:
+            # Replay a cached answer as a single token
+            answer = cached_result.synthesized_answer
+            cached_result.synthesized_answer = None
+            return cached_result, self._replay_answer(cached_result, answer) if answer else None
+
+        # Retrieve without synthesis; the answer is streamed separately
+        result = await self._run_query(
+            project_id, query_text, query_embedding, replace(options, use_agentic_rag=False)
+        )
+
+        if cache_key:
+            # A streamed answer is cached once complete; until then a semantic
+            # match on this query finds no cached result and falls through
+            self._remember_query(project_id, generation, query_embedding, options, cache_key)
+
+        if not (options.use_agentic_rag and result.results):
+            if cache_key:
+                await self._cache_result(cache_key, result)
+            return result, None
+
+        return result, self._stream_answer(project_id, query_text, result, cache_key)
+
+    @staticmethod
+    async def _replay_answer(
+        result: QueryKnowledgeResult, answer: str
+    ) -> AsyncIterator[str]:
+        """Yield a cached answer and restore it on the result."""
+        yield answer
+        result.synthesized_answer = answer
+
+    async def _stream_answer(
+        self,
+        project_id: UUID,
+        query_text: str,
+        result: QueryKnowledgeResult,
+        cache_key: Optional[str],
+    ) -> AsyncIterator[str]:
+        """Stream synthesis tokens, then record and cache the full answer.
+
+        Args:
+            project_id: UUID of the queried project (for logging).
+            query_text: The text query being answered.
+            result: Retrieval result whose chunks form the synthesis context.
+            cache_key: Key from ``_cache_key``; None skips caching.
+
+        Yields:
+            Chunks of the synthesized answer.
+        """
+        llm_provider = ProviderFactory.get_llm_provider(
+            model_name=self.settings.rag.agentic_rag_model
+        )
+
+        parts: list[str] = []
+        async for token in self.synthesis_service.synthesize_stream(
+            query=query_text,
+            chunks=[item for item, _, _, _ in result.results],
+            llm_provider=llm_provider,
+            settings=self.settings.rag,
+        ):
+            parts.append(token)
+            yield token
+
+        result.synthesized_answer = "".join(parts).strip() or None
+        logger.info(f"Streamed synthesized answer for query on project {project_id}")
+
+        if cache_key:
+            await self._cache_result(cache_key, result)
+
+    async def _single_flight(
+        self,
+        project_id: UUID,
+        cache_key: str,
+        compute: Callable[[], Awaitable[QueryKnowledgeResult]],
+    ) -> QueryKnowledgeResult:
+        """Run ``compute`` once per cache key across concurrent requests.
+
+        Within this process, requests for a key that is already being computed
+        await the same task. Across processes, the computing request holds a
+        Redis lock; a request that finds the lock taken polls the cache for the
+        other worker's result and computes itself once the lock is released
+        without a result (e.g. the other worker failed) or expires.
+
+        Args:
+            project_id: UUID of the queried project (for logging).
+            cache_key: Result cache key of the query.
+            compute: Computes, caches and returns the result.
+
+        Returns:
+            The query result.
+        """
+        flight = self._in_flight.get(cache_key)
+        if flight is None:
+            flight = asyncio.ensure_future(self._compute_once(project_id, cache_key, compute))
+            self._in_flight[cache_key] = flight
+            flight.add_done_callback(lambda _: self._in_flight.pop(cache_key, None))
+        else:
+            logger.info(f"Joining in-flight query on project {project_id}")
+
+        # Shielded so one caller disconnecting does not cancel the others' result
+        return await asyncio.shield(flight)
+
+    async def _compute_once(
+        self,
+        project_id: UUID,
+        cache_key: str,
+        compute: Callable[[], Awaitable[QueryKnowledgeResult]],
+    ) -> QueryKnowledgeResult:
+        """Compute a result under the cross-process lock for its cache key."""
+        lock_key = f"{cache_key}:lock"
+        lock_ttl = self.settings.rag.single_flight_lock_ttl
+        token = await self.cache_service.acquire_lock(lock_key, lock_ttl)
+
+        if token is None:
+            logger.info(f"Waiting for another worker's query on project {project_id}")
+            poll_interval = self.settings.rag.single_flight_poll_interval_ms / 1000
+            deadline = time.monotonic() + lock_ttl
+            while time.monotonic() < deadline:
+                await asyncio.sleep(poll_interval)
+                entry = await self._read_cache_entry(cache_key)
+                if entry:
+                    return copy.copy(entry[0])
+                # No result yet; if the lock is free its holder gave up
+                token = await self.cache_service.acquire_lock(lock_key, lock_ttl)
+                if token is not None:
+                    logger.info(
+                        f"Lock released without a result on project {project_id}, computing it"
+                    )
+                    break
+            else:
+                logger.warning(f"Timed out waiting for query on project {project_id}, computing it")
+
+        try:
+            return await compute()
+        finally:
+            if token is not None:
+                await self.cache_service.release_lock(lock_key, token)
+
+    @staticmethod
+    def _start_task(coro: Awaitable[T]) -> "asyncio.Task[T]":
+        """Start work that runs alongside the project access check.
+
+        A failure of a task nobody ends up awaiting (e.g. a query embedding
+        made unnecessary by another worker's cached result) is marked as
+        retrieved, so it is not reported as unhandled.
+        """
+        task = asyncio.ensure_future(coro)
+        task.add_done_callback(lambda done: done.cancelled() or done.exception())
+        return task
+
+    @contextlib.asynccontextmanager
+    async def _authorizing(
+        self, project_id: UUID, user_id: UUID
+    ) -> AsyncIterator[list["asyncio.Task[Any]"]]:
+        """Check project access while the body runs, then wait for the check.
+
+        The body must not hand out anything it reads before the block exits.
+        Tasks it adds to the yielded list are speculative and are cancelled if
+        access is denied. Access errors take precedence over the body's errors.
+
+        Args:
+            project_id: UUID of the project to query against.
+            user_id: UUID of the user making the query.
+
+        Raises:
+            ProjectNotFoundError: If the project doesn't exist.
+            UnauthorizedAccessError: If user doesn't have access to the project.
+        """
+        authorization = self._start_task(self._authorize(project_id, user_id))
+        speculative: list[asyncio.Task[Any]] = []
+        try:
+            try:
+                yield speculative
+            except Exception:
+                await authorization
+                raise
+            await authorization
+        except BaseException:
+            for task in (authorization, *speculative):
+                task.cancel()
+            raise
+
+    @staticmethod
+    async def _embed_query(query_text: str) -> list[float]:
+        """Embed a query with the query-side embedding provider."""
+        embedding_provider = ProviderFactory.get_embedding_provider(for_queries=True)
+        return await embedding_provider.embed_text(query_text)
+
+    @staticmethod
+    async def _embed_queries(query_texts: list[str]) -> list[list[float]]:
+        """Embed several queries in one query-side embedding provider call."""
+        embedding_provider = ProviderFactory.get_embedding_provider(for_queries=True)
+        return await embedding_provider.embed_texts(query_texts)
+
+    async def _authorize(self, project_id: UUID, user_id: UUID) -> None:
+        """Check that the project exists and is owned by the user.
+
+        Args:
+            project_id: UUID of the project to query against.
+            user_id: UUID of the user making the query.
+
         Raises:
             ProjectNotFoundError: If the project doesn't exist.
             UnauthorizedAccessError: If user doesn't have access to the project.
         """
-        # Step 1: Validate that project exists and user has access
         project = await self.project_repo.get_by_id(project_id)
         if not project:
             raise ProjectNotFoundError(f"Project {project_id} not found")
@@ -113,74 +745,330 @@ class QueryKnowledgeUseCase:
                 f"User {user_id} does not have access to project {project_id}"
             )
 
-        # Step 2: Use top_k from request or fall back to settings default, enforce max
+    def _batch_concurrency(self) -> int:
+        """Concurrent searches of a batch, leaving a pool connection for other requests."""
+        connections = max(1, self.settings.db.pool_max_size - 1)
+        return max(1, min(self.settings.rag.batch_max_concurrency, connections))
+
+    def _resolve_options(
+        self,
+        top_k: Optional[int],
+        use_hybrid_search: bool,
+        use_re_ranking: bool,
+        use_agentic_rag: bool,
+        ef_search: Optional[int],
+        iterative_scan: Optional[str],
+        max_scan_tuples: Optional[int],
+    ) -> _QueryOptions:
+        """Apply settings defaults and limits to the request parameters.
+
+        Raises:
+            ValueError: If the search effort parameters are invalid.
+        """
+        # Use top_k from request or fall back to settings default, enforce max
         effective_top_k = top_k if top_k is not None else self.settings.rag.default_top_k
         effective_top_k = min(effective_top_k, self.settings.rag.max_top_k)
 
+        # HNSW search effort: request values fall back to settings defaults
+        effort = SearchEffort(
+            ef_search=ef_search if ef_search is not None else self.settings.rag.hnsw_ef_search,
+            iterative_scan=IterativeScanMode(
+                iterative_scan if iterative_scan is not None
+                else self.settings.rag.hnsw_iterative_scan
+            ),
+            max_scan_tuples=(
+                max_scan_tuples if max_scan_tuples is not None
+                else self.settings.rag.hnsw_max_scan_tuples
+            ),
+        )
+
         # Override flags with settings if defaults are set
-        if self.settings.rag.use_hybrid_search and not use_hybrid_search:
-            use_hybrid_search = True
-        if self.settings.rag.use_reranking and not use_re_ranking:
-            use_re_ranking = True
-        if self.settings.rag.use_agentic_rag and not use_agentic_rag:
-            use_agentic_rag = True
-
-        # Step 3: Check cache if enabled
-        cache_key = None
-        if self.cache_service and self.settings.rag.cache_enabled:
-            cache_key = self.cache_service.generate_cache_key(
-                project_id=project_id,
-                query_text=query_text,
-                use_hybrid=use_hybrid_search,
-                use_rerank=use_re_ranking,
-                use_agentic=use_agentic_rag,
-                top_k=effective_top_k,
-                prefix=self.settings.rag.cache_key_prefix,
-            )
+        return _QueryOptions(
+            top_k=effective_top_k,
+            use_hybrid_search=use_hybrid_search or bool(self.settings.rag.use_hybrid_search),
+            use_re_ranking=use_re_ranking or bool(self.settings.rag.use_reranking),
+            use_agentic_rag=use_agentic_rag or bool(self.settings.rag.use_agentic_rag),
+            effort=effort,
+        )
+
+    async def _cache_generation(self, project_id: UUID) -> Optional[int]:
+        """Get the project's cache generation, or None when caching is disabled.
+
+        Also None when the generation cannot be read, so a request never reads
+        results cached before the project's knowledge last changed.
+        """
+        if not (self.cache_service and self.settings.rag.cache_enabled):
+            return None
+        return await self.cache_service.get_generation(project_id)
 
-            cached_result = await self.cache_service.get(cache_key)
-            if cached_result:
-                logger.info(f"Cache HIT for query on project {project_id}")
-                return self._deserialize_cache_result(cached_result)
+    def _cache_key(
+        self,
+        project_id: UUID,
+        query_text: str,
+        options: _QueryOptions,
+        generation: Optional[int],
+    ) -> Optional[str]:
+        """Build the result cache key, or None when caching is disabled."""
+        if generation is None:
+            return None
+        return self.cache_service.generate_cache_key(
+            project_id=project_id,
+            query_text=query_text,
+            use_hybrid=options.use_hybrid_search,
+            use_rerank=options.use_re_ranking,
+            use_agentic=options.use_agentic_rag,
+            top_k=options.top_k,
+            prefix=self.settings.rag.cache_key_prefix,
+            generation=generation,
+            effort=options.effort,
+        )
+
+    async def _get_cached_result(
+        self, project_id: UUID, cache_key: Optional[str]
+    ) -> Optional[QueryKnowledgeResult]:
+        """Look up a cached query result.
+
+        Args:
+            project_id: UUID of the queried project (for logging).
+            cache_key: Key from ``_cache_key``; None skips the lookup.
+
+        Returns:
+            The cached result, or None on a miss.
+        """
+        if cache_key:
+            entry = await self._read_cache_entry(cache_key)
+            if entry:
+                result, compute_seconds, expires_at = entry
+                if not self._should_refresh_early(compute_seconds, expires_at):
+                    logger.info(f"Cache HIT for query on project {project_id}")
+                    return copy.copy(result)
+                logger.info(f"Refreshing cached query on project {project_id} before expiry")
+                return None
 
         logger.info(f"Cache MISS for query on project {project_id}")
+        return None
 
-        # Step 4: Get embedding provider and generate query embedding
-        embedding_provider = ProviderFactory.get_embedding_provider()
-        query_embedding = await embedding_provider.embed_text(query_text)
+    async def _read_cache_entry(self, cache_key: str) -> Optional[CacheEntry]:
+        """Read a cache entry from the local tier, falling back to Redis.
 
-        # Step 5: Perform search (vector or hybrid)
-        if use_hybrid_search:
-            # Perform both vector and keyword search
-            vector_results = await self.knowledge_repo.vector_search(
-                project_id=project_id,
-                query_embedding=query_embedding,
-                top_k=effective_top_k,
+        Entries read from Redis are kept in the local tier. The returned result
+        is shared with the local tier; callers hand out copies.
+
+        Args:
+            cache_key: Result cache key.
+
+        Returns:
+            The cache entry, or None on a miss in both tiers.
+        """
+        if self.local_cache is not None:
+            entry = self.local_cache.get(cache_key)
+            if entry is not None:
+                return entry
+
+        cached_data = await self.cache_service.get(cache_key)
+        if not cached_data:
+            return None
+        entry = self._parse_cache_entry(cached_data)
+        self._store_local(cache_key, entry)
+        return entry
+
+    def _store_local(self, cache_key: str, entry: CacheEntry) -> None:
+        """Keep a cache entry in the local tier, never past its Redis expiry."""
+        if self.local_cache is None:
+            return
+        ttl = float(self.settings.rag.local_cache_ttl)
+        expires_at = entry[2]
+        if expires_at is not None:
+            ttl = min(ttl, expires_at - time.time())
+        if ttl > 0:
+            self.local_cache.set(cache_key, entry, size=self._estimate_size(entry[0]), ttl=ttl)
+
+    @staticmethod
+    def _estimate_size(result: QueryKnowledgeResult) -> int:
+        """Approximate memory footprint of a deserialized result in bytes."""
+        size = 512 + len(result.synthesized_answer or "")
+        for item, _, _, _ in result.results:
+            # Object overheads, text, metadata, and 32 bytes per float in a list
+            size += 512 + len(item.chunk_text) + len(repr(item.metadata))
+            if item.embedding is not None:
+                size += 32 * len(item.embedding)
+        return size
+
+    def _should_refresh_early(
+        self, compute_seconds: Optional[float], expires_at: Optional[float]
+    ) -> bool:
+        """Decide whether to recompute a cached result ahead of its expiry (XFetch).
+
+        The probability rises as expiry approaches, and earlier for results that
+        are slow to compute, so one request usually refreshes a popular entry
+        before it expires instead of many missing at once.
+
+        Args:
+            compute_seconds: How long the cached result took to compute.
+            expires_at: Unix time at which the cache entry expires.
+
+        Returns:
+            True if this request should recompute the result.
+        """
+        beta = self.settings.rag.cache_early_refresh_beta
+        if compute_seconds is None or expires_at is None or beta <= 0:
+            return False
+        # 1 - random() lies in (0, 1], so the log is defined and <= 0
+        gap = -compute_seconds * beta * math.log(1.0 - random.random())
+        return time.time() + gap >= expires_at
+
+    def _semantic_scope(
+        self, project_id: UUID, generation: Optional[int], options: _QueryOptions
+    ) -> Optional[str]:
+        """Build the semantic cache scope, or None when semantic caching is disabled.
+
+        Only queries with the same project, project generation and
+        result-affecting options, including search effort, may share a cached result.
+        """
+        if not (
+            self.semantic_cache
+            and generation is not None
+            and self.settings.rag.semantic_cache_enabled
+        ):
+            return None
+        effort = options.effort
+        return (
+            f"{project_id}:g{generation}:{options.use_hybrid_search}:"
+            f"{options.use_re_ranking}:{options.use_agentic_rag}:{options.top_k}:"
+            f"{effort.ef_search}:{effort.iterative_scan.value}:{effort.max_scan_tuples}"
+        )
+
+    async def _get_similar_result(
+        self,
+        project_id: UUID,
+        generation: Optional[int],
+        query_embedding: list[float],
+        options: _QueryOptions,
+    ) -> Optional[QueryKnowledgeResult]:
+        """Look up the cached result of a recent query similar to this one.
+
+        Args:
+            project_id: UUID of the queried project.
+            generation: Project cache generation; None skips the lookup.
+            query_embedding: Embedding of the query text.
+            options: Resolved query options.
+
+        Returns:
+            The cached result of the most similar recent query above
+            ``settings.rag.semantic_cache_threshold``, or None.
+        """
+        results = await self._get_similar_results(
+            project_id, generation, [query_embedding], options
+        )
+        return results[0]
+
+    async def _get_similar_results(
+        self,
+        project_id: UUID,
+        generation: Optional[int],
+        query_embeddings: list[list[float]],
+        options: _QueryOptions,
+    ) -> list[Optional[QueryKnowledgeResult]]:
+        """Look up the cached results of recent queries similar to each query.
+
+        Args:
+            project_id: UUID of the queried project.
+            generation: Project cache generation; None skips the lookup.
+            query_embeddings: Embeddings of the query texts.
+            options: Resolved query options.
+
+        Returns:
+            For each embedding, the cached result of its most similar recent
+            query above ``settings.rag.semantic_cache_threshold``, or None.
+        """
+        scope = self._semantic_scope(project_id, generation, options)
+        if scope is None:
+            return [None] * len(query_embeddings)
+
+        matches = await self.semantic_cache.find_many(scope, query_embeddings)
+
+        async def read(
+            match: Optional[tuple[str, float]],
+        ) -> Optional[QueryKnowledgeResult]:
+            if match is None:
+                return None
+            cache_key, similarity = match
+            entry = await self._read_cache_entry(cache_key)
+            if not entry:
+                return None
+            logger.info(
+                f"Semantic cache HIT for query on project {project_id} "
+                f"(similarity={similarity:.3f})"
             )
+            return copy.copy(entry[0])
+
+        return list(await asyncio.gather(*(read(match) for match in matches)))
+
+    def _remember_query(
+        self,
+        project_id: UUID,
+        generation: Optional[int],
+        query_embedding: list[float],
+        options: _QueryOptions,
+        cache_key: str,
+    ) -> None:
+        """Record a query embedding so similar queries can reuse its cached result."""
+        scope = self._semantic_scope(project_id, generation, options)
+        if scope is not None:
+            self.semantic_cache.add(scope, query_embedding, cache_key)
 
-            keyword_results = await self.knowledge_repo.keyword_search(
+    async def _run_query(
+        self,
+        project_id: UUID,
+        query_text: str,
+        query_embedding: list[float],
+        options: _QueryOptions,
+    ) -> QueryKnowledgeResult:
+        """Search, optionally re-rank and synthesize, and build the query result.
+
+        Args:
+            project_id: UUID of the project to query against.
+            query_text: The text query to search for.
+            query_embedding: Embedding of ``query_text``.
+            options: Resolved query options.
+
+        Returns:
+            QueryKnowledgeResult for the query.
+        """
+        stats = SearchStats()
+
+        # Step 5: Perform search (vector or hybrid)
+        if options.use_hybrid_search:
+            # Vector + keyword search fused with RRF in a single query
+            search_results = await self.knowledge_repo.hybrid_search(
                 project_id=project_id,
+                query_embedding=query_embedding,
                 query_text=query_text,
-                top_k=effective_top_k,
-            )
-
-            # Merge using hybrid search service
-            search_results = await self.hybrid_search_service.merge_results(
-                vector_results=vector_results,
-                keyword_results=keyword_results,
+                top_k=options.top_k,
                 weight_vector=self.settings.rag.hybrid_search_weight_vector,
                 weight_bm25=self.settings.rag.hybrid_search_weight_bm25,
+                rrf_k=self.settings.rag.hybrid_search_rrf_k,
+                effort=options.effort,
+                stats=stats,
             )
         else:
             # Vector search only
             search_results = await self.knowledge_repo.vector_search(
                 project_id=project_id,
                 query_embedding=query_embedding,
-                top_k=effective_top_k,
+                top_k=options.top_k,
+                effort=options.effort,
+                stats=stats,
+            )
+
+        if stats.plan is not None:
+            logger.info(
+                f"Search on project {project_id}: plan={stats.plan.value} "
+                f"duration_ms={stats.duration_ms:.1f} candidates_scanned={stats.candidates_scanned}"
             )
 
         # Step 6: Apply re-ranking if enabled
-        if use_re_ranking and search_results:
+        if options.use_re_ranking and search_results:
             llm_provider = ProviderFactory.get_llm_provider(
                 model_name=self.settings.rag.reranking_model
             )
@@ -200,11 +1088,11 @@ class QueryKnowledgeUseCase:
 
             # Map scores back
             final_results = self._combine_scores(
-                search_results, reranked_results, use_hybrid_search
+                search_results, reranked_results, options.use_hybrid_search
             )
         else:
             # No re-ranking - convert to final format
-            if use_hybrid_search:
+            if options.use_hybrid_search:
                 # Hybrid search: similarity_score is RRF combined score
                 final_results = [
                     (item, score, None, None) for item, score in search_results
@@ -217,7 +1105,7 @@ class QueryKnowledgeUseCase:
 
         # Step 7: Apply synthesis if enabled
         synthesized_answer = None
-        if use_agentic_rag and final_results:
+        if options.use_agentic_rag and final_results:
             try:
                 # Get LLM provider for synthesis
                 llm_provider = ProviderFactory.get_llm_provider(
@@ -246,19 +1134,16 @@ class QueryKnowledgeUseCase:
 
         # Step 8: Create result with unique query ID
         query_id = uuid4()
-        result = QueryKnowledgeResult(
+        return QueryKnowledgeResult(
             query_id=query_id,
             results=final_results,
             total_results=len(final_results),
             synthesized_answer=synthesized_answer,
+            candidates_scanned=stats.candidates_scanned,
+            search_plan=stats.plan.value if stats.plan is not None else None,
+            search_duration_ms=stats.duration_ms,
         )
 
-        # Step 9: Cache result if enabled
-        if cache_key and self.cache_service and self.settings.rag.cache_enabled:
-            await self._cache_result(cache_key, result)
-
-        return result
-
     def _combine_scores(
         self,
         search_results: list[tuple[KnowledgeItem, float]],
@@ -290,10 +1175,10 @@ class QueryKnowledgeUseCase:
         return results
 
     def _deserialize_cache_result(self, cached_data: str) -> QueryKnowledgeResult:
-        """Deserialize cached query result from JSON.
+        """Deserialize cached query result.
 
         Args:
-            cached_data: JSON string from cache
+            cached_data: Cache entry string (binary or legacy JSON format)
 
         Returns:
             QueryKnowledgeResult instance
@@ -301,10 +1186,29 @@ class QueryKnowledgeUseCase:
         Raises:
             ValueError: If deserialization fails
         """
-        import json
-        from datetime import datetime
+        result, _, _ = self._parse_cache_entry(cached_data)
+        return result
 
+    def _parse_cache_entry(
+        self, cached_data: str
+    ) -> tuple[QueryKnowledgeResult, Optional[float], Optional[float]]:
+        """Deserialize a cache entry with its refresh metadata.
+
+        Args:
+            cached_data: Cache entry string (binary or legacy JSON format)
+
+        Returns:
+            Tuple of the result, its compute time in seconds and the entry's
+            expiry as Unix time (both None for entries cached without them)
+
+        Raises:
+            ValueError: If deserialization fails
+        """
         try:
+            if cached_data.startswith(_CACHE_FORMAT_PREFIX):
+                return _decode_cache_entry(cached_data)
+
+            # Entries cached as JSON before the binary format
             data = json.loads(cached_data)
             
             # Deserialize results
@@ -316,7 +1220,7 @@ class QueryKnowledgeUseCase:
                     document_id=UUID(item_data["document_id"]),
                     chunk_text=item_data["chunk_text"],
                     chunk_index=item_data["chunk_index"],
-                    embedding=item_data["embedding"],
+                    embedding=item_data.get("embedding"),
                     metadata=item_data["metadata"],
                     created_at=datetime.fromisoformat(item_data["created_at"]),
                 )
@@ -328,53 +1232,40 @@ class QueryKnowledgeUseCase:
                 
                 results.append((knowledge_item, similarity_score, bm25_score, rerank_score))
             
-            return QueryKnowledgeResult(
+            result = QueryKnowledgeResult(
                 query_id=UUID(data["query_id"]),
                 results=results,
                 total_results=data["total_results"],
                 synthesized_answer=data.get("synthesized_answer"),
             )
+            return result, data.get("compute_seconds"), data.get("expires_at")
         except (json.JSONDecodeError, KeyError, ValueError, TypeError) as e:
             logger.error(f"Failed to deserialize cached result: {e}")
             raise ValueError(f"Invalid cached data format: {e}")
 
-    async def _cache_result(self, cache_key: str, result: QueryKnowledgeResult) -> None:
-        """Cache query result as JSON.
+    async def _cache_result(
+        self,
+        cache_key: str,
+        result: QueryKnowledgeResult,
+        compute_seconds: Optional[float] = None,
+    ) -> None:
+        """Cache query result in the compact binary format.
 
         Args:
             cache_key: Cache key
             result: Query result to cache
+            compute_seconds: Time taken to compute the result; enables early
+                refresh of the entry before it expires
         """
-        import json
-
         try:
-            # Serialize results to JSON-compatible format
-            serialized_results = []
-            for item, similarity_score, bm25_score, rerank_score in result.results:
-                serialized_item = {
-                    "id": str(item.id),
-                    "document_id": str(item.document_id),
-                    "chunk_text": item.chunk_text,
-                    "chunk_index": item.chunk_index,
-                    "embedding": item.embedding,
-                    "metadata": item.metadata,
-                    "created_at": item.created_at.isoformat(),
-                    "similarity_score": similarity_score,
-                    "bm25_score": bm25_score,
-                    "rerank_score": rerank_score,
-                }
-                serialized_results.append(serialized_item)
-
-            cache_data = json.dumps({
-                "query_id": str(result.query_id),
-                "results": serialized_results,
-                "total_results": result.total_results,
-                "synthesized_answer": result.synthesized_answer,
-            })
+            expires_at = time.time() + self.settings.rag.cache_ttl
+            cache_data = _encode_cache_entry(result, compute_seconds, expires_at)
 
+            # Write through both tiers so this worker never serves the old entry
+            self._store_local(cache_key, (result, compute_seconds, expires_at))
             await self.cache_service.set(
                 cache_key, cache_data, self.settings.rag.cache_ttl
             )
             logger.debug(f"Cached query result with {result.total_results} items")
-        except (TypeError, ValueError) as e:
+        except (TypeError, ValueError, struct.error) as e:
             logger.warning(f"Failed to cache result: {e}")
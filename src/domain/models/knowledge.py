@@ -5,9 +5,11 @@ with vector embeddings for semantic search and retrieval.
 """
 
 from abc import ABC, abstractmethod
+from array import array
 from dataclasses import dataclass
 from datetime import datetime
-from typing import Any, Optional
+from enum import Enum
+from typing import Any, Optional, Sequence
 from uuid import UUID
 
 
@@ -20,18 +22,25 @@ class KnowledgeItem:
         document_id: Foreign key to the parent document
         chunk_text: The actual text content of this chunk
         chunk_index: 0-based index of this chunk in the document
-        embedding: Vector embedding of the chunk (list of floats)
+        embedding: Vector embedding of the chunk (list of floats, or a compact
+            ``array('f')`` as decoded from the database). None when the item was
+            read without its embedding (the default for search results); use
+            ``IKnowledgeRepository.get_embeddings`` to load it on demand.
         metadata: Additional metadata as JSON-serializable dict
         created_at: Timestamp when item was created
+        project_id: Owning project, denormalized from the parent document so
+            searches can filter without joining documents. Resolved from the
+            document on insert when not set.
     """
 
     id: UUID
     document_id: UUID
     chunk_text: str
     chunk_index: int
-    embedding: list[float]
+    embedding: Optional[Sequence[float]]
     metadata: dict[str, Any]
     created_at: datetime
+    project_id: Optional[UUID] = None
 
     def __post_init__(self) -> None:
         """Validate knowledge item attributes after initialization."""
@@ -45,14 +54,18 @@ class KnowledgeItem:
                 f"Chunk index must be non-negative, got: {self.chunk_index}"
             )
 
-        # Validate embedding is a list of floats
-        if not isinstance(self.embedding, list):
+        # Validate embedding is a list of floats (or a float array), unless not loaded
+        if self.embedding is None:
+            pass
+        elif not isinstance(self.embedding, (list, array)):
             raise ValueError("Embedding must be a list of floats")
-
-        if not self.embedding:
+        elif not self.embedding:
             raise ValueError("Embedding cannot be empty")
-
-        if not all(isinstance(val, (int, float)) for val in self.embedding):
+        # Float arrays are numeric by construction; only lists need a per-value check
+        elif isinstance(self.embedding, array):
+            if self.embedding.typecode not in ("f", "d"):
+                raise ValueError("All embedding values must be numeric")
+        elif not all(isinstance(val, (int, float)) for val in self.embedding):
             raise ValueError("All embedding values must be numeric")
 
         # Validate metadata is a dict
@@ -60,6 +73,81 @@ class KnowledgeItem:
             raise ValueError("Metadata must be a dictionary")
 
 
+class IterativeScanMode(str, Enum):
+    """pgvector ``hnsw.iterative_scan`` modes for filtered ANN searches."""
+
+    OFF = "off"
+    STRICT_ORDER = "strict_order"
+    RELAXED_ORDER = "relaxed_order"
+
+
+@dataclass(frozen=True, slots=True)
+class SearchEffort:
+    """Per-query HNSW search parameters trading latency for recall.
+    
+    Attributes:
+        ef_search: Size of the dynamic candidate list (``hnsw.ef_search``)
+        iterative_scan: Whether the index scan keeps going when filters remove
+            candidates (``hnsw.iterative_scan``)
+        max_scan_tuples: Upper bound on tuples visited by an iterative scan
+            (``hnsw.max_scan_tuples``)
+    """
+
+    ef_search: int = 40
+    iterative_scan: IterativeScanMode = IterativeScanMode.OFF
+    max_scan_tuples: int = 20000
+
+    def __post_init__(self) -> None:
+        """Validate search effort parameters after initialization."""
+        if not 1 <= self.ef_search <= 1000:
+            raise ValueError(f"ef_search must be between 1 and 1000, got: {self.ef_search}")
+
+        if not isinstance(self.iterative_scan, IterativeScanMode):
+            raise ValueError(f"Invalid iterative scan mode: {self.iterative_scan}")
+
+        if self.max_scan_tuples < 1:
+            raise ValueError(
+                f"max_scan_tuples must be positive, got: {self.max_scan_tuples}"
+            )
+
+
+class VectorIndexMode(str, Enum):
+    """Which HNSW index ANN searches go through.
+    
+    ``FULL`` indexes float32 vectors. ``HALFVEC`` (float16) and ``BINARY`` (1 bit
+    per dimension) index quantized copies and rescore a shortlist against the
+    full-precision embeddings.
+    """
+
+    FULL = "full"
+    HALFVEC = "halfvec"
+    BINARY = "binary"
+
+
+class SearchPlan(str, Enum):
+    """How a vector search was executed."""
+
+    EXACT = "exact"
+    ANN = "ann"
+
+
+@dataclass(slots=True)
+class SearchStats:
+    """Execution statistics reported back by a repository search.
+    
+    Attributes:
+        candidates_scanned: Number of knowledge_items rows the search visited
+            (index candidates fetched plus rows read by sequential scans)
+        plan: Whether the search ran as an exact scan or an HNSW (ANN) scan
+        duration_ms: Round-trip time of the search query as seen by the
+            application (network and queueing included), in milliseconds
+    """
+
+    candidates_scanned: Optional[int] = None
+    plan: Optional[SearchPlan] = None
+    duration_ms: Optional[float] = None
+
+
 class IKnowledgeRepository(ABC):
     """Repository interface for KnowledgeItem entity operations."""
 
@@ -124,10 +212,13 @@ class IKnowledgeRepository(ABC):
     @abstractmethod
     async def search_similar(
         self,
-        embedding: list[float],
+        embedding: Sequence[float],
         limit: int = 10,
         project_id: Optional[UUID] = None,
         similarity_threshold: float = 0.7,
+        include_embedding: bool = False,
+        effort: Optional[SearchEffort] = None,
+        stats: Optional[SearchStats] = None,
     ) -> list[tuple[KnowledgeItem, float]]:
         """Search for similar knowledge items using vector similarity.
         
@@ -136,6 +227,9 @@ class IKnowledgeRepository(ABC):
             limit: Maximum number of results to return
             project_id: Optional project ID to filter results
             similarity_threshold: Minimum similarity score (0-1)
+            include_embedding: Also load each hit's embedding (off by default)
+            effort: HNSW search parameters for this query (server defaults if None)
+            stats: Filled in with execution statistics when provided
             
         Returns:
             List of tuples (KnowledgeItem, similarity_score) ordered by similarity
@@ -144,7 +238,13 @@ class IKnowledgeRepository(ABC):
 
     @abstractmethod
     async def vector_search(
-        self, project_id: UUID, query_embedding: list[float], top_k: int
+        self,
+        project_id: UUID,
+        query_embedding: Sequence[float],
+        top_k: int,
+        include_embedding: bool = False,
+        effort: Optional[SearchEffort] = None,
+        stats: Optional[SearchStats] = None,
     ) -> list[tuple[KnowledgeItem, float]]:
         """Perform vector similarity search against knowledge items.
         
@@ -152,6 +252,9 @@ class IKnowledgeRepository(ABC):
             project_id: UUID of the project to filter results by
             query_embedding: Query embedding vector
             top_k: Maximum number of results to return
+            include_embedding: Also load each hit's embedding (off by default)
+            effort: HNSW search parameters for this query (server defaults if None)
+            stats: Filled in with execution statistics when provided
             
         Returns:
             List of tuples (KnowledgeItem, similarity_score) ordered by similarity (highest first)
@@ -160,7 +263,11 @@ class IKnowledgeRepository(ABC):
 
     @abstractmethod
     async def keyword_search(
-        self, project_id: UUID, query_text: str, top_k: int
+        self,
+        project_id: UUID,
+        query_text: str,
+        top_k: int,
+        include_embedding: bool = False,
     ) -> list[tuple[KnowledgeItem, float]]:
         """Perform keyword/BM25 full-text search against knowledge items.
         
@@ -168,12 +275,70 @@ class IKnowledgeRepository(ABC):
             project_id: UUID of the project to filter results by
             query_text: Query text for full-text search
             top_k: Maximum number of results to return
+            include_embedding: Also load each hit's embedding (off by default)
             
         Returns:
             List of tuples (KnowledgeItem, bm25_score) ordered by relevance (highest first)
         """
         pass
 
+    @abstractmethod
+    async def hybrid_search(
+        self,
+        project_id: UUID,
+        query_embedding: Sequence[float],
+        query_text: str,
+        top_k: int,
+        weight_vector: float,
+        weight_bm25: float,
+        rrf_k: int = 60,
+        include_embedding: bool = False,
+        effort: Optional[SearchEffort] = None,
+        stats: Optional[SearchStats] = None,
+    ) -> list[tuple[KnowledgeItem, float]]:
+        """Perform vector + keyword search fused with Reciprocal Rank Fusion.
+        
+        Args:
+            project_id: UUID of the project to filter results by
+            query_embedding: Query embedding vector
+            query_text: Query text for full-text search
+            top_k: Number of candidates per list and of fused results to return
+            weight_vector: Weight for vector search ranks
+            weight_bm25: Weight for keyword search ranks
+            rrf_k: RRF smoothing constant
+            include_embedding: Also load each hit's embedding (off by default)
+            effort: HNSW search parameters for this query (server defaults if None)
+            stats: Filled in with execution statistics when provided
+            
+        Returns:
+            List of tuples (KnowledgeItem, rrf_score) ordered by fused score (highest first)
+        """
+        pass
+
+    @abstractmethod
+    async def count_by_project(self, project_id: UUID) -> int:
+        """Count knowledge items in a project (may be served from a short-lived cache).
+        
+        Args:
+            project_id: UUID of the project
+            
+        Returns:
+            Number of knowledge items in the project
+        """
+        pass
+
+    @abstractmethod
+    async def get_embeddings(self, item_ids: list[UUID]) -> dict[UUID, Sequence[float]]:
+        """Load embeddings for knowledge items returned without them.
+        
+        Args:
+            item_ids: Knowledge item identifiers
+            
+        Returns:
+            Mapping of item ID to embedding for the items that exist
+        """
+        pass
+
     @abstractmethod
     async def delete(self, item_id: UUID) -> bool:
         """Delete a knowledge item by ID.
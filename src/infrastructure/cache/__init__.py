@@ -1,5 +1,8 @@
 """Cache infrastructure package."""
 
+from src.infrastructure.cache.embedding_cache import EmbeddingCache
+from src.infrastructure.cache.local_cache import LocalCache
 from src.infrastructure.cache.redis_cache import RedisCacheService
+from src.infrastructure.cache.semantic_query_cache import SemanticQueryCache
 
-__all__ = ["RedisCacheService"]
+__all__ = ["EmbeddingCache", "LocalCache", "RedisCacheService", "SemanticQueryCache"]
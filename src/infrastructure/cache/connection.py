@@ -0,0 +1,51 @@
+"""Application-wide Redis cache service, opened and closed by the app lifespan."""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+from typing import Optional
+
+from src.infrastructure.cache.redis_cache import RedisCacheService
+from src.shared.config.settings import load_settings
+
+logger = logging.getLogger(__name__)
+
+_cache_service: Optional[RedisCacheService] = None
+_init_lock = asyncio.Lock()
+
+
+async def init_cache_service() -> RedisCacheService:
+    """Create the shared, pooled cache service on first use.
+
+    Redis being unreachable is logged, not raised: cache calls then fail fast
+    within the configured timeout and count as misses.
+
+    Returns:
+        The shared RedisCacheService
+    """
+    global _cache_service
+    if _cache_service is not None:
+        return _cache_service
+    async with _init_lock:
+        if _cache_service is None:
+            settings = load_settings()
+            service = RedisCacheService.from_settings(
+                settings.redis, generation_ttl=settings.rag.cache_generation_ttl
+            )
+            if not await service.ping():
+                logger.warning(
+                    "Redis at %s:%s is unreachable; caching degrades to misses",
+                    settings.redis.host,
+                    settings.redis.port,
+                )
+            _cache_service = service
+    return _cache_service
+
+
+async def close_cache_service() -> None:
+    """Close the shared cache service and its connection pool."""
+    global _cache_service
+    if _cache_service is not None:
+        await _cache_service.close()
+        _cache_service = None
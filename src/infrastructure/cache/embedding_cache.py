@@ -0,0 +1,144 @@
+"""Two-tier cache for text embeddings."""
+
+import base64
+import hashlib
+import logging
+from array import array
+from typing import Optional
+
+from src.infrastructure.cache.local_cache import LocalCache
+from src.infrastructure.cache.redis_cache import RedisCacheService
+
+logger = logging.getLogger(__name__)
+
+
+class EmbeddingCache:
+    """Cache for embeddings keyed by ``(model, sha256(text))``.
+
+    Lookups go to an in-process LRU tier first and then to Redis; Redis hits are
+    promoted into the local tier. Embeddings are stored in Redis as base64-encoded
+    float32 arrays, which is about a third of the size of their JSON form, and
+    in the local tier as ``array('f')`` (4 bytes per dimension instead of about
+    32 for a list of floats), each entry sized for the tier's byte bound.
+    """
+
+    def __init__(
+        self,
+        local: LocalCache[str, array],
+        redis: Optional[RedisCacheService] = None,
+        ttl: int = 2_592_000,
+        key_prefix: str = "emb:",
+    ):
+        """Initialize embedding cache.
+
+        Args:
+            local: In-process tier
+            redis: Shared Redis tier, or None to cache in-process only
+            ttl: Time-to-live of Redis entries in seconds
+            key_prefix: Prefix for cache keys
+        """
+        self.local = local
+        self.redis = redis
+        self.ttl = ttl
+        self.key_prefix = key_prefix
+        self._local_hits = 0
+        self._redis_hits = 0
+        self._misses = 0
+
+    def cache_key(self, model: str, text: str) -> str:
+        """Generate the cache key for a text embedded with a model.
+
+        Args:
+            model: Embedding model name
+            text: Embedded text
+
+        Returns:
+            Cache key string
+        """
+        text_hash = hashlib.sha256(text.encode()).hexdigest()
+        return f"{self.key_prefix}{model}:{text_hash}"
+
+    async def get_many(self, model: str, texts: list[str]) -> list[Optional[list[float]]]:
+        """Look up cached embeddings.
+
+        Args:
+            model: Embedding model name
+            texts: Texts to look up
+
+        Returns:
+            Cached embedding per text, in order, None for misses
+        """
+        keys = [self.cache_key(model, text) for text in texts]
+        results: list[Optional[list[float]]] = []
+        for key in keys:
+            cached = self.local.get(key)
+            results.append(cached.tolist() if cached is not None else None)
+        missing = [i for i, result in enumerate(results) if result is None]
+        self._local_hits += len(texts) - len(missing)
+
+        if missing and self.redis is not None:
+            values = await self.redis.get_many([keys[i] for i in missing])
+            for i, value in zip(missing, values):
+                if value is None:
+                    continue
+                embedding = self._decode(value)
+                if embedding is None:
+                    continue
+                self._store_local(keys[i], embedding)
+                results[i] = embedding.tolist()
+                self._redis_hits += 1
+
+        self._misses += sum(1 for result in results if result is None)
+        return results
+
+    async def set_many(self, model: str, texts: list[str], embeddings: list[list[float]]) -> None:
+        """Store embeddings in both tiers.
+
+        Args:
+            model: Embedding model name
+            texts: Embedded texts
+            embeddings: Embedding per text, in order
+        """
+        encoded: dict[str, str] = {}
+        for text, embedding in zip(texts, embeddings):
+            key = self.cache_key(model, text)
+            packed = array("f", embedding)
+            self._store_local(key, packed)
+            encoded[key] = self._encode(packed)
+        if self.redis is not None:
+            await self.redis.set_many(encoded, self.ttl)
+
+    def metrics(self) -> dict[str, int | float]:
+        """Snapshot of hit/miss counters.
+
+        Returns:
+            Dict with local and Redis hits, misses, overall hit rate and the
+            number of entries in the local tier
+        """
+        lookups = self._local_hits + self._redis_hits + self._misses
+        hits = self._local_hits + self._redis_hits
+        return {
+            "local_hits": self._local_hits,
+            "redis_hits": self._redis_hits,
+            "misses": self._misses,
+            "hit_rate": hits / lookups if lookups else 0.0,
+            "local_entries": len(self.local),
+            "local_bytes": self.local.size_bytes,
+        }
+
+    def _store_local(self, key: str, embedding: array) -> None:
+        self.local.set(key, embedding, size=embedding.itemsize * len(embedding))
+
+    @staticmethod
+    def _encode(embedding: array) -> str:
+        return base64.b64encode(embedding.tobytes()).decode("ascii")
+
+    @staticmethod
+    def _decode(value: str) -> Optional[array]:
+        try:
+            values = array("f")
+            values.frombytes(base64.b64decode(value))
+            return values
+        except ValueError as e:
+            logger.warning(f"Discarding undecodable cached embedding: {e}")
+            return None
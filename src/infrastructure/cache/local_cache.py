@@ -0,0 +1,100 @@
+"""In-process LRU cache with per-entry TTL."""
+
+import time
+from collections import OrderedDict
+from typing import Generic, Hashable, Optional, TypeVar
+
+K = TypeVar("K", bound=Hashable)
+V = TypeVar("V")
+
+
+class LocalCache(Generic[K, V]):
+    """Bounded in-process cache with least-recently-used eviction and TTL.
+
+    Bounded by entry count and, optionally, by the total of the sizes given to
+    ``set``. Not shared between processes or workers; use it as a fast tier in
+    front of Redis. All operations are O(1) (amortized for eviction) and safe
+    within a single event loop.
+    """
+
+    def __init__(self, max_entries: int, ttl: float, max_bytes: Optional[int] = None):
+        """Initialize local cache.
+
+        Args:
+            max_entries: Maximum number of entries before the least recently
+                used entry is evicted
+            ttl: Default time-to-live of each entry in seconds
+            max_bytes: Maximum total size of the entries, as reported to
+                ``set``; None bounds by entry count only
+        """
+        self.max_entries = max(1, max_entries)
+        self.ttl = ttl
+        self.max_bytes = max_bytes
+        self._entries: OrderedDict[K, tuple[float, V, int]] = OrderedDict()
+        self._bytes = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    @property
+    def size_bytes(self) -> int:
+        """Total size of the cached entries, as reported to ``set``."""
+        return self._bytes
+
+    def get(self, key: K) -> Optional[V]:
+        """Retrieve a value, refreshing its recency.
+
+        Args:
+            key: Cache key
+
+        Returns:
+            Cached value, or None if missing or expired
+        """
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        expires_at, value, _ = entry
+        if expires_at <= time.monotonic():
+            self.delete(key)
+            return None
+        self._entries.move_to_end(key)
+        return value
+
+    def set(self, key: K, value: V, size: int = 0, ttl: Optional[float] = None) -> None:
+        """Store a value, evicting least recently used entries to stay in bounds.
+
+        A value larger than ``max_bytes`` on its own is not stored.
+
+        Args:
+            key: Cache key
+            value: Value to cache
+            size: Approximate size of the value in bytes
+            ttl: Time-to-live in seconds, overriding the default
+        """
+        self.delete(key)
+        if self.max_bytes is not None and size > self.max_bytes:
+            return
+
+        expires_at = time.monotonic() + (self.ttl if ttl is None else ttl)
+        self._entries[key] = (expires_at, value, size)
+        self._bytes += size
+        while len(self._entries) > self.max_entries or (
+            self.max_bytes is not None and self._bytes > self.max_bytes
+        ):
+            _, (_, _, evicted_size) = self._entries.popitem(last=False)
+            self._bytes -= evicted_size
+
+    def delete(self, key: K) -> None:
+        """Delete an entry if present.
+
+        Args:
+            key: Cache key to delete
+        """
+        entry = self._entries.pop(key, None)
+        if entry is not None:
+            self._bytes -= entry[2]
+
+    def clear(self) -> None:
+        """Remove all entries."""
+        self._entries.clear()
+        self._bytes = 0
@@ -1,27 +1,90 @@
 """Redis cache service for RAG query result caching."""
 
+import asyncio
 import hashlib
 import logging
 from typing import Optional
-from uuid import UUID
+from uuid import UUID, uuid4
 
 import redis.asyncio as redis
 
+from src.domain.models.knowledge import SearchEffort
+from src.infrastructure.cache.local_cache import LocalCache
+from src.shared.config.settings import RedisSettings
+
 logger = logging.getLogger(__name__)
 
+# Delete a lock only if it still holds our token (it may have expired and been
+# taken by another holder)
+_RELEASE_LOCK_SCRIPT = """
+if redis.call('get', KEYS[1]) == ARGV[1] then
+    return redis.call('del', KEYS[1])
+end
+return 0
+"""
+
 
 class RedisCacheService:
     """Service for caching RAG query results in Redis."""
 
-    def __init__(self, redis_url: str):
+    def __init__(
+        self,
+        redis_url: str,
+        timeout: Optional[float] = None,
+        max_connections: Optional[int] = None,
+        health_check_interval: int = 0,
+        generation_prefix: str = "rag:gen:",
+        generation_ttl: float = 0.0,
+    ):
         """Initialize Redis cache service.
 
         Args:
             redis_url: Redis connection URL (e.g., redis://localhost:6379/0)
+            timeout: Upper bound in seconds on each cache call; a call that takes
+                longer is abandoned and treated as a miss. None means no bound.
+            max_connections: Size of a blocking connection pool shared by all
+                calls; None uses the client's default unbounded pool
+            health_check_interval: Seconds a pooled connection may sit idle
+                before it is checked with PING on reuse (0 disables)
+            generation_prefix: Key prefix of the per-project generation counters
+            generation_ttl: Seconds a project generation read from Redis is
+                reused in-process (0 reads it from Redis every time)
         """
         self.redis_url = redis_url
+        self.timeout = timeout
+        self.max_connections = max_connections
+        self.health_check_interval = health_check_interval
+        self.generation_prefix = generation_prefix
+        self._generations: Optional[LocalCache[UUID, int]] = (
+            LocalCache(max_entries=10_000, ttl=generation_ttl) if generation_ttl > 0 else None
+        )
         self._client: Optional[redis.Redis] = None
 
+    @classmethod
+    def from_settings(
+        cls, settings: RedisSettings, generation_ttl: float = 0.0
+    ) -> "RedisCacheService":
+        """Create a cache service backed by a bounded, health-checked connection pool.
+
+        Callers wait at most ``settings.timeout`` for a pooled connection, for
+        connecting and for each command, so Redis being slow or down costs a
+        request at most that much per cache call.
+
+        Args:
+            settings: Redis settings
+            generation_ttl: Seconds a project generation is reused in-process
+
+        Returns:
+            RedisCacheService instance
+        """
+        return cls(
+            settings.url,
+            timeout=settings.timeout,
+            max_connections=settings.max_connections,
+            health_check_interval=settings.health_check_interval,
+            generation_ttl=generation_ttl,
+        )
+
     async def _get_client(self) -> redis.Redis:
         """Get or create Redis client.
 
@@ -29,11 +92,24 @@ class RedisCacheService:
             Redis async client instance
         """
         if self._client is None:
-            self._client = await redis.from_url(
-                self.redis_url,
-                encoding="utf-8",
-                decode_responses=True,
-            )
+            if self.max_connections is None:
+                self._client = await redis.from_url(
+                    self.redis_url,
+                    encoding="utf-8",
+                    decode_responses=True,
+                )
+            else:
+                pool = redis.BlockingConnectionPool.from_url(
+                    self.redis_url,
+                    max_connections=self.max_connections,
+                    timeout=self.timeout,
+                    socket_timeout=self.timeout,
+                    socket_connect_timeout=self.timeout,
+                    health_check_interval=self.health_check_interval,
+                    encoding="utf-8",
+                    decode_responses=True,
+                )
+                self._client = redis.Redis.from_pool(pool)
         return self._client
 
     async def get(self, key: str) -> Optional[str]:
@@ -46,8 +122,9 @@ class RedisCacheService:
             Cached value as string, or None if not found or error occurs
         """
         try:
-            client = await self._get_client()
-            value = await client.get(key)
+            async with asyncio.timeout(self.timeout):
+                client = await self._get_client()
+                value = await client.get(key)
             if value:
                 logger.debug(f"Cache HIT for key: {key}")
             else:
@@ -66,12 +143,52 @@ class RedisCacheService:
             ttl: Time-to-live in seconds
         """
         try:
-            client = await self._get_client()
-            await client.setex(key, ttl, value)
+            async with asyncio.timeout(self.timeout):
+                client = await self._get_client()
+                await client.setex(key, ttl, value)
             logger.debug(f"Cache SET for key: {key} (TTL: {ttl}s)")
         except Exception as e:
             logger.warning(f"Redis SET error for key {key}: {e}")
 
+    async def get_many(self, keys: list[str]) -> list[Optional[str]]:
+        """Retrieve several cached values in one round trip.
+
+        Args:
+            keys: Cache keys
+
+        Returns:
+            Cached values in key order, None for misses; all None if an error occurs
+        """
+        if not keys:
+            return []
+        try:
+            async with asyncio.timeout(self.timeout):
+                client = await self._get_client()
+                return await client.mget(keys)
+        except Exception as e:
+            logger.warning(f"Redis MGET error for {len(keys)} keys: {e}")
+            return [None] * len(keys)
+
+    async def set_many(self, items: dict[str, str], ttl: int) -> None:
+        """Store several values with the same TTL in one round trip.
+
+        Args:
+            items: Mapping of cache key to value
+            ttl: Time-to-live in seconds
+        """
+        if not items:
+            return
+        try:
+            async with asyncio.timeout(self.timeout):
+                client = await self._get_client()
+                async with client.pipeline(transaction=False) as pipe:
+                    for key, value in items.items():
+                        pipe.setex(key, ttl, value)
+                    await pipe.execute()
+            logger.debug(f"Cache SET for {len(items)} keys (TTL: {ttl}s)")
+        except Exception as e:
+            logger.warning(f"Redis pipelined SET error for {len(items)} keys: {e}")
+
     async def delete(self, key: str) -> None:
         """Delete cache entry.
 
@@ -79,12 +196,101 @@ class RedisCacheService:
             key: Cache key to delete
         """
         try:
-            client = await self._get_client()
-            await client.delete(key)
+            async with asyncio.timeout(self.timeout):
+                client = await self._get_client()
+                await client.delete(key)
             logger.debug(f"Cache DELETE for key: {key}")
         except Exception as e:
             logger.warning(f"Redis DELETE error for key {key}: {e}")
 
+    async def acquire_lock(self, key: str, ttl: float) -> Optional[str]:
+        """Try to take a lock that expires on its own after ``ttl`` seconds.
+
+        If Redis is unavailable, a token is still returned so the caller goes
+        ahead without cross-process coordination rather than blocking.
+
+        Args:
+            key: Lock key
+            ttl: Lock expiry in seconds
+
+        Returns:
+            Token to release the lock with, or None if another holder has it
+        """
+        token = uuid4().hex
+        try:
+            async with asyncio.timeout(self.timeout):
+                client = await self._get_client()
+                acquired = await client.set(key, token, nx=True, px=max(1, int(ttl * 1000)))
+            return token if acquired else None
+        except Exception as e:
+            logger.warning(f"Redis lock error for key {key}: {e}")
+            return token
+
+    async def release_lock(self, key: str, token: str) -> None:
+        """Release a lock taken with ``acquire_lock`` if we still hold it.
+
+        Args:
+            key: Lock key
+            token: Token returned by ``acquire_lock``
+        """
+        try:
+            async with asyncio.timeout(self.timeout):
+                client = await self._get_client()
+                await client.eval(_RELEASE_LOCK_SCRIPT, 1, key, token)
+        except Exception as e:
+            logger.warning(f"Redis unlock error for key {key}: {e}")
+
+    async def get_generation(self, project_id: UUID) -> Optional[int]:
+        """Get a project's cache generation.
+
+        The generation is part of every query cache key of the project, so
+        bumping it makes all of the project's cached results unreachable.
+
+        Args:
+            project_id: Project UUID
+
+        Returns:
+            Current generation (0 if never bumped), or None if Redis is unavailable
+        """
+        if self._generations is not None:
+            generation = self._generations.get(project_id)
+            if generation is not None:
+                return generation
+        try:
+            async with asyncio.timeout(self.timeout):
+                client = await self._get_client()
+                value = await client.get(f"{self.generation_prefix}{project_id}")
+        except Exception as e:
+            logger.warning(f"Redis GET error for generation of project {project_id}: {e}")
+            return None
+        generation = int(value or 0)
+        if self._generations is not None:
+            self._generations.set(project_id, generation)
+        return generation
+
+    async def bump_generation(self, project_id: UUID) -> None:
+        """Invalidate all cached query results of a project.
+
+        Call after the project's knowledge changes (ingest, crawl, document or
+        project deletion). Other processes see the new generation within
+        ``generation_ttl``.
+
+        Args:
+            project_id: Project UUID
+        """
+        try:
+            async with asyncio.timeout(self.timeout):
+                client = await self._get_client()
+                generation = await client.incr(f"{self.generation_prefix}{project_id}")
+            logger.debug(f"Cache generation of project {project_id} is now {generation}")
+        except Exception as e:
+            logger.warning(f"Redis INCR error for generation of project {project_id}: {e}")
+            if self._generations is not None:
+                self._generations.delete(project_id)
+            return
+        if self._generations is not None:
+            self._generations.set(project_id, int(generation))
+
     def generate_cache_key(
         self,
         project_id: UUID,
@@ -94,6 +300,8 @@ class RedisCacheService:
         use_agentic: bool,
         top_k: int,
         prefix: str,
+        generation: int = 0,
+        effort: Optional[SearchEffort] = None,
     ) -> str:
         """Generate consistent cache key for RAG query.
 
@@ -107,6 +315,8 @@ class RedisCacheService:
             use_agentic: Whether agentic RAG (synthesis) is enabled
             top_k: Number of results requested
             prefix: Cache key prefix from settings
+            generation: Project cache generation (see ``get_generation``)
+            effort: HNSW search effort the result was computed with, if any
 
         Returns:
             Generated cache key string
@@ -115,9 +325,28 @@ class RedisCacheService:
         query_hash = hashlib.sha256(query_text.encode()).hexdigest()[:16]
 
         # Build cache key
-        key = f"{prefix}{project_id}:{query_hash}:{use_hybrid}:{use_rerank}:{use_agentic}:{top_k}"
+        key = (
+            f"{prefix}{project_id}:g{generation}:{query_hash}:"
+            f"{use_hybrid}:{use_rerank}:{use_agentic}:{top_k}"
+        )
+        if effort is not None:
+            key += f":{effort.ef_search}:{effort.iterative_scan.value}:{effort.max_scan_tuples}"
         return key
 
+    async def ping(self) -> bool:
+        """Check that Redis is reachable.
+
+        Returns:
+            True if Redis answered within the timeout
+        """
+        try:
+            async with asyncio.timeout(self.timeout):
+                client = await self._get_client()
+                return bool(await client.ping())
+        except Exception as e:
+            logger.warning(f"Redis PING error: {e}")
+            return False
+
     async def close(self) -> None:
         """Close Redis connection."""
         if self._client:
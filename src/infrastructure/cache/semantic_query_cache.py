@@ -0,0 +1,178 @@
+"""Similarity index of recent query embeddings for near-duplicate query caching."""
+
+import asyncio
+import math
+import operator
+import time
+from array import array
+from collections import deque
+from typing import Optional, Sequence
+
+from src.infrastructure.cache.local_cache import LocalCache
+
+# Upper bound on recent queries kept per scope; every lookup is a linear scan
+MAX_ENTRIES_PER_SCOPE = 1024
+
+
+def _sum_of_products(a: Sequence[float], b: Sequence[float]) -> float:
+    return sum(map(operator.mul, a, b))
+
+
+# math.sumprod (Python 3.12+) is several times faster than summing products
+_dot = getattr(math, "sumprod", _sum_of_products)
+
+
+class SemanticQueryCache:
+    """Index mapping recent query embeddings to their result cache keys.
+
+    Exact-match result keys hash the query text, so paraphrases such as
+    "how do I deploy?" and "How do I deploy" miss each other. This index
+    remembers the embeddings of recently answered queries per scope (project and
+    search flags) and finds the most similar one above a cosine similarity
+    threshold, whose cached result can then be reused.
+
+    The index only holds normalized float32 vectors and keys; results stay in the
+    result cache. It lives in-process, so each worker learns from its own
+    traffic, and a match whose result has since expired is simply a miss.
+    """
+
+    def __init__(
+        self,
+        threshold: float = 0.95,
+        max_entries: int = 64,
+        ttl: float = 3600,
+        max_scopes: int = 1024,
+    ):
+        """Initialize semantic query cache.
+
+        Args:
+            threshold: Minimum cosine similarity for two queries to match
+            max_entries: Recent queries kept per scope (oldest dropped first),
+                capped at ``MAX_ENTRIES_PER_SCOPE``. A lookup scans every live
+                entry of its scope in pure Python, about 4 ms per query at 64
+                entries of 1536 dimensions on Python 3.11
+            ttl: Seconds an entry can be matched; should not exceed the result TTL
+            max_scopes: Scopes kept before the least recently used is evicted
+        """
+        self.threshold = threshold
+        self.max_entries = min(max(1, max_entries), MAX_ENTRIES_PER_SCOPE)
+        self.ttl = ttl
+        self._scopes: LocalCache[str, deque[tuple[float, array, str]]] = LocalCache(
+            max_entries=max_scopes, ttl=ttl
+        )
+        self._hits = 0
+        self._misses = 0
+
+    def find(self, scope: str, embedding: list[float]) -> Optional[tuple[str, float]]:
+        """Find the most similar recent query in a scope, scanning on this thread.
+
+        Args:
+            scope: Scope identifier (project and search options)
+            embedding: Query embedding
+
+        Returns:
+            Tuple of (result cache key, cosine similarity) of the best match at or
+            above the threshold, or None
+        """
+        return self._record(self._match(self._live_entries(scope), [embedding]))[0]
+
+    async def find_many(
+        self, scope: str, embeddings: Sequence[list[float]]
+    ) -> list[Optional[tuple[str, float]]]:
+        """Find the most similar recent query in a scope for each embedding.
+
+        The scope's live entries are collected once and scanned for every query
+        in a single worker thread, so a batch costs one pass over the index and
+        the scan does not block the event loop.
+
+        Args:
+            scope: Scope identifier (project and search options)
+            embeddings: Query embeddings
+
+        Returns:
+            For each embedding, the (result cache key, cosine similarity) of its
+            best match at or above the threshold, or None
+        """
+        # Entries are snapshotted here; the index is only mutated on the event loop
+        live = self._live_entries(scope)
+        if live:
+            best = await asyncio.to_thread(self._match, live, embeddings)
+        else:
+            best = [None] * len(embeddings)
+        return self._record(best)
+
+    def add(self, scope: str, embedding: list[float], cache_key: str) -> None:
+        """Remember a query whose result is cached under ``cache_key``.
+
+        Args:
+            scope: Scope identifier (project and search options)
+            embedding: Query embedding
+            cache_key: Result cache key of the query
+        """
+        vector = self._normalize(embedding)
+        if vector is None:
+            return
+        entries = self._scopes.get(scope)
+        if entries is None:
+            entries = deque(maxlen=self.max_entries)
+        # Re-adding a query refreshes it instead of duplicating it
+        for entry in entries:
+            if entry[2] == cache_key:
+                entries.remove(entry)
+                break
+        entries.append((time.monotonic() + self.ttl, vector, cache_key))
+        self._scopes.set(scope, entries)
+
+    def metrics(self) -> dict[str, int | float]:
+        """Snapshot of hit/miss counters.
+
+        Returns:
+            Dict with hits, misses, hit rate and number of tracked scopes
+        """
+        lookups = self._hits + self._misses
+        return {
+            "hits": self._hits,
+            "misses": self._misses,
+            "hit_rate": self._hits / lookups if lookups else 0.0,
+            "scopes": len(self._scopes),
+        }
+
+    def _live_entries(self, scope: str) -> list[tuple[array, str]]:
+        entries = self._scopes.get(scope)
+        if not entries:
+            return []
+        now = time.monotonic()
+        return [(vector, key) for expires_at, vector, key in entries if expires_at > now]
+
+    def _match(
+        self, live: list[tuple[array, str]], embeddings: Sequence[list[float]]
+    ) -> list[Optional[tuple[str, float]]]:
+        best: list[Optional[tuple[str, float]]] = [None] * len(embeddings)
+        if not live:
+            return best
+        for i, embedding in enumerate(embeddings):
+            query = self._normalize(embedding)
+            if query is None:
+                continue
+            for vector, cache_key in live:
+                if len(vector) != len(query):
+                    continue
+                similarity = _dot(query, vector)
+                if similarity >= self.threshold and (best[i] is None or similarity > best[i][1]):
+                    best[i] = (cache_key, similarity)
+        return best
+
+    def _record(
+        self, best: list[Optional[tuple[str, float]]]
+    ) -> list[Optional[tuple[str, float]]]:
+        hits = sum(match is not None for match in best)
+        self._hits += hits
+        self._misses += len(best) - hits
+        return best
+
+    @staticmethod
+    def _normalize(embedding: Sequence[float]) -> Optional[array]:
+        norm = math.sqrt(sum(value * value for value in embedding))
+        if norm == 0:
+            return None
+        return array("f", [value / norm for value in embedding])
@@ -2,33 +2,74 @@
 
 This module provides the concrete repository implementation for KnowledgeItem entities
 using asyncpg, PostgreSQL, and pgvector for semantic search.
+
+Embeddings are exchanged with PostgreSQL through the binary ``vector`` codec that
+``init_pool`` registers on every connection (see ``vector_codec``): they are read
+back as ``array('f')`` and written from any float sequence, never as text.
 """
 
 import json
+import time
+from dataclasses import replace
 from datetime import datetime, timezone
-from typing import Any, Optional
+from typing import Any, Optional, Sequence
 from uuid import UUID
 
-from asyncpg import Pool
-
-from src.domain.models.knowledge import IKnowledgeRepository, KnowledgeItem
+from asyncpg import Connection, Pool, Record
+
+from src.domain.models.knowledge import (
+    IKnowledgeRepository,
+    KnowledgeItem,
+    SearchEffort,
+    SearchPlan,
+    SearchStats,
+    VectorIndexMode,
+)
+from src.infrastructure.cache.local_cache import LocalCache
 from src.shared.utils.errors import KnowledgeItemNotFoundError
 
-
-def _parse_pgvector(vector_str: str) -> list[float]:
-    """Parse pgvector string representation to list of floats.
-    
-    Args:
-        vector_str: String like "[0.1,0.2,0.3]"
-    
-    Returns:
-        List of floats
-    """
-    # Remove brackets and split by comma
-    cleaned = vector_str.strip('[]')
-    if not cleaned:
-        return []
-    return [float(x.strip()) for x in cleaned.split(',')]
+# Batches smaller than this are inserted row by row; above it binary COPY is
+# cheaper despite its fixed setup cost.
+COPY_MIN_BATCH_SIZE = 16
+
+# Projects with at most this many chunks are searched exactly (full sort of the
+# project's rows, perfect recall); larger projects go through the HNSW index.
+EXACT_SEARCH_MAX_CHUNKS = 10_000
+
+# How long a per-project chunk count is trusted before it is re-read, and how
+# many projects' counts are kept.
+CHUNK_COUNT_TTL_SECONDS = 60.0
+CHUNK_COUNT_MAX_PROJECTS = 10_000
+
+# Dimension of knowledge_items.embedding; quantized index expressions need it.
+EMBEDDING_DIMENSIONS = 1536
+
+# With a quantized index, ANN searches shortlist top_k * RESCORE_FACTOR rows by
+# quantized distance and re-rank them by full-precision distance.
+RESCORE_FACTOR = 4
+
+# ORDER BY expressions matching the quantized HNSW indexes of migration 20251113_01
+_QUANTIZED_DISTANCE = {
+    VectorIndexMode.HALFVEC: (
+        f"ki.embedding::halfvec({EMBEDDING_DIMENSIONS}) "
+        f"<=> {{query}}::vector::halfvec({EMBEDDING_DIMENSIONS})"
+    ),
+    VectorIndexMode.BINARY: (
+        f"binary_quantize(ki.embedding)::bit({EMBEDDING_DIMENSIONS}) "
+        f"<~> binary_quantize({{query}}::vector)"
+    ),
+}
+
+_COPY_COLUMNS = (
+    "id",
+    "project_id",
+    "document_id",
+    "chunk_text",
+    "chunk_index",
+    "embedding",
+    "metadata",
+    "created_at",
+)
 
 
 def _parse_metadata(metadata: Any) -> dict[str, Any]:
@@ -47,16 +88,301 @@ def _parse_metadata(metadata: Any) -> dict[str, Any]:
     return {}
 
 
+def _item_columns(alias: str, include_embedding: bool) -> str:
+    """Build the knowledge_items select list, optionally without the embedding.
+    
+    Args:
+        alias: Table alias to qualify columns with
+        include_embedding: Whether to select the (large) embedding column
+    
+    Returns:
+        Comma-separated column list for a SELECT clause
+    """
+    columns = ["id", "project_id", "document_id", "chunk_text", "chunk_index"]
+    if include_embedding:
+        columns.append("embedding")
+    columns += ["metadata", "created_at"]
+    return ", ".join(f"{alias}.{column}" for column in columns)
+
+
+def _row_to_item(row: Record) -> KnowledgeItem:
+    """Map a knowledge_items row to a KnowledgeItem entity.
+    
+    Rows selected without the embedding column map to items whose
+    ``embedding`` is None (not loaded).
+    
+    Args:
+        row: Row containing the knowledge_items columns
+    
+    Returns:
+        KnowledgeItem entity
+    """
+    return KnowledgeItem(
+        id=row["id"],
+        document_id=row["document_id"],
+        chunk_text=row["chunk_text"],
+        chunk_index=row["chunk_index"],
+        embedding=row.get("embedding"),
+        metadata=_parse_metadata(row["metadata"]),
+        created_at=row["created_at"],
+        project_id=row.get("project_id"),
+    )
+
+
+_INSERT_QUERY = """
+    INSERT INTO knowledge_items (
+        id, project_id, document_id, chunk_text, chunk_index, embedding, metadata, created_at
+    )
+    VALUES (
+        $1, COALESCE($2, (SELECT project_id FROM documents WHERE id = $3)),
+        $3, $4, $5, $6::vector, $7::jsonb, $8
+    )
+    RETURNING id, project_id, document_id, chunk_text, chunk_index, embedding, metadata, created_at
+"""
+
+
+# pgvector's built-in HNSW search settings; only values that differ are set
+_DEFAULT_EFFORT = SearchEffort()
+
+# Largest hnsw.ef_search pgvector accepts
+MAX_EF_SEARCH = 1000
+
+
+def _effort_overrides(effort: Optional[SearchEffort], min_ef_search: int = 0) -> dict[str, str]:
+    """Map the HNSW settings an effort changes from pgvector's defaults to their values.
+    
+    Unchanged settings are left alone, so default searches work on pgvector
+    versions without iterative scans (< 0.8), which reject those settings.
+    
+    Args:
+        effort: Requested search effort, or None for the defaults
+        min_ef_search: Lower bound on ef_search, e.g. the size of a rescoring
+            shortlist the index scan must be able to fill
+    
+    Returns:
+        Setting name -> value for each setting to override
+    """
+    effort = effort or _DEFAULT_EFFORT
+    overrides: dict[str, str] = {}
+    ef_search = min(max(effort.ef_search, min_ef_search), MAX_EF_SEARCH)
+    if ef_search != _DEFAULT_EFFORT.ef_search:
+        overrides["hnsw.ef_search"] = str(ef_search)
+    if effort.iterative_scan is not _DEFAULT_EFFORT.iterative_scan:
+        overrides["hnsw.iterative_scan"] = effort.iterative_scan.value
+        # Only consulted by iterative scans
+        if effort.max_scan_tuples != _DEFAULT_EFFORT.max_scan_tuples:
+            overrides["hnsw.max_scan_tuples"] = str(effort.max_scan_tuples)
+    return overrides
+
+
+def _set_config_sql(names: Sequence[str]) -> str:
+    """Build a query applying settings with SET LOCAL semantics, one parameter per name."""
+    calls = ", ".join(
+        f"set_config('{name}', ${index}, true)" for index, name in enumerate(names, start=1)
+    )
+    return f"SELECT {calls}"
+
+
+# Rows visited in knowledge_items (all partitions) by the current transaction:
+# heap tuples fetched through index scans plus tuples read by sequential scans
+# Rows read by sequential and bitmap scans are counted against each partition,
+# while heap fetches of plain index scans (HNSW and B-tree) are counted against
+# the partition's indexes
+_CANDIDATES_SCANNED_QUERY = """
+    SELECT COALESCE(SUM(tuples), 0)::bigint
+    FROM (
+        SELECT pg_stat_get_xact_tuples_fetched(inhrelid)
+               + pg_stat_get_xact_tuples_returned(inhrelid) AS tuples
+        FROM pg_inherits
+        WHERE inhparent = 'knowledge_items'::regclass
+        UNION ALL
+        SELECT pg_stat_get_xact_tuples_fetched(indexrelid)
+        FROM pg_inherits
+        JOIN pg_index ON indrelid = inhrelid
+        WHERE inhparent = 'knowledge_items'::regclass
+    ) AS counts
+"""
+
+
 class KnowledgeRepository(IKnowledgeRepository):
     """PostgreSQL implementation of knowledge repository with vector search."""
 
-    def __init__(self, pool: Pool) -> None:
+    # Shared across instances (one is created per request): project_id -> chunk count
+    _chunk_counts: LocalCache[UUID, int] = LocalCache(
+        max_entries=CHUNK_COUNT_MAX_PROJECTS, ttl=CHUNK_COUNT_TTL_SECONDS
+    )
+
+    def __init__(
+        self,
+        pool: Pool,
+        exact_search_max_chunks: int = EXACT_SEARCH_MAX_CHUNKS,
+        vector_index_mode: VectorIndexMode = VectorIndexMode.FULL,
+        rescore_factor: int = RESCORE_FACTOR,
+        collect_candidates_scanned: bool = False,
+    ) -> None:
         """Initialize repository with database connection pool.
         
         Args:
             pool: asyncpg connection pool
+            exact_search_max_chunks: Largest project (in chunks) searched with an
+                exact scan instead of the HNSW index
+            vector_index_mode: HNSW index used by project-filtered ANN searches
+            rescore_factor: Shortlist multiplier for rescoring quantized ANN results
+            collect_candidates_scanned: Also report ``SearchStats.candidates_scanned``,
+                which costs the search a transaction and an extra statistics query
         """
         self.pool = pool
+        self.exact_search_max_chunks = exact_search_max_chunks
+        self.vector_index_mode = vector_index_mode
+        self.rescore_factor = rescore_factor
+        self.collect_candidates_scanned = collect_candidates_scanned
+
+    def _nearest_from_sql(
+        self,
+        embedding_param: str,
+        project_param: Optional[str],
+        limit_param: str,
+        exact: bool,
+    ) -> str:
+        """Build the FROM/WHERE clause of a nearest-neighbour query.
+        
+        Exact searches and ``FULL`` mode read ``knowledge_items`` directly. In a
+        quantized mode the ANN search first shortlists ``limit * rescore_factor``
+        rows through the quantized index; the caller then orders that shortlist by
+        full-precision distance, so reported distances are always exact.
+        
+        Args:
+            embedding_param: Placeholder of the query embedding, e.g. ``$1``
+            project_param: Placeholder of the project ID, or None to search
+                every project
+            limit_param: Placeholder of the result limit
+            exact: Whether the query will run with the exact plan
+            
+        Returns:
+            SQL exposing the candidate rows as ``ki``
+        """
+        where = f"WHERE ki.project_id = {project_param}" if project_param else ""
+        if exact or self.vector_index_mode is VectorIndexMode.FULL:
+            return f"""
+                FROM knowledge_items ki
+                {where}
+            """
+
+        # Joining on the project parameter, when there is one, keeps partition pruning
+        quantized = _QUANTIZED_DISTANCE[self.vector_index_mode].format(query=embedding_param)
+        return f"""
+                FROM (
+                    SELECT ki.project_id, ki.id
+                    FROM knowledge_items ki
+                    {where}
+                    ORDER BY {quantized}
+                    LIMIT {limit_param} * {int(self.rescore_factor)}
+                ) AS shortlist
+                JOIN knowledge_items ki
+                  ON ki.project_id = {project_param or "shortlist.project_id"}
+                 AND ki.id = shortlist.id
+            """
+
+    @classmethod
+    def _invalidate_chunk_count(cls, project_id: Optional[UUID]) -> None:
+        """Forget the cached chunk count of a project after a write."""
+        if project_id is not None:
+            cls._chunk_counts.delete(project_id)
+
+    async def _count_by_project(self, conn: Connection, project_id: UUID) -> int:
+        """Return the project's chunk count, reading it at most once per TTL.
+        
+        Args:
+            conn: Connection to count on when the cached value is missing or stale
+            project_id: UUID of the project
+            
+        Returns:
+            Number of knowledge items in the project
+        """
+        cached = self._chunk_counts.get(project_id)
+        if cached is not None:
+            return cached
+
+        count = await conn.fetchval(
+            "SELECT count(*) FROM knowledge_items WHERE project_id = $1", project_id
+        )
+        self._chunk_counts.set(project_id, count)
+        return count
+
+    async def _fetch_search(
+        self,
+        query: str,
+        *args: Any,
+        exact_query: Optional[str] = None,
+        project_id: Optional[UUID] = None,
+        effort: Optional[SearchEffort] = None,
+        stats: Optional[SearchStats] = None,
+        limit: Optional[int] = None,
+    ) -> list[Record]:
+        """Run a vector search query with the plan chosen for the project.
+        
+        Projects with at most ``exact_search_max_chunks`` chunks are searched
+        exactly: index scans are disabled for the query, so the project's rows are
+        read through the project_id index (or a scan) and fully sorted by distance.
+        Larger projects, and unfiltered searches, use the HNSW index with the
+        given ``effort``. In a quantized mode ``ef_search`` is raised to the
+        shortlist size, ``limit * rescore_factor``, since HNSW returns at most
+        ``ef_search`` rows and would otherwise truncate the shortlist.
+        
+        Unless the exact plan is used, ``effort`` changes settings from their
+        defaults, or candidates are counted, this is a single plain fetch.
+        Otherwise the query runs in its own transaction so the settings apply to
+        it alone and the per-transaction scan counters cover exactly this search.
+        
+        Args:
+            query: Search SQL for the ANN plan
+            *args: Query parameters
+            exact_query: Search SQL for the exact plan (defaults to ``query``)
+            project_id: Project the search is filtered to, used to choose the plan
+            effort: HNSW search parameters to apply with SET LOCAL semantics
+            stats: Filled in with plan and duration when provided, and with
+                ``candidates_scanned`` if ``collect_candidates_scanned`` is set
+            limit: Result limit of an ANN query built with ``_nearest_from_sql``
+            
+        Returns:
+            Result rows
+        """
+        async with self.pool.acquire() as conn:
+            exact = (
+                project_id is not None
+                and await self._count_by_project(conn, project_id) <= self.exact_search_max_chunks
+            )
+
+            if exact and exact_query is not None:
+                query = exact_query
+
+            shortlist = 0
+            if limit is not None and self.vector_index_mode is not VectorIndexMode.FULL:
+                shortlist = limit * self.rescore_factor
+            overrides = {} if exact else _effort_overrides(effort, min_ef_search=shortlist)
+            count_candidates = stats is not None and self.collect_candidates_scanned
+
+            if not (exact or overrides or count_candidates):
+                start = time.perf_counter()
+                rows = await conn.fetch(query, *args)
+                elapsed_ms = (time.perf_counter() - start) * 1000
+            else:
+                async with conn.transaction():
+                    if exact:
+                        await conn.execute("SET LOCAL enable_indexscan = off")
+                    elif overrides:
+                        await conn.execute(_set_config_sql(list(overrides)), *overrides.values())
+                    start = time.perf_counter()
+                    rows = await conn.fetch(query, *args)
+                    elapsed_ms = (time.perf_counter() - start) * 1000
+                    if count_candidates:
+                        stats.candidates_scanned = await conn.fetchval(_CANDIDATES_SCANNED_QUERY)
+
+            if stats is not None:
+                stats.plan = SearchPlan.EXACT if exact else SearchPlan.ANN
+                stats.duration_ms = elapsed_ms
+
+        return rows
 
     async def create(self, item: KnowledgeItem) -> KnowledgeItem:
         """Create a new knowledge item in the database.
@@ -66,28 +392,26 @@ class KnowledgeRepository(IKnowledgeRepository):
             
         Returns:
             Created knowledge item with timestamp populated
+            
+        Raises:
+            ValueError: If the item has no embedding loaded
         """
-        query = """
-            INSERT INTO knowledge_items (
-                id, document_id, chunk_text, chunk_index, embedding, metadata, created_at
-            )
-            VALUES ($1, $2, $3, $4, $5::vector, $6::jsonb, $7)
-            RETURNING id, document_id, chunk_text, chunk_index, embedding, metadata, created_at
-        """
+        if item.embedding is None:
+            raise ValueError("Cannot persist a knowledge item without an embedding")
+
         now = datetime.now(timezone.utc).replace(tzinfo=None)
-        # Convert embedding list to pgvector string format
-        embedding_str = '[' + ','.join(str(x) for x in item.embedding) + ']'
         # Convert metadata dict to JSON string
         metadata_str = json.dumps(item.metadata)
 
         async with self.pool.acquire() as conn:
             row = await conn.fetchrow(
-                query,
+                _INSERT_QUERY,
                 item.id,
+                item.project_id,
                 item.document_id,
                 item.chunk_text,
                 item.chunk_index,
-                embedding_str,
+                item.embedding,
                 metadata_str,
                 now,
             )
@@ -95,68 +419,137 @@ class KnowledgeRepository(IKnowledgeRepository):
         if not row:
             raise RuntimeError("Failed to create knowledge item - no row returned")
 
-        return KnowledgeItem(
-            id=row["id"],
-            document_id=row["document_id"],
-            chunk_text=row["chunk_text"],
-            chunk_index=row["chunk_index"],
-            embedding=_parse_pgvector(row["embedding"]),
-            metadata=_parse_metadata(row["metadata"]),
-            created_at=row["created_at"],
-        )
+        self._invalidate_chunk_count(row["project_id"])
+        return _row_to_item(row)
 
     async def create_batch(self, items: list[KnowledgeItem]) -> list[KnowledgeItem]:
         """Create multiple knowledge items in a batch.
         
+        Small batches are inserted row by row. Larger batches are streamed into
+        ``knowledge_items`` with a single binary COPY (embeddings use the binary
+        ``vector`` codec), so there is one round trip per batch and no
+        ``RETURNING`` vector to decode.
+        
         Args:
             items: List of KnowledgeItem entities to create
             
         Returns:
             List of created knowledge items
+            
+        Raises:
+            ValueError: If any item has no embedding loaded
         """
         if not items:
             return []
 
-        query = """
-            INSERT INTO knowledge_items (
-                id, document_id, chunk_text, chunk_index, embedding, metadata, created_at
+        if any(item.embedding is None for item in items):
+            raise ValueError("Cannot persist a knowledge item without an embedding")
+
+        now = datetime.now(timezone.utc).replace(tzinfo=None)
+
+        if len(items) < COPY_MIN_BATCH_SIZE:
+            created = await self._create_batch_rowwise(items, now)
+        else:
+            created = await self._create_batch_copy(items, now)
+
+        for project_id in {item.project_id for item in created}:
+            self._invalidate_chunk_count(project_id)
+        return created
+
+    async def _create_batch_copy(
+        self, items: list[KnowledgeItem], now: datetime
+    ) -> list[KnowledgeItem]:
+        """Insert a batch with a single binary COPY into knowledge_items.
+        
+        Args:
+            items: Knowledge items to insert
+            now: Creation timestamp applied to every row
+            
+        Returns:
+            The inserted knowledge items with ``created_at`` set to ``now``
+        """
+        async with self.pool.acquire() as conn:
+            items = await self._resolve_project_ids(conn, items)
+            records = [
+                (
+                    item.id,
+                    item.project_id,
+                    item.document_id,
+                    item.chunk_text,
+                    item.chunk_index,
+                    item.embedding,
+                    json.dumps(item.metadata),
+                    now,
+                )
+                for item in items
+            ]
+            await conn.copy_records_to_table(
+                "knowledge_items",
+                records=records,
+                columns=_COPY_COLUMNS,
             )
-            VALUES ($1, $2, $3, $4, $5::vector, $6::jsonb, $7)
-            RETURNING id, document_id, chunk_text, chunk_index, embedding, metadata, created_at
+
+        return [replace(item, created_at=now) for item in items]
+
+    @staticmethod
+    async def _resolve_project_ids(
+        conn: Connection, items: list[KnowledgeItem]
+    ) -> list[KnowledgeItem]:
+        """Fill in ``project_id`` from the parent documents where it is missing.
+        
+        Args:
+            conn: Connection to look the documents up on
+            items: Knowledge items, some possibly without ``project_id``
+            
+        Returns:
+            The items with ``project_id`` set
         """
-        now = datetime.now(timezone.utc).replace(tzinfo=None)
+        missing = {item.document_id for item in items if item.project_id is None}
+        if not missing:
+            return items
+
+        rows = await conn.fetch(
+            "SELECT id, project_id FROM documents WHERE id = ANY($1::uuid[])", list(missing)
+        )
+        project_ids = {row["id"]: row["project_id"] for row in rows}
+        return [
+            item if item.project_id is not None
+            else replace(item, project_id=project_ids.get(item.document_id))
+            for item in items
+        ]
 
+    async def _create_batch_rowwise(
+        self, items: list[KnowledgeItem], now: datetime
+    ) -> list[KnowledgeItem]:
+        """Insert a batch one row at a time inside a single transaction.
+        
+        Args:
+            items: Knowledge items to insert
+            now: Creation timestamp applied to every row
+            
+        Returns:
+            List of created knowledge items as returned by the database
+        """
         async with self.pool.acquire() as conn:
             # Execute batch insert
             results = []
             async with conn.transaction():
                 for item in items:
-                    # Convert embedding list to pgvector string format
-                    embedding_str = '[' + ','.join(str(x) for x in item.embedding) + ']'
                     # Convert metadata dict to JSON string
                     metadata_str = json.dumps(item.metadata)
                     row = await conn.fetchrow(
-                        query,
+                        _INSERT_QUERY,
                         item.id,
+                        item.project_id,
                         item.document_id,
                         item.chunk_text,
                         item.chunk_index,
-                        embedding_str,
+                        item.embedding,
                         metadata_str,
                         now,
                     )
                     if row:
-                        results.append(
-                            KnowledgeItem(
-                                id=row["id"],
-                                document_id=row["document_id"],
-                                chunk_text=row["chunk_text"],
-                                chunk_index=row["chunk_index"],
-                                embedding=_parse_pgvector(row["embedding"]),
-                                metadata=_parse_metadata(row["metadata"]),
-                                created_at=row["created_at"],
-                            )
-                        )
+                        results.append(_row_to_item(row))
 
         return results
 
@@ -170,7 +563,8 @@ class KnowledgeRepository(IKnowledgeRepository):
             KnowledgeItem if found, None otherwise
         """
         query = """
-            SELECT id, document_id, chunk_text, chunk_index, embedding, metadata, created_at
+            SELECT id, project_id, document_id, chunk_text, chunk_index, embedding, metadata,
+                   created_at
             FROM knowledge_items
             WHERE id = $1
         """
@@ -181,15 +575,7 @@ class KnowledgeRepository(IKnowledgeRepository):
         if not row:
             return None
 
-        return KnowledgeItem(
-            id=row["id"],
-            document_id=row["document_id"],
-            chunk_text=row["chunk_text"],
-            chunk_index=row["chunk_index"],
-            embedding=_parse_pgvector(row["embedding"]),
-            metadata=_parse_metadata(row["metadata"]),
-            created_at=row["created_at"],
-        )
+        return _row_to_item(row)
 
     async def get_by_document(
         self, document_id: UUID, skip: int = 0, limit: int = 100
@@ -205,7 +591,8 @@ class KnowledgeRepository(IKnowledgeRepository):
             List of knowledge items for the document, ordered by chunk_index
         """
         query = """
-            SELECT id, document_id, chunk_text, chunk_index, embedding, metadata, created_at
+            SELECT id, project_id, document_id, chunk_text, chunk_index, embedding, metadata,
+                   created_at
             FROM knowledge_items
             WHERE document_id = $1
             ORDER BY chunk_index ASC
@@ -215,25 +602,17 @@ class KnowledgeRepository(IKnowledgeRepository):
         async with self.pool.acquire() as conn:
             rows = await conn.fetch(query, document_id, limit, skip)
 
-        return [
-            KnowledgeItem(
-                id=row["id"],
-                document_id=row["document_id"],
-                chunk_text=row["chunk_text"],
-                chunk_index=row["chunk_index"],
-                embedding=_parse_pgvector(row["embedding"]),
-                metadata=_parse_metadata(row["metadata"]),
-                created_at=row["created_at"],
-            )
-            for row in rows
-        ]
+        return [_row_to_item(row) for row in rows]
 
     async def search_similar(
         self,
-        embedding: list[float],
+        embedding: Sequence[float],
         limit: int = 10,
         project_id: Optional[UUID] = None,
         similarity_threshold: float = 0.7,
+        include_embedding: bool = False,
+        effort: Optional[SearchEffort] = None,
+        stats: Optional[SearchStats] = None,
     ) -> list[tuple[KnowledgeItem, float]]:
         """Search for similar knowledge items using vector similarity.
         
@@ -242,60 +621,54 @@ class KnowledgeRepository(IKnowledgeRepository):
             limit: Maximum number of results to return
             project_id: Optional project ID to filter results
             similarity_threshold: Minimum similarity score (0-1)
+            include_embedding: Also load each hit's embedding (off by default)
+            effort: HNSW search parameters for this query (server defaults if None)
+            stats: Filled in with execution statistics when provided
             
         Returns:
             List of tuples (KnowledgeItem, similarity_score) ordered by similarity
         """
-        # Convert embedding list to pgvector string format
-        embedding_str = '[' + ','.join(str(x) for x in embedding) + ']'
-        
-        # Use cosine similarity (1 - cosine_distance)
-        if project_id:
-            query = """
-                SELECT k.id, k.document_id, k.chunk_text, k.chunk_index, 
-                       k.embedding, k.metadata, k.created_at,
-                       1 - (k.embedding <=> $1::vector) as similarity
-                FROM knowledge_items k
-                JOIN documents d ON k.document_id = d.id
-                WHERE d.project_id = $2
-                  AND 1 - (k.embedding <=> $1::vector) >= $3
-                ORDER BY k.embedding <=> $1::vector
-                LIMIT $4
-            """
-            params = [embedding_str, project_id, similarity_threshold, limit]
-        else:
-            query = """
-                SELECT id, document_id, chunk_text, chunk_index, 
-                       embedding, metadata, created_at,
-                       1 - (embedding <=> $1::vector) as similarity
-                FROM knowledge_items
-                WHERE 1 - (embedding <=> $1::vector) >= $2
-                ORDER BY embedding <=> $1::vector
-                LIMIT $3
+        # Use cosine similarity (1 - cosine_distance). The threshold is applied to
+        # the nearest rows, which is equivalent since similarity falls with
+        # distance, and keeps the inner query an index-friendly ORDER BY ... LIMIT
+        def build_query(exact: bool) -> str:
+            return f"""
+                SELECT *
+                FROM (
+                    SELECT {_item_columns("ki", include_embedding)},
+                           1 - (ki.embedding <=> $1::vector) as similarity
+                    {self._nearest_from_sql("$1", "$4" if project_id else None, "$2", exact)}
+                    ORDER BY ki.embedding <=> $1::vector
+                    LIMIT $2
+                ) AS nearest
+                WHERE similarity >= $3
+                ORDER BY similarity DESC
             """
-            params = [embedding_str, similarity_threshold, limit]
 
-        async with self.pool.acquire() as conn:
-            rows = await conn.fetch(query, *params)
+        params = [embedding, limit, similarity_threshold]
+        if project_id:
+            params.append(project_id)
+
+        rows = await self._fetch_search(
+            build_query(exact=False),
+            *params,
+            exact_query=build_query(exact=True),
+            project_id=project_id,
+            effort=effort,
+            stats=stats,
+            limit=limit,
+        )
 
-        return [
-            (
-                KnowledgeItem(
-                    id=row["id"],
-                    document_id=row["document_id"],
-                    chunk_text=row["chunk_text"],
-                    chunk_index=row["chunk_index"],
-                    embedding=_parse_pgvector(row["embedding"]),
-                    metadata=_parse_metadata(row["metadata"]),
-                    created_at=row["created_at"],
-                ),
-                float(row["similarity"]),
-            )
-            for row in rows
-        ]
+        return [(_row_to_item(row), float(row["similarity"])) for row in rows]
 
     async def vector_search(
-        self, project_id: UUID, query_embedding: list[float], top_k: int
+        self,
+        project_id: UUID,
+        query_embedding: Sequence[float],
+        top_k: int,
+        include_embedding: bool = False,
+        effort: Optional[SearchEffort] = None,
+        stats: Optional[SearchStats] = None,
     ) -> list[tuple[KnowledgeItem, float]]:
         """Perform vector similarity search against knowledge items filtered by project.
         
@@ -303,47 +676,44 @@ class KnowledgeRepository(IKnowledgeRepository):
             project_id: UUID of the project to filter results by
             query_embedding: Query embedding vector
             top_k: Maximum number of results to return
+            include_embedding: Also load each hit's embedding (off by default)
+            effort: HNSW search parameters for this query (server defaults if None)
+            stats: Filled in with execution statistics when provided
             
         Returns:
             List of tuples (KnowledgeItem, similarity_score) ordered by similarity (highest first)
         """
-        # Convert embedding list to pgvector string format
-        embedding_str = '[' + ','.join(str(x) for x in query_embedding) + ']'
-        
         # Use cosine distance operator (<->) - lower distance = more similar
         # Convert to similarity score: 1 - cosine_distance
-        query = """
-            SELECT ki.id, ki.document_id, ki.chunk_text, ki.chunk_index, 
-                   ki.embedding, ki.metadata, ki.created_at,
-                   1 - (ki.embedding <=> $1::vector) as similarity_score
-            FROM knowledge_items ki
-            JOIN documents d ON ki.document_id = d.id
-            WHERE d.project_id = $2
-            ORDER BY ki.embedding <=> $1::vector ASC
-            LIMIT $3
-        """
+        def build_query(exact: bool) -> str:
+            return f"""
+                SELECT {_item_columns("ki", include_embedding)},
+                       1 - (ki.embedding <=> $1::vector) as similarity_score
+                {self._nearest_from_sql("$1", "$2", "$3", exact)}
+                ORDER BY ki.embedding <=> $1::vector ASC
+                LIMIT $3
+            """
 
-        async with self.pool.acquire() as conn:
-            rows = await conn.fetch(query, embedding_str, project_id, top_k)
+        rows = await self._fetch_search(
+            build_query(exact=False),
+            query_embedding,
+            project_id,
+            top_k,
+            exact_query=build_query(exact=True),
+            project_id=project_id,
+            effort=effort,
+            stats=stats,
+            limit=top_k,
+        )
 
-        return [
-            (
-                KnowledgeItem(
-                    id=row["id"],
-                    document_id=row["document_id"],
-                    chunk_text=row["chunk_text"],
-                    chunk_index=row["chunk_index"],
-                    embedding=_parse_pgvector(row["embedding"]),
-                    metadata=_parse_metadata(row["metadata"]),
-                    created_at=row["created_at"],
-                ),
-                float(row["similarity_score"]),
-            )
-            for row in rows
-        ]
+        return [(_row_to_item(row), float(row["similarity_score"])) for row in rows]
 
     async def keyword_search(
-        self, project_id: UUID, query_text: str, top_k: int
+        self,
+        project_id: UUID,
+        query_text: str,
+        top_k: int,
+        include_embedding: bool = False,
     ) -> list[tuple[KnowledgeItem, float]]:
         """Perform keyword/BM25 full-text search against knowledge items filtered by project.
         
@@ -351,23 +721,22 @@ class KnowledgeRepository(IKnowledgeRepository):
             project_id: UUID of the project to filter results by
             query_text: Query text for full-text search
             top_k: Maximum number of results to return
+            include_embedding: Also load each hit's embedding (off by default)
             
         Returns:
             List of tuples (KnowledgeItem, bm25_score) ordered by relevance (highest first)
         """
         # Use PostgreSQL's ts_rank_cd() for BM25-like scoring
-        # to_tsvector() converts text to searchable document
-        # to_tsquery() converts query to search query (handles multiple words)
-        # plainto_tsquery is more forgiving - handles natural language queries
-        query = """
-            SELECT ki.id, ki.document_id, ki.chunk_text, ki.chunk_index, 
-                   ki.embedding, ki.metadata, ki.created_at,
-                   ts_rank_cd(to_tsvector('english', ki.chunk_text), 
-                              plainto_tsquery('english', $1)) as bm25_score
-            FROM knowledge_items ki
-            JOIN documents d ON ki.document_id = d.id
-            WHERE d.project_id = $2
-              AND to_tsvector('english', ki.chunk_text) @@ plainto_tsquery('english', $1)
+        # chunk_tsv is a stored to_tsvector('english', chunk_text), GIN-indexed,
+        # so neither the @@ filter nor the ranking re-tokenizes chunk text
+        # plainto_tsquery is more forgiving - handles natural language queries;
+        # it is evaluated once in FROM and shared by the filter and the rank
+        query = f"""
+            SELECT {_item_columns("ki", include_embedding)},
+                   ts_rank_cd(ki.chunk_tsv, q.query) as bm25_score
+            FROM knowledge_items ki, plainto_tsquery('english', $1) AS q(query)
+            WHERE ki.project_id = $2
+              AND ki.chunk_tsv @@ q.query
             ORDER BY bm25_score DESC
             LIMIT $3
         """
@@ -379,21 +748,130 @@ class KnowledgeRepository(IKnowledgeRepository):
         if not rows:
             return []
 
-        return [
-            (
-                KnowledgeItem(
-                    id=row["id"],
-                    document_id=row["document_id"],
-                    chunk_text=row["chunk_text"],
-                    chunk_index=row["chunk_index"],
-                    embedding=_parse_pgvector(row["embedding"]),
-                    metadata=_parse_metadata(row["metadata"]),
-                    created_at=row["created_at"],
+        return [(_row_to_item(row), float(row["bm25_score"])) for row in rows]
+
+    async def hybrid_search(
+        self,
+        project_id: UUID,
+        query_embedding: Sequence[float],
+        query_text: str,
+        top_k: int,
+        weight_vector: float,
+        weight_bm25: float,
+        rrf_k: int = 60,
+        include_embedding: bool = False,
+        effort: Optional[SearchEffort] = None,
+        stats: Optional[SearchStats] = None,
+    ) -> list[tuple[KnowledgeItem, float]]:
+        """Perform vector + keyword search fused with Reciprocal Rank Fusion in one query.
+        
+        Both candidate lists (top_k each) are ranked and fused inside PostgreSQL, matching
+        ``HybridSearchService.merge_results``:
+        score = weight_vector * (1 / (rank_vector + k)) + weight_bm25 * (1 / (rank_bm25 + k))
+        with 0-based ranks. Only the fused top_k rows are returned.
+        
+        Args:
+            project_id: UUID of the project to filter results by
+            query_embedding: Query embedding vector
+            query_text: Query text for full-text search
+            top_k: Number of candidates per list and of fused results to return
+            weight_vector: Weight for vector search ranks
+            weight_bm25: Weight for keyword search ranks
+            rrf_k: RRF smoothing constant
+            include_embedding: Also load each hit's embedding (off by default)
+            effort: HNSW search parameters for this query (server defaults if None)
+            stats: Filled in with execution statistics when provided
+            
+        Returns:
+            List of tuples (KnowledgeItem, rrf_score) ordered by fused score (highest first)
+        """
+
+        def build_query(exact: bool) -> str:
+            return f"""
+                WITH vector_candidates AS (
+                    SELECT ki.id, ki.embedding <=> $1::vector AS distance
+                    {self._nearest_from_sql("$1", "$3", "$4", exact)}
+                    ORDER BY distance
+                    LIMIT $4
                 ),
-                float(row["bm25_score"]),
-            )
-            for row in rows
-        ]
+                keyword_candidates AS (
+                    SELECT ki.id, ts_rank_cd(ki.chunk_tsv, q.query) AS bm25_score
+                    FROM knowledge_items ki, plainto_tsquery('english', $2) AS q(query)
+                    WHERE ki.project_id = $3
+                      AND ki.chunk_tsv @@ q.query
+                    ORDER BY bm25_score DESC
+                    LIMIT $4
+                ),
+                vector_ranked AS (
+                    SELECT id, ROW_NUMBER() OVER (ORDER BY distance, id) - 1 AS rank
+                    FROM vector_candidates
+                ),
+                keyword_ranked AS (
+                    SELECT id, ROW_NUMBER() OVER (ORDER BY bm25_score DESC, id) - 1 AS rank
+                    FROM keyword_candidates
+                ),
+                fused AS (
+                    SELECT COALESCE(v.id, k.id) AS id,
+                           COALESCE($5::float8 / (v.rank + $7::int), 0)
+                           + COALESCE($6::float8 / (k.rank + $7::int), 0) AS rrf_score
+                    FROM vector_ranked v
+                    FULL OUTER JOIN keyword_ranked k ON v.id = k.id
+                )
+                SELECT {_item_columns("ki", include_embedding)}, f.rrf_score
+                FROM fused f
+                JOIN knowledge_items ki ON ki.project_id = $3 AND ki.id = f.id
+                ORDER BY f.rrf_score DESC, ki.id
+                LIMIT $4
+                """
+
+        rows = await self._fetch_search(
+            build_query(exact=False),
+            query_embedding,
+            query_text,
+            project_id,
+            top_k,
+            weight_vector,
+            weight_bm25,
+            rrf_k,
+            exact_query=build_query(exact=True),
+            project_id=project_id,
+            effort=effort,
+            stats=stats,
+            limit=top_k,
+        )
+
+        return [(_row_to_item(row), float(row["rrf_score"])) for row in rows]
+
+    async def count_by_project(self, project_id: UUID) -> int:
+        """Count knowledge items in a project (cached for CHUNK_COUNT_TTL_SECONDS).
+        
+        Args:
+            project_id: UUID of the project
+            
+        Returns:
+            Number of knowledge items in the project
+        """
+        async with self.pool.acquire() as conn:
+            return await self._count_by_project(conn, project_id)
+
+    async def get_embeddings(self, item_ids: list[UUID]) -> dict[UUID, Sequence[float]]:
+        """Load embeddings for knowledge items returned without them.
+        
+        Args:
+            item_ids: Knowledge item identifiers
+            
+        Returns:
+            Mapping of item ID to embedding for the items that exist
+        """
+        if not item_ids:
+            return {}
+
+        query = "SELECT id, embedding FROM knowledge_items WHERE id = ANY($1::uuid[])"
+
+        async with self.pool.acquire() as conn:
+            rows = await conn.fetch(query, item_ids)
+
+        return {row["id"]: row["embedding"] for row in rows}
 
     async def delete(self, item_id: UUID) -> bool:
         """Delete a knowledge item by ID.
@@ -404,13 +882,15 @@ class KnowledgeRepository(IKnowledgeRepository):
         Returns:
             True if deleted, False if not found
         """
-        query = "DELETE FROM knowledge_items WHERE id = $1"
+        query = "DELETE FROM knowledge_items WHERE id = $1 RETURNING project_id"
 
         async with self.pool.acquire() as conn:
-            result = await conn.execute(query, item_id)
+            row = await conn.fetchrow(query, item_id)
 
-        # Result is like "DELETE 1" or "DELETE 0"
-        return result.endswith("1")
+        if row is None:
+            return False
+        self._invalidate_chunk_count(row["project_id"])
+        return True
 
     async def delete_by_document(self, document_id: UUID) -> int:
         """Delete all knowledge items for a document.
@@ -421,10 +901,17 @@ class KnowledgeRepository(IKnowledgeRepository):
         Returns:
             Number of knowledge items deleted
         """
-        query = "DELETE FROM knowledge_items WHERE document_id = $1"
+        # One row per project touched (a document belongs to one), with its count
+        query = """
+            WITH deleted AS (
+                DELETE FROM knowledge_items WHERE document_id = $1 RETURNING project_id
+            )
+            SELECT project_id, count(*) AS deleted FROM deleted GROUP BY project_id
+        """
 
         async with self.pool.acquire() as conn:
-            result = await conn.execute(query, document_id)
+            rows = await conn.fetch(query, document_id)
 
-        # Result is like "DELETE 5" - extract the number
-        return int(result.split()[-1])
+        for row in rows:
+            self._invalidate_chunk_count(row["project_id"])
+        return sum(row["deleted"] for row in rows)
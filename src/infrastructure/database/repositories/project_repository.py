@@ -1,14 +1,20 @@
 from __future__ import annotations
 
+import copy
 from typing import Iterable, List, Optional
 from uuid import UUID
 
 from src.domain.models.project import IProjectRepository, Project
+from src.infrastructure.cache.local_cache import LocalCache
 from src.shared.infrastructure.database.connection import init_pool
 from src.shared.utils.errors import ProjectNotFoundError
 
 
 class ProjectRepository(IProjectRepository):
+    def __init__(self, cache: Optional[LocalCache[UUID, Project]] = None) -> None:
+        # Optional process-wide cache of get_by_id results, evicted on update and delete
+        self.cache = cache
+
     async def create(self, project: Project) -> Project:
         pool = await init_pool()
         async with pool.acquire() as conn:
@@ -31,6 +37,12 @@ class ProjectRepository(IProjectRepository):
         return project
 
     async def get_by_id(self, project_id: UUID) -> Optional[Project]:
+        if self.cache is not None:
+            cached = self.cache.get(project_id)
+            if cached is not None:
+                # Callers modify the returned project before updating it
+                return copy.copy(cached)
+
         pool = await init_pool()
         async with pool.acquire() as conn:
             row = await conn.fetchrow(
@@ -39,7 +51,7 @@ class ProjectRepository(IProjectRepository):
             )
             if row is None:
                 return None
-            return Project(
+            project = Project(
                 id=row["id"],
                 name=row["name"],
                 owner_id=row["owner_id"],
@@ -47,6 +59,9 @@ class ProjectRepository(IProjectRepository):
                 status=row["status"],
                 tags=list(row["tags"]) if row["tags"] is not None else None,
             )
+        if self.cache is not None:
+            self.cache.set(project_id, copy.copy(project))
+        return project
 
     async def get_all(self, limit: int = 100, offset: int = 0) -> Iterable[Project]:
         pool = await init_pool()
@@ -94,6 +109,8 @@ class ProjectRepository(IProjectRepository):
             )
             if row is None:
                 raise ProjectNotFoundError(str(project.id))
+        if self.cache is not None:
+            self.cache.delete(project.id)
         return project
 
     async def delete(self, project_id: UUID) -> None:
@@ -102,5 +119,7 @@ class ProjectRepository(IProjectRepository):
             row = await conn.fetchrow("DELETE FROM projects WHERE id = $1 RETURNING 1", project_id)
             if row is None:
                 raise ProjectNotFoundError(str(project_id))
+        if self.cache is not None:
+            self.cache.delete(project_id)
 
 
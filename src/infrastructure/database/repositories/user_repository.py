@@ -2,26 +2,33 @@
 
 from __future__ import annotations
 
+import copy
 from typing import Iterable, Optional
 from uuid import UUID
 
 import asyncpg
 
 from src.domain.models.user import IUserRepository, User
+from src.infrastructure.cache.local_cache import LocalCache
 from src.shared.utils.errors import UserNotFoundError
 
 
 class UserRepository(IUserRepository):
     """Concrete implementation of IUserRepository using asyncpg."""
 
-    def __init__(self, pool: asyncpg.Pool) -> None:
+    def __init__(
+        self, pool: asyncpg.Pool, cache: Optional[LocalCache[str, User]] = None
+    ) -> None:
         """
         Initialize the repository with a database connection pool.
         
         Args:
             pool: The asyncpg connection pool
+            cache: Optional process-wide cache of active users by username,
+                evicted on update and delete
         """
         self.pool = pool
+        self.cache = cache
 
     async def create(self, user: User) -> User:
         """
@@ -90,6 +97,11 @@ class UserRepository(IUserRepository):
         Returns:
             The User entity if found, None otherwise
         """
+        if self.cache is not None:
+            cached = self.cache.get(username)
+            if cached is not None:
+                return copy.copy(cached)
+
         async with self.pool.acquire() as conn:
             row = await conn.fetchrow(
                 """
@@ -103,7 +115,7 @@ class UserRepository(IUserRepository):
         if not row:
             return None
         
-        return User(
+        user = User(
             id=row["id"],
             username=row["username"],
             email=row["email"],
@@ -111,6 +123,10 @@ class UserRepository(IUserRepository):
             is_active=row["is_active"],
             roles=list(row["roles"]) if row["roles"] else [],
         )
+        # Inactive users are rejected anyway; only the hot path is cached
+        if self.cache is not None and user.is_active:
+            self.cache.set(username, copy.copy(user))
+        return user
 
     async def get_all(self, limit: int = 100, offset: int = 0) -> Iterable[User]:
         """
@@ -161,11 +177,15 @@ class UserRepository(IUserRepository):
             UserNotFoundError: If the user does not exist
         """
         async with self.pool.acquire() as conn:
-            result = await conn.execute(
+            # The self-join reads the username from before the update, so a
+            # renamed user is evicted under the old name too
+            row = await conn.fetchrow(
                 """
-                UPDATE users
+                UPDATE users AS u
                 SET username = $2, email = $3, hashed_password = $4, is_active = $5, roles = $6, updated_at = now()
-                WHERE id = $1
+                FROM users AS old
+                WHERE u.id = $1 AND old.id = u.id
+                RETURNING old.username
                 """,
                 user.id,
                 user.username,
@@ -175,9 +195,13 @@ class UserRepository(IUserRepository):
                 user.roles,
             )
         
-        if result != "UPDATE 1":
+        if row is None:
             raise UserNotFoundError(f"User with id {user.id} not found")
         
+        if self.cache is not None:
+            self.cache.delete(row["username"])
+            self.cache.delete(user.username)
+        
         return user
 
     async def delete(self, user_id: UUID) -> None:
@@ -191,13 +215,17 @@ class UserRepository(IUserRepository):
             UserNotFoundError: If the user does not exist
         """
         async with self.pool.acquire() as conn:
-            result = await conn.execute(
+            row = await conn.fetchrow(
                 """
                 DELETE FROM users
                 WHERE id = $1
+                RETURNING username
                 """,
                 user_id,
             )
         
-        if result != "DELETE 1":
+        if row is None:
             raise UserNotFoundError(f"User with id {user_id} not found")
+        
+        if self.cache is not None:
+            self.cache.delete(row["username"])
@@ -0,0 +1,102 @@
+"""Embedding provider wrapper that serves repeated texts from a cache.
+
+Re-ingesting a document, crawling overlapping pages and repeating a query all
+embed texts that have been embedded before. Embeddings are deterministic for a
+given model and text, so they are cached by ``(model, sha256(text))`` and only
+the texts missing from the cache are sent to the provider.
+"""
+
+import logging
+from typing import AsyncIterator
+
+from src.infrastructure.cache.embedding_cache import EmbeddingCache
+
+from .providers.base import ILLMProvider
+
+logger = logging.getLogger(__name__)
+
+
+class CachedEmbeddingProvider(ILLMProvider):
+    """Embedding provider wrapper backed by an ``EmbeddingCache``.
+
+    Embedding calls look up the cache first and embed only the misses, in a
+    single ``embed_texts`` request. Completion calls pass straight through.
+    """
+
+    def __init__(
+        self,
+        provider: ILLMProvider,
+        cache: EmbeddingCache,
+        default_model: str,
+    ) -> None:
+        """Initialize the caching wrapper.
+
+        Args:
+            provider: The embedding provider to wrap.
+            cache: Cache to read and populate.
+            default_model: Model the wrapped provider uses when none is given;
+                it is part of the cache key.
+        """
+        self.provider = provider
+        self.cache = cache
+        self.default_model = default_model
+
+    async def embed_text(self, text: str, model: str | None = None) -> list[float]:
+        """Return the cached embedding for a text, embedding it on a miss.
+
+        Raises:
+            Same errors as the wrapped provider's ``embed_text``.
+        """
+        embedding_model = model or self.default_model
+        [cached] = await self.cache.get_many(embedding_model, [text])
+        if cached is not None:
+            return cached
+
+        embedding = await self.provider.embed_text(text, model)
+        await self.cache.set_many(embedding_model, [text], [embedding])
+        return embedding
+
+    async def embed_texts(
+        self, texts: list[str], model: str | None = None
+    ) -> list[list[float]]:
+        """Return cached embeddings, embedding only the texts not yet cached.
+
+        Raises:
+            Same errors as the wrapped provider's ``embed_texts``.
+        """
+        embedding_model = model or self.default_model
+        results = await self.cache.get_many(embedding_model, texts)
+
+        # Duplicate texts within a batch are embedded once
+        missing = list(dict.fromkeys(text for text, result in zip(texts, results) if result is None))
+        if missing:
+            embeddings = await self.provider.embed_texts(missing, model)
+            if len(embeddings) != len(missing):
+                raise ValueError(
+                    f"Provider returned {len(embeddings)} embeddings for {len(missing)} texts"
+                )
+            await self.cache.set_many(embedding_model, missing, embeddings)
+            fetched = dict(zip(missing, embeddings))
+            results = [fetched[text] if result is None else result for text, result in zip(texts, results)]
+            logger.debug(
+                "Embedded %d of %d texts, the rest were cached", len(missing), len(texts)
+            )
+
+        return results
+
+    async def generate_completion(
+        self, messages: list[dict], model: str | None = None, **kwargs
+    ) -> str:
+        """Delegate to the wrapped provider."""
+        return await self.provider.generate_completion(messages, model, **kwargs)
+
+    async def generate_completion_stream(
+        self, messages: list[dict], model: str | None = None, **kwargs
+    ) -> AsyncIterator[str]:
+        """Delegate to the wrapped provider."""
+        async for token in self.provider.generate_completion_stream(messages, model, **kwargs):
+            yield token
+
+    async def close(self) -> None:
+        """Close the wrapped provider."""
+        await self.provider.close()
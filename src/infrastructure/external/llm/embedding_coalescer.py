@@ -0,0 +1,125 @@
+"""Cross-request coalescing of single-text embedding calls.
+
+Query-time traffic embeds one short text per request. Under load, many of those
+calls arrive within a few milliseconds of each other and each costs a separate
+HTTP request against the provider's rate limit. The coalescer holds single-text
+calls for a short window, sends them as one ``embed_texts`` request and hands
+each caller its own embedding.
+"""
+
+import asyncio
+import logging
+from typing import AsyncIterator, Optional
+
+from .providers.base import ILLMProvider
+
+logger = logging.getLogger(__name__)
+
+
+class CoalescingEmbeddingProvider(ILLMProvider):
+    """Embedding provider wrapper that batches concurrent ``embed_text`` calls.
+
+    A batch is flushed when the first call in it has waited ``window_ms`` or when
+    it reaches ``max_batch`` texts, whichever comes first, so ``window_ms`` bounds
+    the latency added to any call. Calls for different models are batched
+    separately. ``embed_texts`` and completion calls pass straight through.
+    """
+
+    def __init__(
+        self,
+        provider: ILLMProvider,
+        window_ms: float = 3.0,
+        max_batch: int = 64,
+    ) -> None:
+        """Initialize the coalescer.
+
+        Args:
+            provider: The embedding provider to send batched requests to.
+            window_ms: Maximum time a call waits for others to join its batch.
+            max_batch: Batch size that triggers an immediate flush.
+        """
+        self.provider = provider
+        self.window_ms = max(0.0, window_ms)
+        self.max_batch = max(1, max_batch)
+        self._pending: dict[Optional[str], list[tuple[str, asyncio.Future]]] = {}
+        self._timers: dict[Optional[str], asyncio.TimerHandle] = {}
+        # Strong references keep in-flight batch tasks from being collected
+        self._tasks: set[asyncio.Task] = set()
+
+    async def embed_text(self, text: str, model: str | None = None) -> list[float]:
+        """Queue a text for the next batched request and wait for its embedding.
+
+        Raises:
+            Same errors as the wrapped provider's ``embed_texts``; every caller in
+            a failed batch receives the error.
+        """
+        loop = asyncio.get_running_loop()
+        future: asyncio.Future = loop.create_future()
+        pending = self._pending.setdefault(model, [])
+        pending.append((text, future))
+
+        if len(pending) >= self.max_batch:
+            self._flush(model)
+        elif model not in self._timers:
+            self._timers[model] = loop.call_later(
+                self.window_ms / 1000, self._flush, model
+            )
+
+        return await future
+
+    async def embed_texts(
+        self, texts: list[str], model: str | None = None
+    ) -> list[list[float]]:
+        """Pass multi-text requests straight to the wrapped provider."""
+        return await self.provider.embed_texts(texts, model)
+
+    async def generate_completion(
+        self, messages: list[dict], model: str | None = None, **kwargs
+    ) -> str:
+        """Delegate to the wrapped provider."""
+        return await self.provider.generate_completion(messages, model, **kwargs)
+
+    async def generate_completion_stream(
+        self, messages: list[dict], model: str | None = None, **kwargs
+    ) -> AsyncIterator[str]:
+        """Delegate to the wrapped provider."""
+        async for token in self.provider.generate_completion_stream(messages, model, **kwargs):
+            yield token
+
+    async def close(self) -> None:
+        """Close the wrapped provider."""
+        await self.provider.close()
+
+    def _flush(self, model: Optional[str]) -> None:
+        """Send the pending batch for a model as one request."""
+        timer = self._timers.pop(model, None)
+        if timer is not None:
+            timer.cancel()
+        batch = self._pending.pop(model, [])
+        if batch:
+            task = asyncio.create_task(self._send(batch, model))
+            self._tasks.add(task)
+            task.add_done_callback(self._tasks.discard)
+
+    async def _send(
+        self, batch: list[tuple[str, asyncio.Future]], model: Optional[str]
+    ) -> None:
+        """Embed a batch and resolve each caller's future."""
+        texts = [text for text, _ in batch]
+        try:
+            embeddings = await self.provider.embed_texts(texts, model)
+            if len(embeddings) != len(batch):
+                raise ValueError(
+                    f"Provider returned {len(embeddings)} embeddings for {len(batch)} texts"
+                )
+        except Exception as e:
+            for _, future in batch:
+                if not future.done():
+                    future.set_exception(e)
+            return
+
+        logger.debug("Coalesced %d embedding calls into one request", len(batch))
+        for (_, future), embedding in zip(batch, embeddings):
+            # A caller that was cancelled no longer needs its result
+            if not future.done():
+                future.set_result(embedding)
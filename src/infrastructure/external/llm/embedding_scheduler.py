@@ -0,0 +1,257 @@
+"""Adaptive-concurrency scheduler for embedding requests.
+
+The scheduler wraps an embedding provider and limits how many embedding
+requests are in flight against it. The limit follows AIMD (additive increase,
+multiplicative decrease): each successful request grows it by roughly one slot
+per window of successes, and a rate-limit response halves it. Rate-limited and
+dropped requests are retried with jittered exponential backoff, waiting at
+least as long as the provider's Retry-After asks.
+"""
+
+import asyncio
+import logging
+import random
+import time
+from typing import AsyncIterator, Awaitable, Callable, TypeVar
+
+from src.shared.utils.errors import LLMConnectionError, LLMRateLimitError
+
+from .providers.base import ILLMProvider
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+
+class EmbeddingScheduler(ILLMProvider):
+    """Embedding provider wrapper with AIMD concurrency control and retries.
+
+    Embedding calls (``embed_text``, ``embed_texts``) go through the scheduler.
+    Completion calls are passed straight to the wrapped provider.
+
+    One scheduler is shared by all callers of a provider (see
+    ``ProviderFactory.get_embedding_provider``), so the concurrency limit
+    reflects the provider's rate limit across query and ingestion traffic.
+    """
+
+    DECREASE_FACTOR = 0.5
+
+    def __init__(
+        self,
+        provider: ILLMProvider,
+        name: str,
+        initial_concurrency: int = 4,
+        min_concurrency: int = 1,
+        max_concurrency: int = 16,
+        max_retries: int = 5,
+        backoff_base: float = 0.5,
+        backoff_max: float = 30.0,
+    ) -> None:
+        """Initialize the scheduler.
+
+        Args:
+            provider: The embedding provider to wrap.
+            name: Provider name, used in logs and metrics.
+            initial_concurrency: Concurrency limit to start from.
+            min_concurrency: Lower bound for the limit after rate limiting.
+            max_concurrency: Upper bound for the limit.
+            max_retries: Retries per request for rate-limit and connection errors.
+            backoff_base: Base delay in seconds for exponential backoff.
+            backoff_max: Maximum backoff delay in seconds.
+        """
+        self.provider = provider
+        self.name = name
+        self.min_concurrency = max(1, min_concurrency)
+        self.max_concurrency = max(self.min_concurrency, max_concurrency)
+        self.max_retries = max(0, max_retries)
+        self.backoff_base = backoff_base
+        self.backoff_max = backoff_max
+
+        self._limit = float(
+            min(max(initial_concurrency, self.min_concurrency), self.max_concurrency)
+        )
+        self._in_flight = 0
+        self._queued = 0
+        self._condition = asyncio.Condition()
+        # Monotonic deadlines: no dispatch before _resume_at, no further
+        # decrease before _decrease_until (one decrease per congestion event)
+        self._resume_at = 0.0
+        self._decrease_until = 0.0
+
+        self._requests = 0
+        self._retries = 0
+        self._rate_limited = 0
+        self._failures = 0
+
+    @property
+    def concurrency_limit(self) -> int:
+        """Current number of requests allowed in flight."""
+        return int(self._limit)
+
+    def metrics(self) -> dict[str, int | str]:
+        """Snapshot of the scheduler's state and counters.
+
+        Returns:
+            Dict with the current concurrency limit, in-flight requests, queue
+            depth (requests waiting for a slot) and cumulative counters.
+        """
+        return {
+            "provider": self.name,
+            "concurrency_limit": self.concurrency_limit,
+            "in_flight": self._in_flight,
+            "queue_depth": self._queued,
+            "requests": self._requests,
+            "retries": self._retries,
+            "rate_limited": self._rate_limited,
+            "failures": self._failures,
+        }
+
+    async def embed_text(self, text: str, model: str | None = None) -> list[float]:
+        """Generate an embedding through the scheduler.
+
+        Raises:
+            Same errors as the wrapped provider, once retries are exhausted.
+        """
+        return await self._submit(lambda: self.provider.embed_text(text, model))
+
+    async def embed_texts(
+        self, texts: list[str], model: str | None = None
+    ) -> list[list[float]]:
+        """Generate embeddings for a batch through the scheduler.
+
+        Raises:
+            Same errors as the wrapped provider, once retries are exhausted.
+        """
+        return await self._submit(lambda: self.provider.embed_texts(texts, model))
+
+    async def generate_completion(
+        self, messages: list[dict], model: str | None = None, **kwargs
+    ) -> str:
+        """Delegate to the wrapped provider without scheduling."""
+        return await self.provider.generate_completion(messages, model, **kwargs)
+
+    async def generate_completion_stream(
+        self, messages: list[dict], model: str | None = None, **kwargs
+    ) -> AsyncIterator[str]:
+        """Delegate to the wrapped provider without scheduling."""
+        async for token in self.provider.generate_completion_stream(messages, model, **kwargs):
+            yield token
+
+    async def close(self) -> None:
+        """Close the wrapped provider."""
+        await self.provider.close()
+
+    async def _submit(self, call: Callable[[], Awaitable[T]]) -> T:
+        """Run a provider call within the concurrency limit, retrying transient errors.
+
+        Args:
+            call: Zero-argument callable starting the provider request.
+
+        Returns:
+            The provider call's result.
+
+        Raises:
+            LLMRateLimitError: If still rate limited after ``max_retries`` retries.
+            LLMConnectionError: If still failing to connect after ``max_retries`` retries.
+            LLMProviderError: For other provider errors (not retried).
+        """
+        attempt = 0
+        while True:
+            await self._acquire()
+            self._requests += 1
+            try:
+                result = await call()
+            except LLMRateLimitError as e:
+                self._rate_limited += 1
+                self._on_rate_limited(e.retry_after)
+                error: Exception = e
+                retry_after = e.retry_after
+            except LLMConnectionError as e:
+                error = e
+                retry_after = None
+            except Exception:
+                self._failures += 1
+                raise
+            else:
+                self._on_success()
+                return result
+            finally:
+                await self._release()
+
+            if attempt >= self.max_retries:
+                self._failures += 1
+                raise error
+
+            delay = self._backoff(attempt, retry_after)
+            attempt += 1
+            self._retries += 1
+            logger.warning(
+                "Embedding request to %s failed (%s), retry %d/%d in %.2fs",
+                self.name,
+                type(error).__name__,
+                attempt,
+                self.max_retries,
+                delay,
+            )
+            await asyncio.sleep(delay)
+
+    async def _acquire(self) -> None:
+        """Wait for a free slot and for any rate-limit pause to end."""
+        self._queued += 1
+        try:
+            while True:
+                pause = self._resume_at - time.monotonic()
+                if pause > 0:
+                    await asyncio.sleep(pause)
+                async with self._condition:
+                    await self._condition.wait_for(
+                        lambda: self._in_flight < self.concurrency_limit
+                    )
+                    # A rate limit may have paused dispatch while we waited
+                    if self._resume_at <= time.monotonic():
+                        self._in_flight += 1
+                        return
+        finally:
+            self._queued -= 1
+
+    async def _release(self) -> None:
+        """Free a slot and wake waiters (the limit may also have changed).
+
+        The slot is freed before anything is awaited and the wake-up is
+        shielded, so a request cancelled here leaks neither.
+        """
+        self._in_flight -= 1
+        await asyncio.shield(self._wake_waiters())
+
+    async def _wake_waiters(self) -> None:
+        """Let waiters re-check for a free slot."""
+        async with self._condition:
+            self._condition.notify_all()
+
+    def _on_success(self) -> None:
+        """Additive increase: about one extra slot per window of successes."""
+        self._limit = min(self.max_concurrency, self._limit + 1.0 / self._limit)
+
+    def _on_rate_limited(self, retry_after: float | None) -> None:
+        """Multiplicative decrease, at most once per congestion event."""
+        now = time.monotonic()
+        if retry_after:
+            self._resume_at = max(self._resume_at, now + retry_after)
+        if now < self._decrease_until:
+            return
+        self._decrease_until = now + (retry_after or self.backoff_base)
+        previous = self.concurrency_limit
+        self._limit = max(self.min_concurrency, self._limit * self.DECREASE_FACTOR)
+        logger.warning(
+            "Embedding provider %s rate limited, concurrency %d -> %d",
+            self.name,
+            previous,
+            self.concurrency_limit,
+        )
+
+    def _backoff(self, attempt: int, retry_after: float | None) -> float:
+        """Jittered exponential backoff, never shorter than Retry-After."""
+        delay = random.uniform(0, min(self.backoff_max, self.backoff_base * 2**attempt))
+        if retry_after is not None:
+            delay += retry_after
+        return delay
@@ -1,11 +1,17 @@
 """Factory for creating and managing LLM provider instances."""
 
 import logging
-from typing import Dict
+from typing import Dict, Optional
 
-from src.shared.config.settings import LLMSettings, load_settings
+from src.infrastructure.cache.embedding_cache import EmbeddingCache
+from src.infrastructure.cache.local_cache import LocalCache
+from src.infrastructure.cache.redis_cache import RedisCacheService
+from src.shared.config.settings import LLMSettings, Settings, load_settings
 from src.shared.utils.errors import UnsupportedProviderError
 
+from .embedding_cache_provider import CachedEmbeddingProvider
+from .embedding_coalescer import CoalescingEmbeddingProvider
+from .embedding_scheduler import EmbeddingScheduler
 from .providers.base import ILLMProvider
 from .providers.anthropic_provider import AnthropicProvider
 from .providers.ollama_provider import OllamaProvider
@@ -32,6 +38,9 @@ class ProviderFactory:
     # Singleton cache for provider instances
     _llm_providers: Dict[str, ILLMProvider] = {}
     _embedding_providers: Dict[str, ILLMProvider] = {}
+    _query_embedding_providers: Dict[str, ILLMProvider] = {}
+    _embedding_schedulers: Dict[str, EmbeddingScheduler] = {}
+    _embedding_cache: Optional[EmbeddingCache] = None
 
     @classmethod
     def get_llm_provider(cls, provider_name: str | None = None) -> ILLMProvider:
@@ -82,16 +91,25 @@ class ProviderFactory:
         return instance
 
     @classmethod
-    def get_embedding_provider(cls, provider_name: str | None = None) -> ILLMProvider:
+    def get_embedding_provider(
+        cls, provider_name: str | None = None, for_queries: bool = False
+    ) -> ILLMProvider:
         """Get or create an embedding provider instance.
         
         Args:
             provider_name: Optional provider name. If None, uses the value
                           from settings.llm.embedding_provider. Supported values:
                           "openai", "ollama" (case-insensitive).
+            for_queries: Request the provider used for query-time embeddings. When
+                        settings.llm.embedding_coalesce_enabled is set, concurrent
+                        embed_text calls through it are coalesced into batched
+                        requests.
         
         Returns:
-            An instance of ILLMProvider that supports embeddings.
+            An instance of ILLMProvider that supports embeddings, wrapped in an
+            EmbeddingScheduler shared by all callers of that provider and, when
+            settings.cache.embedding_cache_enabled is set, in the shared
+            embedding cache.
         
         Raises:
             UnsupportedProviderError: If the provider name is not supported
@@ -101,6 +119,18 @@ class ProviderFactory:
         settings = load_settings()
         provider = (provider_name or settings.llm.embedding_provider).lower().strip()
 
+        if for_queries and settings.llm.embedding_coalesce_enabled:
+            if provider not in cls._query_embedding_providers:
+                cls.get_embedding_provider(provider)
+                coalescer = CoalescingEmbeddingProvider(
+                    cls._embedding_schedulers[provider],
+                    window_ms=settings.llm.embedding_coalesce_window_ms,
+                    max_batch=settings.llm.embedding_coalesce_max_batch,
+                )
+                cls._query_embedding_providers[provider] = cls._with_cache(coalescer, settings)
+                logger.info("Query embedding coalescing enabled for provider: %s", provider)
+            return cls._query_embedding_providers[provider]
+
         # Check singleton cache first
         if provider in cls._embedding_providers:
             logger.debug("Returning cached embedding provider: %s", provider)
@@ -125,11 +155,69 @@ class ProviderFactory:
                 f"Supported providers: openai, ollama"
             )
 
-        # Cache the instance
-        cls._embedding_providers[provider] = instance
+        # Cache the instance behind the shared adaptive-concurrency scheduler
+        scheduler = EmbeddingScheduler(
+            instance,
+            name=provider,
+            initial_concurrency=settings.llm.embedding_initial_concurrency,
+            max_concurrency=settings.llm.embedding_max_concurrency,
+            max_retries=settings.llm.embedding_max_retries,
+        )
+        cls._embedding_schedulers[provider] = scheduler
+        cls._embedding_providers[provider] = cls._with_cache(scheduler, settings)
         logger.info("Embedding provider initialized and cached: %s", provider)
         
-        return instance
+        return cls._embedding_providers[provider]
+
+    @classmethod
+    def _with_cache(cls, provider: ILLMProvider, settings: Settings) -> ILLMProvider:
+        """Wrap an embedding provider in the shared embedding cache, if enabled."""
+        if not settings.cache.embedding_cache_enabled:
+            return provider
+
+        if cls._embedding_cache is None:
+            redis = (
+                RedisCacheService.from_settings(settings.redis)
+                if settings.cache.embedding_cache_redis_enabled
+                else None
+            )
+            cls._embedding_cache = EmbeddingCache(
+                LocalCache(
+                    max_entries=settings.cache.embedding_cache_local_max_entries,
+                    ttl=settings.cache.embedding_cache_local_ttl,
+                    max_bytes=settings.cache.embedding_cache_local_max_bytes,
+                ),
+                redis=redis,
+                ttl=settings.cache.embedding_cache_ttl,
+                key_prefix=settings.cache.embedding_cache_key_prefix,
+            )
+        return CachedEmbeddingProvider(
+            provider, cls._embedding_cache, settings.llm.default_embedding_model
+        )
+
+    @classmethod
+    def embedding_metrics(cls) -> dict[str, dict[str, int | str]]:
+        """Get scheduler metrics for every initialized embedding provider.
+        
+        Returns:
+            Mapping of provider name to its EmbeddingScheduler metrics
+            (concurrency limit, in-flight requests, queue depth, counters).
+        """
+        return {
+            name: scheduler.metrics()
+            for name, scheduler in cls._embedding_schedulers.items()
+        }
+
+    @classmethod
+    def embedding_cache_metrics(cls) -> dict[str, int | float] | None:
+        """Get hit/miss metrics of the shared embedding cache.
+        
+        Returns:
+            EmbeddingCache metrics, or None if no cache has been created.
+        """
+        if cls._embedding_cache is None:
+            return None
+        return cls._embedding_cache.metrics()
 
     @classmethod
     async def close_all(cls) -> None:
@@ -154,8 +242,15 @@ class ProviderFactory:
             except Exception as e:
                 logger.error("Error closing embedding provider %s: %s", provider_name, str(e))
         
+        if cls._embedding_cache is not None and cls._embedding_cache.redis is not None:
+            await cls._embedding_cache.redis.close()
+        
+        # Query providers wrap the embedding providers closed above
         cls._llm_providers.clear()
         cls._embedding_providers.clear()
+        cls._query_embedding_providers.clear()
+        cls._embedding_schedulers.clear()
+        cls._embedding_cache = None
         logger.info("All provider instances closed and cache cleared")
 
     @classmethod
@@ -167,4 +262,7 @@ class ProviderFactory:
         """
         cls._llm_providers.clear()
         cls._embedding_providers.clear()
+        cls._query_embedding_providers.clear()
+        cls._embedding_schedulers.clear()
+        cls._embedding_cache = None
         logger.debug("Provider factory cache reset")
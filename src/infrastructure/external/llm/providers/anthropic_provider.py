@@ -14,7 +14,7 @@ from src.shared.utils.errors import (
     LLMRateLimitError,
 )
 
-from .base import ILLMProvider
+from .base import ILLMProvider, parse_retry_after
 
 logger = logging.getLogger(__name__)
 
@@ -65,6 +65,18 @@ class AnthropicProvider(ILLMProvider):
             "Anthropic does not provide embeddings. Use OpenAI or another provider for embeddings."
         )
 
+    async def embed_texts(
+        self, texts: list[str], model: str | None = None
+    ) -> list[list[float]]:
+        """Anthropic does not provide embeddings.
+        
+        Raises:
+            NotImplementedError: Always, as Anthropic doesn't support embeddings.
+        """
+        raise NotImplementedError(
+            "Anthropic does not provide embeddings. Use OpenAI or another provider for embeddings."
+        )
+
     async def generate_completion(
         self, messages: list[dict], model: str | None = None, **kwargs
     ) -> str:
@@ -117,7 +129,8 @@ class AnthropicProvider(ILLMProvider):
                 )
             elif response.status_code == 429:
                 raise LLMRateLimitError(
-                    f"Anthropic rate limit exceeded: {response.text}"
+                    f"Anthropic rate limit exceeded: {response.text}",
+                    retry_after=parse_retry_after(response.headers),
                 )
             elif response.status_code != 200:
                 raise LLMProviderError(
@@ -194,7 +207,8 @@ class AnthropicProvider(ILLMProvider):
                 elif response.status_code == 429:
                     error_text = await response.aread()
                     raise LLMRateLimitError(
-                        f"Anthropic rate limit exceeded: {error_text.decode()}"
+                        f"Anthropic rate limit exceeded: {error_text.decode()}",
+                        retry_after=parse_retry_after(response.headers),
                     )
                 elif response.status_code != 200:
                     error_text = await response.aread()
@@ -5,8 +5,33 @@ provider implementations must implement. This enables pluggable, runtime-switcha
 LLM and embedding providers without coupling to specific vendor APIs.
 """
 
+import asyncio
 from abc import ABC, abstractmethod
-from typing import AsyncIterator
+from typing import AsyncIterator, Mapping
+
+
+def parse_retry_after(headers: Mapping[str, str]) -> float | None:
+    """Read the wait a rate-limited response asks for, in seconds.
+    
+    Understands the millisecond ``retry-after-ms`` header some providers send and
+    the standard ``Retry-After`` header in its delay-seconds form. HTTP-date values
+    are ignored.
+    
+    Args:
+        headers: Response headers (case-insensitive mapping, e.g. httpx.Headers).
+    
+    Returns:
+        Seconds to wait, or None if the response does not say.
+    """
+    for name, scale in (("retry-after-ms", 0.001), ("retry-after", 1.0)):
+        value = headers.get(name)
+        if value is None:
+            continue
+        try:
+            return max(0.0, float(value) * scale)
+        except ValueError:
+            continue
+    return None
 
 
 class ILLMProvider(ABC):
@@ -44,6 +69,30 @@ class ILLMProvider(ABC):
         """
         pass
 
+    async def embed_texts(
+        self, texts: list[str], model: str | None = None
+    ) -> list[list[float]]:
+        """Generate embeddings for several texts in one call.
+        
+        The default implementation issues one ``embed_text`` call per text
+        concurrently. Providers with a native batch endpoint should override it
+        to send all texts in a single request.
+        
+        Args:
+            texts: The texts to embed. Each should be non-empty.
+            model: Optional model name to use. If None, uses the provider's default
+                   embedding model configured in settings.
+        
+        Returns:
+            One embedding vector per input text, in input order.
+        
+        Raises:
+            Same errors as ``embed_text``.
+        """
+        return list(
+            await asyncio.gather(*(self.embed_text(text, model) for text in texts))
+        )
+
     @abstractmethod
     async def generate_completion(
         self, messages: list[dict], model: str | None = None, **kwargs
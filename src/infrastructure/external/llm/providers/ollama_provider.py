@@ -93,6 +93,70 @@ class OllamaProvider(ILLMProvider):
             logger.error("Unexpected error calling Ollama embeddings API: %s", str(e))
             raise LLMProviderError(f"Unexpected error: {str(e)}") from e
 
+    async def embed_texts(
+        self, texts: list[str], model: str | None = None
+    ) -> list[list[float]]:
+        """Generate embeddings for several texts using Ollama's batch embed API.
+        
+        Sends all texts to ``/api/embed`` in a single request.
+        
+        Args:
+            texts: The texts to embed.
+            model: Optional model name. Defaults to settings.default_embedding_model.
+        
+        Returns:
+            One embedding vector per input text, in input order.
+        
+        Raises:
+            LLMConnectionError: If Ollama is not running or connection fails.
+            LLMProviderError: For other API errors or a short response.
+        """
+        if not texts:
+            return []
+
+        embedding_model = model or self.settings.default_embedding_model
+
+        try:
+            response = await self._client.post(
+                "/api/embed",
+                json={
+                    "model": embedding_model,
+                    "input": texts,
+                },
+            )
+
+            if response.status_code != 200:
+                raise LLMProviderError(
+                    f"Ollama API error: {response.status_code} {response.text}"
+                )
+
+            embeddings = response.json()["embeddings"]
+            if len(embeddings) != len(texts):
+                raise LLMProviderError(
+                    f"Ollama returned {len(embeddings)} embeddings for {len(texts)} inputs"
+                )
+            logger.debug(
+                "Generated %d embeddings in one request using model: %s",
+                len(texts),
+                embedding_model,
+            )
+            return embeddings
+
+        except httpx.ConnectError as e:
+            logger.error("Ollama connection error (is Ollama running?): %s", str(e))
+            raise LLMConnectionError(
+                f"Failed to connect to Ollama at {self.settings.ollama_base_url}. "
+                f"Is Ollama running? Error: {str(e)}"
+            ) from e
+        except httpx.RequestError as e:
+            logger.error("Ollama connection error: %s", str(e))
+            raise LLMConnectionError(f"Failed to connect to Ollama API: {str(e)}") from e
+        except LLMProviderError:
+            raise
+        except Exception as e:
+            logger.error("Unexpected error calling Ollama embed API: %s", str(e))
+            raise LLMProviderError(f"Unexpected error: {str(e)}") from e
+
     async def generate_completion(
         self, messages: list[dict], model: str | None = None, **kwargs
     ) -> str:
@@ -13,7 +13,7 @@ from src.shared.utils.errors import (
     LLMRateLimitError,
 )
 
-from .base import ILLMProvider
+from .base import ILLMProvider, parse_retry_after
 
 logger = logging.getLogger(__name__)
 
@@ -70,12 +70,68 @@ class OpenAIProvider(ILLMProvider):
             LLMProviderError: For other API errors.
         """
         embedding_model = model or self.settings.default_embedding_model
+        data = await self._request_embeddings(text, embedding_model)
+        logger.debug(
+            "Generated embedding for text (length: %d chars) using model: %s",
+            len(text),
+            embedding_model,
+        )
+        return data[0]["embedding"]
+
+    async def embed_texts(
+        self, texts: list[str], model: str | None = None
+    ) -> list[list[float]]:
+        """Generate embeddings for several texts in one embeddings API request.
+        
+        Uses the array form of ``input``. OpenAI accepts up to 2048 inputs per
+        request; callers are expected to split larger batches.
+        
+        Args:
+            texts: The texts to embed.
+            model: Optional model name. Defaults to settings.default_embedding_model.
+        
+        Returns:
+            One embedding vector per input text, in input order.
+        
+        Raises:
+            LLMAuthenticationError: If API key is invalid (401).
+            LLMRateLimitError: If rate limit is exceeded (429).
+            LLMConnectionError: If network connection fails.
+            LLMProviderError: For other API errors or a short response.
+        """
+        if not texts:
+            return []
 
+        embedding_model = model or self.settings.default_embedding_model
+        data = await self._request_embeddings(texts, embedding_model)
+        if len(data) != len(texts):
+            raise LLMProviderError(
+                f"OpenAI returned {len(data)} embeddings for {len(texts)} inputs"
+            )
+        logger.debug(
+            "Generated %d embeddings in one request using model: %s",
+            len(texts),
+            embedding_model,
+        )
+        # Results carry their input position; do not rely on response order
+        return [item["embedding"] for item in sorted(data, key=lambda item: item["index"])]
+
+    async def _request_embeddings(
+        self, input: str | list[str], embedding_model: str
+    ) -> list[dict]:
+        """Call the embeddings endpoint and return its ``data`` entries.
+        
+        Raises:
+            LLMAuthenticationError: If API key is invalid (401).
+            LLMRateLimitError: If rate limit is exceeded (429).
+            LLMConnectionError: If network connection fails.
+            LLMProviderError: For other API errors.
+        """
         try:
             response = await self._client.post(
                 "/embeddings",
                 json={
-                    "input": text,
+                    "input": input,
                     "model": embedding_model,
                 },
             )
@@ -86,21 +142,15 @@ class OpenAIProvider(ILLMProvider):
                 )
             elif response.status_code == 429:
                 raise LLMRateLimitError(
-                    f"OpenAI rate limit exceeded: {response.text}"
+                    f"OpenAI rate limit exceeded: {response.text}",
+                    retry_after=parse_retry_after(response.headers),
                 )
             elif response.status_code != 200:
                 raise LLMProviderError(
                     f"OpenAI API error: {response.status_code} {response.text}"
                 )
 
-            data = response.json()
-            embedding = data["data"][0]["embedding"]
-            logger.debug(
-                "Generated embedding for text (length: %d chars) using model: %s",
-                len(text),
-                embedding_model,
-            )
-            return embedding
+            return response.json()["data"]
 
         except httpx.RequestError as e:
             logger.error("OpenAI connection error: %s", str(e))
@@ -149,7 +199,8 @@ class OpenAIProvider(ILLMProvider):
                 )
             elif response.status_code == 429:
                 raise LLMRateLimitError(
-                    f"OpenAI rate limit exceeded: {response.text}"
+                    f"OpenAI rate limit exceeded: {response.text}",
+                    retry_after=parse_retry_after(response.headers),
                 )
             elif response.status_code != 200:
                 raise LLMProviderError(
@@ -215,7 +266,8 @@ class OpenAIProvider(ILLMProvider):
                 elif response.status_code == 429:
                     error_text = await response.aread()
                     raise LLMRateLimitError(
-                        f"OpenAI rate limit exceeded: {error_text.decode()}"
+                        f"OpenAI rate limit exceeded: {error_text.decode()}",
+                        retry_after=parse_retry_after(response.headers),
                     )
                 elif response.status_code != 200:
                     error_text = await response.aread()
@@ -14,7 +14,7 @@ from src.shared.utils.errors import (
     LLMRateLimitError,
 )
 
-from .base import ILLMProvider
+from .base import ILLMProvider, parse_retry_after
 
 logger = logging.getLogger(__name__)
 
@@ -67,6 +67,18 @@ class OpenRouterProvider(ILLMProvider):
             "OpenRouter does not provide embeddings directly. Use OpenAI or another provider for embeddings."
         )
 
+    async def embed_texts(
+        self, texts: list[str], model: str | None = None
+    ) -> list[list[float]]:
+        """OpenRouter does not provide embeddings.
+        
+        Raises:
+            NotImplementedError: Always, as OpenRouter doesn't support embeddings.
+        """
+        raise NotImplementedError(
+            "OpenRouter does not provide embeddings directly. Use OpenAI or another provider for embeddings."
+        )
+
     async def generate_completion(
         self, messages: list[dict], model: str | None = None, **kwargs
     ) -> str:
@@ -105,7 +117,8 @@ class OpenRouterProvider(ILLMProvider):
                 )
             elif response.status_code == 429:
                 raise LLMRateLimitError(
-                    f"OpenRouter rate limit exceeded: {response.text}"
+                    f"OpenRouter rate limit exceeded: {response.text}",
+                    retry_after=parse_retry_after(response.headers),
                 )
             elif response.status_code != 200:
                 raise LLMProviderError(
@@ -170,7 +183,8 @@ class OpenRouterProvider(ILLMProvider):
                 elif response.status_code == 429:
                     error_text = await response.aread()
                     raise LLMRateLimitError(
-                        f"OpenRouter rate limit exceeded: {error_text.decode()}"
+                        f"OpenRouter rate limit exceeded: {error_text.decode()}",
+                        retry_after=parse_retry_after(response.headers),
                     )
                 elif response.status_code != 200:
                     error_text = await response.aread()
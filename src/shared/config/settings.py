@@ -35,6 +35,8 @@ class DatabaseSettings:
     db: str
     user: str
     password: str
+    # Connections per process; RAG batch searches use at most all but one
+    pool_max_size: int = 5
 
     @property
     def dsn(self) -> str:
@@ -48,6 +50,15 @@ class RedisSettings:
     host: str
     port: int
     db: int
+    # Connection pool size, and the upper bound in seconds on any single cache
+    # call (connecting, waiting for a pooled connection, or a command)
+    max_connections: int = 50
+    timeout: float = 0.25
+    health_check_interval: int = 30
+
+    @property
+    def url(self) -> str:
+        return f"redis://{self.host}:{self.port}/{self.db}"
 
 
 @dataclass(frozen=True)
@@ -69,6 +80,18 @@ class LLMSettings:
     openrouter_api_key: str | None
     default_llm_model: str
     default_embedding_model: str
+    # Limits for one batched embeddings request (tokens estimated as chars / 4)
+    embedding_batch_max_items: int = 256
+    embedding_batch_max_tokens: int = 100_000
+    # Adaptive (AIMD) concurrency and retries for embedding requests
+    embedding_initial_concurrency: int = 4
+    embedding_max_concurrency: int = 16
+    embedding_max_retries: int = 5
+    # Opt-in coalescing of concurrent query-time embed_text calls into one
+    # request; the window bounds the latency added to each query
+    embedding_coalesce_enabled: bool = False
+    embedding_coalesce_window_ms: float = 3.0
+    embedding_coalesce_max_batch: int = 64
 
 
 @dataclass(frozen=True)
@@ -80,6 +103,15 @@ class FileUploadSettings:
     chunk_size_chars: int
     chunk_overlap_chars: int
     preserve_sentence_boundaries: bool
+    # Parse PDFs (split into page ranges), and DOCX/HTML files of at least
+    # extraction_offload_min_bytes, in a process pool; 0 workers uses the CPU count, and a single worker
+    # falls back to the thread pool
+    extraction_process_pool_enabled: bool = True
+    extraction_process_workers: int = 0
+    extraction_pdf_pages_per_task: int = 25
+    extraction_offload_min_bytes: int = 256 * 1024
+    # Chunk batches embedded and saved at once while ingesting a file
+    ingest_max_pending_batches: int = 4
 
 
 @dataclass(frozen=True)
@@ -116,6 +148,73 @@ class RAGSettings:
     agentic_rag_max_tokens: int
     agentic_rag_temperature: float
     agentic_rag_system_prompt: str
+    # Reciprocal Rank Fusion constant for hybrid search
+    hybrid_search_rrf_k: int = 60
+    # HNSW search effort defaults (iterative scans need pgvector >= 0.8)
+    hnsw_ef_search: int = 40
+    hnsw_iterative_scan: str = "off"
+    hnsw_max_scan_tuples: int = 20000
+    # Projects up to this many chunks are searched exactly instead of via HNSW
+    exact_search_max_chunks: int = 10000
+    # HNSW index used for ANN search ("full", "halfvec" or "binary") and the
+    # shortlist multiplier for rescoring quantized results at full precision;
+    # quantized searches raise ef_search to at least top_k * the multiplier
+    vector_index_mode: str = "full"
+    vector_rescore_factor: int = 4
+    # Report rows visited per search (candidates_scanned). Off by default, so
+    # responses carry null: counting costs each search a transaction and an
+    # extra statistics query over every partition and index
+    collect_candidates_scanned: bool = False
+    # Batch query endpoint: maximum queries per request and concurrent searches.
+    # Each search holds a database connection, so concurrency is capped below
+    # POSTGRES_POOL_MAX_SIZE to leave connections for other requests
+    batch_max_queries: int = 50
+    batch_max_concurrency: int = 4
+    # Semantic cache: reuse a cached result for a query whose embedding has at
+    # least this cosine similarity to a recent query with the same options
+    semantic_cache_enabled: bool = False
+    semantic_cache_threshold: float = 0.95
+    # Recent queries kept per scope. Each lookup scans them all in pure Python
+    # (about 4 ms per query at 64 entries on Python 3.11, in a worker thread),
+    # so raising this trades CPU per query for a higher hit rate
+    semantic_cache_max_entries: int = 64
+    # Stampede protection: one computation per result cache key. Other workers
+    # wait on a Redis lock held for at most single_flight_lock_ttl seconds,
+    # polling for the result. Entries are recomputed early with probability
+    # growing towards expiry (XFetch); a beta of 0 disables early refresh.
+    single_flight_lock_ttl: float = 30.0
+    single_flight_poll_interval_ms: int = 50
+    cache_early_refresh_beta: float = 1.0
+    # In-process tier of deserialized query results in front of Redis, bounded
+    # by entries and approximate bytes; entries never outlive the Redis entry
+    local_cache_enabled: bool = True
+    local_cache_max_entries: int = 10_000
+    local_cache_max_bytes: int = 64 * 1024 * 1024
+    local_cache_ttl: int = 60
+    # Seconds each process reuses a project's cache generation before reading
+    # it from Redis again; bounds how long other workers serve pre-ingest results
+    cache_generation_ttl: float = 1.0
+
+
+@dataclass(frozen=True)
+class CacheSettings:
+    """Configuration for embedding and repository caching."""
+
+    # Embeddings keyed by (model, sha256(text)); local LRU tier in front of Redis
+    embedding_cache_enabled: bool = True
+    embedding_cache_redis_enabled: bool = True
+    embedding_cache_ttl: int = 2_592_000
+    embedding_cache_local_max_entries: int = 4_096
+    embedding_cache_local_max_bytes: int = 32 * 1024 * 1024
+    embedding_cache_local_ttl: int = 3600
+    embedding_cache_key_prefix: str = "emb:"
+    # Per-process caches of project and active-user rows read on every request;
+    # writes through the repositories evict, other workers see them within the TTL
+    # (0 disables)
+    project_cache_ttl: float = 10.0
+    project_cache_max_entries: int = 10_000
+    user_cache_ttl: float = 10.0
+    user_cache_max_entries: int = 10_000
 
 
 @dataclass(frozen=True)
@@ -128,6 +227,7 @@ class Settings:
     file_upload: FileUploadSettings
     crawler: CrawlerSettings
     rag: RAGSettings
+    cache: CacheSettings = CacheSettings()
 
 
 def load_settings() -> Settings:
@@ -143,11 +243,15 @@ def load_settings() -> Settings:
             db=os.getenv("POSTGRES_DB", "contextiva"),
             user=os.getenv("POSTGRES_USER", "contextiva"),
             password=os.getenv("POSTGRES_PASSWORD", "changeme"),
+            pool_max_size=_get_int("POSTGRES_POOL_MAX_SIZE", 5),
         ),
         redis=RedisSettings(
             host=os.getenv("REDIS_HOST", "localhost"),
             port=_get_int("REDIS_PORT", 6379),
             db=_get_int("REDIS_DB", 0),
+            max_connections=_get_int("REDIS_MAX_CONNECTIONS", 50),
+            timeout=float(os.getenv("REDIS_TIMEOUT", "0.25")),
+            health_check_interval=_get_int("REDIS_HEALTH_CHECK_INTERVAL", 30),
         ),
         security=SecuritySettings(
             jwt_secret=os.getenv("JWT_SECRET", "change-this-secret"),
@@ -163,6 +267,14 @@ def load_settings() -> Settings:
             openrouter_api_key=os.getenv("LLM_OPENROUTER_API_KEY"),
             default_llm_model=os.getenv("LLM_DEFAULT_LLM_MODEL", "gpt-4o-mini"),
             default_embedding_model=os.getenv("LLM_DEFAULT_EMBEDDING_MODEL", "text-embedding-3-small"),
+            embedding_batch_max_items=_get_int("LLM_EMBEDDING_BATCH_MAX_ITEMS", 256),
+            embedding_batch_max_tokens=_get_int("LLM_EMBEDDING_BATCH_MAX_TOKENS", 100_000),
+            embedding_initial_concurrency=_get_int("LLM_EMBEDDING_INITIAL_CONCURRENCY", 4),
+            embedding_max_concurrency=_get_int("LLM_EMBEDDING_MAX_CONCURRENCY", 16),
+            embedding_max_retries=_get_int("LLM_EMBEDDING_MAX_RETRIES", 5),
+            embedding_coalesce_enabled=os.getenv("LLM_EMBEDDING_COALESCE_ENABLED", "false").lower() == "true",
+            embedding_coalesce_window_ms=float(os.getenv("LLM_EMBEDDING_COALESCE_WINDOW_MS", "3.0")),
+            embedding_coalesce_max_batch=_get_int("LLM_EMBEDDING_COALESCE_MAX_BATCH", 64),
         ),
         file_upload=FileUploadSettings(
             max_file_size_mb=_get_int("MAX_FILE_SIZE_MB", 10),
@@ -170,6 +282,11 @@ def load_settings() -> Settings:
             chunk_size_chars=_get_int("CHUNK_SIZE_CHARS", 2048),
             chunk_overlap_chars=_get_int("CHUNK_OVERLAP_CHARS", 200),
             preserve_sentence_boundaries=os.getenv("PRESERVE_SENTENCE_BOUNDARIES", "true").lower() == "true",
+            extraction_process_pool_enabled=os.getenv("EXTRACTION_PROCESS_POOL_ENABLED", "true").lower() == "true",
+            extraction_process_workers=_get_int("EXTRACTION_PROCESS_WORKERS", 0),
+            extraction_pdf_pages_per_task=_get_int("EXTRACTION_PDF_PAGES_PER_TASK", 25),
+            extraction_offload_min_bytes=_get_int("EXTRACTION_OFFLOAD_MIN_BYTES", 256 * 1024),
+            ingest_max_pending_batches=_get_int("INGEST_MAX_PENDING_BATCHES", 4),
         ),
         crawler=CrawlerSettings(
             timeout_seconds=_get_int("CRAWLER_TIMEOUT_SECONDS", 30),
@@ -201,6 +318,40 @@ def load_settings() -> Settings:
                 "context. If the context doesn't contain enough information to answer the question, say so. "
                 "Do not make up or infer information that isn't in the context."
             ),
+            hybrid_search_rrf_k=_get_int("RAG_HYBRID_RRF_K", 60),
+            hnsw_ef_search=_get_int("RAG_HNSW_EF_SEARCH", 40),
+            hnsw_iterative_scan=os.getenv("RAG_HNSW_ITERATIVE_SCAN", "off").lower(),
+            hnsw_max_scan_tuples=_get_int("RAG_HNSW_MAX_SCAN_TUPLES", 20000),
+            exact_search_max_chunks=_get_int("RAG_EXACT_SEARCH_MAX_CHUNKS", 10000),
+            vector_index_mode=os.getenv("RAG_VECTOR_INDEX_MODE", "full").lower(),
+            vector_rescore_factor=_get_int("RAG_VECTOR_RESCORE_FACTOR", 4),
+            collect_candidates_scanned=os.getenv("RAG_COLLECT_CANDIDATES_SCANNED", "false").lower() == "true",
+            batch_max_queries=_get_int("RAG_BATCH_MAX_QUERIES", 50),
+            batch_max_concurrency=_get_int("RAG_BATCH_MAX_CONCURRENCY", 4),
+            semantic_cache_enabled=os.getenv("RAG_SEMANTIC_CACHE_ENABLED", "false").lower() == "true",
+            semantic_cache_threshold=float(os.getenv("RAG_SEMANTIC_CACHE_THRESHOLD", "0.95")),
+            semantic_cache_max_entries=_get_int("RAG_SEMANTIC_CACHE_MAX_ENTRIES", 64),
+            single_flight_lock_ttl=float(os.getenv("RAG_SINGLE_FLIGHT_LOCK_TTL", "30")),
+            single_flight_poll_interval_ms=_get_int("RAG_SINGLE_FLIGHT_POLL_MS", 50),
+            cache_early_refresh_beta=float(os.getenv("RAG_CACHE_EARLY_REFRESH_BETA", "1.0")),
+            local_cache_enabled=os.getenv("RAG_LOCAL_CACHE_ENABLED", "true").lower() == "true",
+            local_cache_max_entries=_get_int("RAG_LOCAL_CACHE_MAX_ENTRIES", 10_000),
+            local_cache_max_bytes=_get_int("RAG_LOCAL_CACHE_MAX_BYTES", 64 * 1024 * 1024),
+            local_cache_ttl=_get_int("RAG_LOCAL_CACHE_TTL", 60),
+            cache_generation_ttl=float(os.getenv("RAG_CACHE_GENERATION_TTL", "1.0")),
+        ),
+        cache=CacheSettings(
+            embedding_cache_enabled=os.getenv("CACHE_EMBEDDINGS_ENABLED", "true").lower() == "true",
+            embedding_cache_redis_enabled=os.getenv("CACHE_EMBEDDINGS_REDIS_ENABLED", "true").lower() == "true",
+            embedding_cache_ttl=_get_int("CACHE_EMBEDDINGS_TTL", 2_592_000),
+            embedding_cache_local_max_entries=_get_int("CACHE_EMBEDDINGS_LOCAL_MAX_ENTRIES", 4_096),
+            embedding_cache_local_max_bytes=_get_int("CACHE_EMBEDDINGS_LOCAL_MAX_BYTES", 32 * 1024 * 1024),
+            embedding_cache_local_ttl=_get_int("CACHE_EMBEDDINGS_LOCAL_TTL", 3600),
+            embedding_cache_key_prefix=os.getenv("CACHE_EMBEDDINGS_KEY_PREFIX", "emb:"),
+            project_cache_ttl=float(os.getenv("CACHE_PROJECTS_TTL", "10")),
+            project_cache_max_entries=_get_int("CACHE_PROJECTS_MAX_ENTRIES", 10_000),
+            user_cache_ttl=float(os.getenv("CACHE_USERS_TTL", "10")),
+            user_cache_max_entries=_get_int("CACHE_USERS_MAX_ENTRIES", 10_000),
         ),
     )
 
@@ -6,6 +6,7 @@ from typing import Optional
 import asyncpg
 
 from src.shared.config.settings import load_settings
+from src.shared.infrastructure.database.vector_codec import register_vector_codec
 
 
 _pool: Optional[asyncpg.Pool] = None
@@ -19,7 +20,12 @@ async def init_pool() -> asyncpg.Pool:
     async with _init_lock:
         if _pool is None:
             settings = load_settings()
-            _pool = await asyncpg.create_pool(dsn=settings.db.dsn, min_size=1, max_size=5)
+            _pool = await asyncpg.create_pool(
+                dsn=settings.db.dsn,
+                min_size=1,
+                max_size=settings.db.pool_max_size,
+                init=register_vector_codec,
+            )
     return _pool
 
 
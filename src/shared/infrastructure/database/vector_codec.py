@@ -0,0 +1,79 @@
+"""Binary asyncpg codec for the pgvector ``vector`` type.
+
+pgvector's binary wire format is a big-endian ``int16`` dimension count, an
+``int16`` reserved field and ``dim`` big-endian ``float4`` values. Decoding goes
+straight into a compact ``array('f')`` and encoding reads from any float sequence,
+so embeddings never round-trip through their decimal text representation.
+"""
+
+from __future__ import annotations
+
+import logging
+import struct
+import sys
+from array import array
+from typing import Sequence
+
+import asyncpg
+
+logger = logging.getLogger(__name__)
+
+_HEADER = struct.Struct(">HH")
+_NEEDS_BYTESWAP = sys.byteorder == "little"
+
+
+def encode_vector(value: Sequence[float]) -> bytes:
+    """Encode a float sequence into pgvector's binary format.
+
+    Args:
+        value: Embedding as ``array('f')``, list of floats or any float sequence
+
+    Returns:
+        Binary ``vector`` payload
+    """
+    if isinstance(value, array) and value.typecode == "f":
+        buffer = array("f", value)
+    else:
+        buffer = array("f", (float(x) for x in value))
+    if _NEEDS_BYTESWAP:
+        buffer.byteswap()
+    return _HEADER.pack(len(buffer), 0) + buffer.tobytes()
+
+
+def decode_vector(data: bytes) -> array:
+    """Decode pgvector's binary format into an ``array('f')``.
+
+    Args:
+        data: Binary ``vector`` payload
+
+    Returns:
+        Embedding values as a native-endian ``array('f')``
+    """
+    dim, _ = _HEADER.unpack_from(data)
+    buffer = array("f")
+    buffer.frombytes(data[_HEADER.size : _HEADER.size + 4 * dim])
+    if _NEEDS_BYTESWAP:
+        buffer.byteswap()
+    return buffer
+
+
+async def register_vector_codec(conn: asyncpg.Connection) -> None:
+    """Register the binary ``vector`` codec on a connection.
+
+    Intended as the ``init`` callback of ``asyncpg.create_pool``. Databases where the
+    pgvector extension has not been created yet (e.g. before migrations run) are
+    left untouched.
+
+    Args:
+        conn: Freshly opened asyncpg connection
+    """
+    try:
+        await conn.set_type_codec(
+            "vector",
+            schema="public",
+            encoder=encode_vector,
+            decoder=decode_vector,
+            format="binary",
+        )
+    except ValueError:
+        logger.warning("pgvector 'vector' type not found; binary vector codec not registered")
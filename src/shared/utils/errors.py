@@ -54,7 +54,16 @@ class LLMAuthenticationError(LLMProviderError):
 
 
 class LLMRateLimitError(LLMProviderError):
-    """Raised when LLM provider rate limit is exceeded (429 errors)."""
+    """Raised when LLM provider rate limit is exceeded (429 errors).
+
+    Attributes:
+        retry_after: Seconds the provider asked clients to wait before retrying
+            (from the Retry-After header), or None if it did not say.
+    """
+
+    def __init__(self, message: str, retry_after: float | None = None) -> None:
+        super().__init__(message)
+        self.retry_after = retry_after
 
 
 class LLMConnectionError(LLMProviderError):
@@ -23,3 +23,34 @@ async def test_health_endpoint_verifies_db_connection():
         data = response.json()
         assert "db" in data
         assert data["db"] in ["ok", "down"]  # Should be one of these states
+
+
+@pytest.mark.asyncio
+async def test_embedding_metrics_endpoint():
+    """Test that the embedding scheduler metrics endpoint reports per-provider state."""
+    async with AsyncClient(base_url="http://localhost:8000") as client:
+        token = await client.post(
+            "/api/v1/auth/token",
+            data={"username": "testuser", "password": "testpass"},
+        )
+        response = await client.get(
+            "/api/v1/metrics/embeddings",
+            headers={"Authorization": f"Bearer {token.json()['access_token']}"},
+        )
+
+        assert response.status_code == 200
+        providers = response.json()["providers"]
+        for metrics in providers.values():
+            assert {"concurrency_limit", "in_flight", "queue_depth"} <= metrics.keys()
+        cache = response.json()["cache"]
+        if cache is not None:
+            assert {"local_hits", "redis_hits", "misses", "hit_rate"} <= cache.keys()
+
+
+@pytest.mark.asyncio
+async def test_embedding_metrics_endpoint_requires_auth():
+    """Test that the embedding metrics endpoint rejects unauthenticated requests."""
+    async with AsyncClient(base_url="http://localhost:8000") as client:
+        response = await client.get("/api/v1/metrics/embeddings")
+
+        assert response.status_code == 401
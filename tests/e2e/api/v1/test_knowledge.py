@@ -46,6 +46,7 @@ def mock_llm_provider():
     with patch("src.infrastructure.external.llm.provider_factory.ProviderFactory.get_embedding_provider") as mock:
         mock_provider = AsyncMock()
         mock_provider.embed_text.return_value = fake_embedding
+        mock_provider.embed_texts.side_effect = lambda texts, model=None: [fake_embedding for _ in texts]
         mock.return_value = mock_provider
         yield mock_provider
 
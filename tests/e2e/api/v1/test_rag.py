@@ -39,6 +39,7 @@ def mock_embedding_provider():
     mock_provider = AsyncMock()
     # Return a 1536-dimensional vector (standard for many models)
     mock_provider.embed_text.return_value = [0.1] * 1536
+    mock_provider.embed_texts.side_effect = lambda texts, model=None: [[0.1] * 1536 for _ in texts]
     return mock_provider
 
 
@@ -892,3 +893,115 @@ async def test_rag_query_synthesis_graceful_degradation_on_failure(async_client,
         # But results should still be returned
         assert "results" in data
         assert "total_results" in data
+
+
+# ============================================================================
+# POST /api/v1/rag/query/batch - Batch RAG Query Endpoint Tests
+# ============================================================================
+
+
+async def test_rag_query_batch_unauthorized():
+    """Test batch request without JWT token returns 401."""
+    async with AsyncClient(app=app, base_url="http://test") as ac:
+        response = await ac.post(
+            "/api/v1/rag/query/batch",
+            json={"project_id": str(uuid4()), "queries": ["test query"]},
+        )
+    assert response.status_code == 401
+
+
+async def test_rag_query_batch_empty_queries_validation(auth_headers):
+    """Test batch validation: an empty query list returns 422."""
+    async with AsyncClient(app=app, base_url="http://test") as ac:
+        response = await ac.post(
+            "/api/v1/rag/query/batch",
+            json={"project_id": str(uuid4()), "queries": []},
+            headers=auth_headers,
+        )
+    assert response.status_code == 422
+
+
+async def test_rag_query_batch_returns_responses_in_order(auth_headers, mock_embedding_provider):
+    """Test batch query returns one response per query and embeds them in one call."""
+    with patch("src.application.use_cases.knowledge.query_knowledge.ProviderFactory.get_embedding_provider", return_value=mock_embedding_provider):
+        async with AsyncClient(app=app, base_url="http://test") as ac:
+            project_response = await ac.post(
+                "/api/v1/projects",
+                json={"name": "Test Project", "description": "Test"},
+                headers=auth_headers,
+            )
+            assert project_response.status_code == 201
+            project_id = project_response.json()["id"]
+
+            response = await ac.post(
+                "/api/v1/rag/query/batch",
+                json={
+                    "project_id": project_id,
+                    "queries": ["first question", "second question", "third question"],
+                    "top_k": 3,
+                },
+                headers=auth_headers,
+            )
+
+        assert response.status_code == 200
+        data = response.json()
+        assert data["total_queries"] == 3
+        assert len(data["responses"]) == 3
+        assert all("results" in item for item in data["responses"])
+        mock_embedding_provider.embed_texts.assert_called_once()
+        mock_embedding_provider.embed_text.assert_not_called()
+
+
+# ============================================================================
+# POST /api/v1/rag/query/stream - Streaming RAG Query Endpoint Tests
+# ============================================================================
+
+
+async def test_rag_query_stream_invalid_project_id(auth_headers, mock_embedding_provider):
+    """Test streaming query with invalid project_id returns 404 before streaming."""
+    with patch("src.application.use_cases.knowledge.query_knowledge.ProviderFactory.get_embedding_provider", return_value=mock_embedding_provider):
+        async with AsyncClient(app=app, base_url="http://test") as ac:
+            response = await ac.post(
+                "/api/v1/rag/query/stream",
+                json={"project_id": str(uuid4()), "query_text": "test query"},
+                headers=auth_headers,
+            )
+        assert response.status_code == 404
+
+
+async def test_rag_query_stream_sends_results_then_tokens(auth_headers, mock_embedding_provider):
+    """Test streaming query emits results, token and done events in order."""
+
+    async def stream(**kwargs):
+        for token in ["Streamed ", "answer."]:
+            yield token
+
+    mock_llm_provider = MagicMock()
+    mock_llm_provider.generate_completion_stream = MagicMock(side_effect=stream)
+
+    with patch("src.application.use_cases.knowledge.query_knowledge.ProviderFactory.get_embedding_provider", return_value=mock_embedding_provider), \
+         patch("src.application.use_cases.knowledge.query_knowledge.ProviderFactory.get_llm_provider", return_value=mock_llm_provider):
+        async with AsyncClient(app=app, base_url="http://test") as ac:
+            project_response = await ac.post(
+                "/api/v1/projects",
+                json={"name": "Test Project", "description": "Test"},
+                headers=auth_headers,
+            )
+            assert project_response.status_code == 201
+            project_id = project_response.json()["id"]
+
+            response = await ac.post(
+                "/api/v1/rag/query/stream",
+                json={"project_id": project_id, "query_text": "test content", "use_agentic_rag": True},
+                headers=auth_headers,
+            )
+
+        assert response.status_code == 200
+        assert response.headers["content-type"].startswith("text/event-stream")
+        events = [
+            line.removeprefix("event: ")
+            for line in response.text.splitlines()
+            if line.startswith("event: ")
+        ]
+        assert events[0] == "results"
+        assert events[-1] == "done"
@@ -359,10 +359,11 @@ class TestDocumentRepository:
             embedding_str = '[' + ','.join(str(x) for x in embedding) + ']'
             await conn.execute(
                 """
-                INSERT INTO knowledge_items (id, document_id, chunk_text, chunk_index, embedding, created_at)
-                VALUES ($1, $2, $3, $4, $5::vector, NOW())
+                INSERT INTO knowledge_items (id, project_id, document_id, chunk_text, chunk_index, embedding, created_at)
+                VALUES ($1, $2, $3, $4, $5, $6::vector, NOW())
                 """,
                 uuid4(),
+                project_id,
                 doc_id,
                 "Test chunk",
                 0,
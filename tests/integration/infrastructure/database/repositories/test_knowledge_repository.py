@@ -6,14 +6,20 @@ from datetime import datetime
 from uuid import uuid4
 
 from src.domain.models.knowledge import KnowledgeItem
-from src.infrastructure.database.repositories.knowledge_repository import KnowledgeRepository
+from src.infrastructure.database.repositories.knowledge_repository import (
+    COPY_MIN_BATCH_SIZE,
+    KnowledgeRepository,
+)
 from src.shared.config.settings import load_settings
+from src.shared.infrastructure.database.vector_codec import register_vector_codec
 
 
 async def get_fresh_pool():
     """Create a fresh connection pool for each test (bypass singleton)."""
     settings = load_settings()
-    return await asyncpg.create_pool(dsn=settings.db.dsn, min_size=1, max_size=5)
+    return await asyncpg.create_pool(
+        dsn=settings.db.dsn, min_size=1, max_size=5, init=register_vector_codec
+    )
 
 
 async def create_test_project_and_document():
@@ -126,6 +132,41 @@ class TestKnowledgeRepository:
         finally:
             await cleanup_test_project(pool, project_id)
 
+    async def test_create_batch_bulk_copy(self):
+        """Test that large batches go through the COPY path and round-trip correctly."""
+        # Arrange
+        pool, project_id, doc_id = await create_test_project_and_document()
+        repo = KnowledgeRepository(pool)
+        count = COPY_MIN_BATCH_SIZE * 2
+        items = [
+            KnowledgeItem(
+                id=uuid4(),
+                document_id=doc_id,
+                chunk_text=f"Bulk chunk {i}",
+                chunk_index=i,
+                embedding=[0.25] * 1536,
+                metadata={"chunk_num": i},
+                created_at=datetime.utcnow(),
+            )
+            for i in range(count)
+        ]
+
+        try:
+            # Act
+            created_items = await repo.create_batch(items)
+            stored = await repo.get_by_document(doc_id, limit=count)
+
+            # Assert
+            assert [item.id for item in created_items] == [item.id for item in items]
+            assert len(stored) == count
+            assert stored[3].chunk_text == "Bulk chunk 3"
+            assert stored[3].metadata == {"chunk_num": 3}
+            assert list(stored[3].embedding[:2]) == [0.25, 0.25]
+            # project_id is resolved from the parent document when not set
+            assert all(item.project_id == project_id for item in stored)
+        finally:
+            await cleanup_test_project(pool, project_id)
+
     async def test_get_by_id_existing(self):
         """Test retrieving an existing knowledge item by ID."""
         # Arrange
@@ -151,6 +192,7 @@ class TestKnowledgeRepository:
             assert found is not None
             assert found.id == item.id
             assert found.chunk_text == "Test chunk"
+            assert found.project_id == project_id
         finally:
             await cleanup_test_project(pool, project_id)
 
@@ -345,12 +387,14 @@ class TestKnowledgeRepository:
 
         try:
             # Act
+            assert await repo.count_by_project(project_id) == 1
             deleted = await repo.delete(item.id)
 
             # Assert
             assert deleted is True
             found = await repo.get_by_id(item.id)
             assert found is None
+            assert await repo.count_by_project(project_id) == 0
         finally:
             await cleanup_test_project(pool, project_id)
 
@@ -390,12 +434,14 @@ class TestKnowledgeRepository:
 
         try:
             # Act
+            assert await repo.count_by_project(project_id) == 3
             count = await repo.delete_by_document(doc_id)
 
             # Assert
             assert count == 3
             remaining = await repo.get_by_document(doc_id)
             assert len(remaining) == 0
+            assert await repo.count_by_project(project_id) == 0
         finally:
             await cleanup_test_project(pool, project_id)
 
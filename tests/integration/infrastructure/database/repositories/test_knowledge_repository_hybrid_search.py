@@ -0,0 +1,162 @@
+"""Integration tests for KnowledgeRepository hybrid_search method with real PostgreSQL."""
+
+import pytest
+import asyncpg
+from datetime import datetime
+from uuid import uuid4
+
+from src.application.services.hybrid_search_service import HybridSearchService
+from src.domain.models.document import Document, DocumentType
+from src.domain.models.knowledge import KnowledgeItem
+from src.infrastructure.database.repositories.knowledge_repository import KnowledgeRepository
+from src.infrastructure.database.repositories.document_repository import DocumentRepository
+from src.shared.config.settings import load_settings
+from src.shared.infrastructure.database.vector_codec import register_vector_codec
+
+
+async def get_fresh_pool():
+    """Create a fresh connection pool for each test (bypass singleton)."""
+    settings = load_settings()
+    return await asyncpg.create_pool(
+        dsn=settings.db.dsn, min_size=1, max_size=5, init=register_vector_codec
+    )
+
+
+async def create_test_document():
+    """Helper to create a test project with one document and return pool, project and document IDs."""
+    pool = await get_fresh_pool()
+    project_id = uuid4()
+    async with pool.acquire() as conn:
+        await conn.execute(
+            """
+            INSERT INTO projects (id, name, description, status, tags, owner_id, created_at, updated_at)
+            VALUES ($1, $2, $3, $4, $5, $6, NOW(), NOW())
+            """,
+            project_id,
+            "Test Project",
+            "Integration test project",
+            "Active",
+            [],
+            uuid4(),
+        )
+
+    now = datetime.utcnow()
+    doc_id = uuid4()
+    await DocumentRepository(pool).create(
+        Document(
+            id=doc_id,
+            project_id=project_id,
+            name="test.md",
+            type=DocumentType.MARKDOWN,
+            version="1.0.0",
+            content_hash="f" * 64,
+            created_at=now,
+            updated_at=now,
+        )
+    )
+    return pool, project_id, doc_id
+
+
+async def cleanup_test_project(pool, project_id):
+    """Cleanup test project (CASCADE delete) and close pool."""
+    async with pool.acquire() as conn:
+        await conn.execute("DELETE FROM projects WHERE id = $1", project_id)
+    await pool.close()
+
+
+@pytest.mark.asyncio
+class TestKnowledgeRepositoryHybridSearch:
+    """Integration tests for KnowledgeRepository hybrid_search using real PostgreSQL database."""
+
+    async def test_hybrid_search_matches_python_rrf(self):
+        """Test that SQL-side fusion ranks and scores like HybridSearchService.merge_results."""
+        # Arrange
+        pool, project_id, doc_id = await create_test_document()
+        knowledge_repo = KnowledgeRepository(pool)
+        now = datetime.utcnow()
+
+        query_embedding = [1.0] + [0.0] * 1535
+        chunks = [
+            ("Neural networks learn representations", [0.9] + [0.1] * 1535),
+            ("Gradient descent optimizes neural networks", [0.5] + [0.5] * 1535),
+            ("Databases store rows on disk", [0.1] + [0.9] * 1535),
+        ]
+        items = [
+            KnowledgeItem(
+                id=uuid4(),
+                document_id=doc_id,
+                chunk_text=text,
+                chunk_index=i,
+                embedding=embedding,
+                metadata={},
+                created_at=now,
+            )
+            for i, (text, embedding) in enumerate(chunks)
+        ]
+        await knowledge_repo.create_batch(items)
+
+        try:
+            # Act
+            fused = await knowledge_repo.hybrid_search(
+                project_id=project_id,
+                query_embedding=query_embedding,
+                query_text="neural networks",
+                top_k=3,
+                weight_vector=0.7,
+                weight_bm25=0.3,
+                rrf_k=60,
+            )
+            expected = await HybridSearchService().merge_results(
+                vector_results=await knowledge_repo.vector_search(project_id, query_embedding, 3),
+                keyword_results=await knowledge_repo.keyword_search(project_id, "neural networks", 3),
+                weight_vector=0.7,
+                weight_bm25=0.3,
+                k=60,
+            )
+
+            # Assert
+            assert [item.id for item, _ in fused] == [item.id for item, _ in expected]
+            for (_, score), (_, expected_score) in zip(fused, expected):
+                assert score == pytest.approx(expected_score)
+            assert all(item.embedding is None for item, _ in fused)
+        finally:
+            await cleanup_test_project(pool, project_id)
+
+    async def test_hybrid_search_respects_top_k(self):
+        """Test that only the fused top_k rows are returned."""
+        # Arrange
+        pool, project_id, doc_id = await create_test_document()
+        knowledge_repo = KnowledgeRepository(pool)
+        now = datetime.utcnow()
+
+        items = [
+            KnowledgeItem(
+                id=uuid4(),
+                document_id=doc_id,
+                chunk_text=f"Python chunk number {i}",
+                chunk_index=i,
+                embedding=[0.5] * 1536,
+                metadata={},
+                created_at=now,
+            )
+            for i in range(6)
+        ]
+        await knowledge_repo.create_batch(items)
+
+        try:
+            # Act
+            fused = await knowledge_repo.hybrid_search(
+                project_id=project_id,
+                query_embedding=[0.5] * 1536,
+                query_text="python",
+                top_k=4,
+                weight_vector=0.7,
+                weight_bm25=0.3,
+            )
+
+            # Assert
+            assert len(fused) == 4
+            scores = [score for _, score in fused]
+            assert scores == sorted(scores, reverse=True)
+        finally:
+            await cleanup_test_project(pool, project_id)
@@ -6,16 +6,26 @@ from datetime import datetime
 from uuid import uuid4
 
 from src.domain.models.document import Document, DocumentType
-from src.domain.models.knowledge import KnowledgeItem
+from src.domain.models.knowledge import (
+    IterativeScanMode,
+    KnowledgeItem,
+    SearchEffort,
+    SearchPlan,
+    SearchStats,
+    VectorIndexMode,
+)
 from src.infrastructure.database.repositories.knowledge_repository import KnowledgeRepository
 from src.infrastructure.database.repositories.document_repository import DocumentRepository
 from src.shared.config.settings import load_settings
+from src.shared.infrastructure.database.vector_codec import register_vector_codec
 
 
 async def get_fresh_pool():
     """Create a fresh connection pool for each test (bypass singleton)."""
     settings = load_settings()
-    return await asyncpg.create_pool(dsn=settings.db.dsn, min_size=1, max_size=5)
+    return await asyncpg.create_pool(
+        dsn=settings.db.dsn, min_size=1, max_size=5, init=register_vector_codec
+    )
 
 
 async def create_test_project():
@@ -336,3 +346,292 @@ class TestKnowledgeRepositoryVectorSearch:
                 assert 0.0 <= score <= 1.0
         finally:
             await cleanup_test_project(pool, project_id)
+
+    async def test_vector_search_omits_embeddings_by_default(self):
+        """Test vector_search skips the embedding column unless asked, and get_embeddings loads it."""
+        # Arrange
+        pool, project_id = await create_test_project()
+        doc_repo = DocumentRepository(pool)
+        knowledge_repo = KnowledgeRepository(pool)
+
+        now = datetime.utcnow()
+        doc_id = uuid4()
+        doc = Document(
+            id=doc_id,
+            project_id=project_id,
+            name="test.md",
+            type=DocumentType.MARKDOWN,
+            version="1.0.0",
+            content_hash="e" * 64,
+            created_at=now,
+            updated_at=now,
+        )
+        await doc_repo.create(doc)
+
+        item_id = uuid4()
+        await knowledge_repo.create(
+            KnowledgeItem(
+                id=item_id,
+                document_id=doc_id,
+                chunk_text="Projected chunk",
+                chunk_index=0,
+                embedding=[0.5] * 1536,
+                metadata={},
+                created_at=now,
+            )
+        )
+
+        try:
+            # Act
+            lean = await knowledge_repo.vector_search(
+                project_id=project_id, query_embedding=[0.5] * 1536, top_k=10
+            )
+            full = await knowledge_repo.vector_search(
+                project_id=project_id,
+                query_embedding=[0.5] * 1536,
+                top_k=10,
+                include_embedding=True,
+            )
+            embeddings = await knowledge_repo.get_embeddings([item_id, uuid4()])
+
+            # Assert
+            assert lean[0][0].id == item_id
+            assert lean[0][0].embedding is None
+            assert len(full[0][0].embedding) == 1536
+            assert list(embeddings) == [item_id]
+            assert list(embeddings[item_id][:2]) == [0.5, 0.5]
+        finally:
+            await cleanup_test_project(pool, project_id)
+
+    async def test_vector_search_applies_effort_and_reports_candidates(self):
+        """Test vector_search with an explicit search effort fills in scan statistics."""
+        # Arrange
+        pool, project_id = await create_test_project()
+        doc_repo = DocumentRepository(pool)
+        knowledge_repo = KnowledgeRepository(pool, collect_candidates_scanned=True)
+
+        now = datetime.utcnow()
+        doc_id = uuid4()
+        await doc_repo.create(
+            Document(
+                id=doc_id,
+                project_id=project_id,
+                name="test.md",
+                type=DocumentType.MARKDOWN,
+                version="1.0.0",
+                content_hash="9" * 64,
+                created_at=now,
+                updated_at=now,
+            )
+        )
+        await knowledge_repo.create_batch(
+            [
+                KnowledgeItem(
+                    id=uuid4(),
+                    document_id=doc_id,
+                    chunk_text=f"Chunk {i}",
+                    chunk_index=i,
+                    embedding=[0.5] * 1536,
+                    metadata={},
+                    created_at=now,
+                )
+                for i in range(5)
+            ]
+        )
+
+        try:
+            # Act
+            stats = SearchStats()
+            results = await knowledge_repo.vector_search(
+                project_id=project_id,
+                query_embedding=[0.5] * 1536,
+                top_k=3,
+                effort=SearchEffort(ef_search=100, iterative_scan=IterativeScanMode.RELAXED_ORDER),
+                stats=stats,
+            )
+
+            # Assert
+            assert len(results) == 3
+            assert stats.candidates_scanned is not None
+            assert stats.candidates_scanned >= len(results)
+        finally:
+            await cleanup_test_project(pool, project_id)
+
+    async def test_vector_search_reports_candidates_for_index_scans(self):
+        """Test rows fetched through an index scan are counted as candidates."""
+        # Arrange
+        pool, project_id = await create_test_project()
+        doc_repo = DocumentRepository(pool)
+        knowledge_repo = KnowledgeRepository(pool)
+
+        now = datetime.utcnow()
+        doc_id = uuid4()
+        await doc_repo.create(
+            Document(
+                id=doc_id,
+                project_id=project_id,
+                name="test.md",
+                type=DocumentType.MARKDOWN,
+                version="1.0.0",
+                content_hash="6" * 64,
+                created_at=now,
+                updated_at=now,
+            )
+        )
+        await knowledge_repo.create_batch(
+            [
+                KnowledgeItem(
+                    id=uuid4(),
+                    document_id=doc_id,
+                    chunk_text=f"Chunk {i}",
+                    chunk_index=i,
+                    embedding=[0.5] * 1536,
+                    metadata={},
+                    created_at=now,
+                )
+                for i in range(5)
+            ]
+        )
+
+        # Sequential and bitmap scans off, so the ANN plan reads through an index
+        settings = load_settings()
+        index_pool = await asyncpg.create_pool(
+            dsn=settings.db.dsn,
+            min_size=1,
+            max_size=1,
+            init=register_vector_codec,
+            server_settings={"enable_seqscan": "off", "enable_bitmapscan": "off"},
+        )
+
+        try:
+            # Act
+            stats = SearchStats()
+            results = await KnowledgeRepository(
+                index_pool, exact_search_max_chunks=0, collect_candidates_scanned=True
+            ).vector_search(
+                project_id=project_id,
+                query_embedding=[0.5] * 1536,
+                top_k=3,
+                stats=stats,
+            )
+
+            # Assert
+            assert stats.plan == SearchPlan.ANN
+            assert len(results) == 3
+            assert stats.candidates_scanned > 0
+        finally:
+            await index_pool.close()
+            await cleanup_test_project(pool, project_id)
+
+    async def test_vector_search_plan_follows_project_size(self):
+        """Test small projects are searched exactly and large ones through HNSW."""
+        # Arrange
+        pool, project_id = await create_test_project()
+        doc_repo = DocumentRepository(pool)
+
+        now = datetime.utcnow()
+        doc_id = uuid4()
+        await doc_repo.create(
+            Document(
+                id=doc_id,
+                project_id=project_id,
+                name="test.md",
+                type=DocumentType.MARKDOWN,
+                version="1.0.0",
+                content_hash="8" * 64,
+                created_at=now,
+                updated_at=now,
+            )
+        )
+        await KnowledgeRepository(pool).create_batch(
+            [
+                KnowledgeItem(
+                    id=uuid4(),
+                    document_id=doc_id,
+                    chunk_text=f"Chunk {i}",
+                    chunk_index=i,
+                    embedding=[0.5] * 1536,
+                    metadata={},
+                    created_at=now,
+                )
+                for i in range(5)
+            ]
+        )
+
+        try:
+            # Act
+            exact_stats = SearchStats()
+            exact_results = await KnowledgeRepository(pool, exact_search_max_chunks=5).vector_search(
+                project_id=project_id, query_embedding=[0.5] * 1536, top_k=3, stats=exact_stats
+            )
+            ann_stats = SearchStats()
+            await KnowledgeRepository(pool, exact_search_max_chunks=4).vector_search(
+                project_id=project_id, query_embedding=[0.5] * 1536, top_k=3, stats=ann_stats
+            )
+
+            # Assert
+            assert await KnowledgeRepository(pool).count_by_project(project_id) == 5
+            assert len(exact_results) == 3
+            assert exact_stats.plan == SearchPlan.EXACT
+            assert ann_stats.plan == SearchPlan.ANN
+            assert exact_stats.duration_ms >= 0.0
+        finally:
+            await cleanup_test_project(pool, project_id)
+
+    async def test_vector_search_quantized_modes_rescore_at_full_precision(self):
+        """Test halfvec and binary modes return the same ranking and exact similarity scores."""
+        # Arrange
+        pool, project_id = await create_test_project()
+        doc_repo = DocumentRepository(pool)
+
+        now = datetime.utcnow()
+        doc_id = uuid4()
+        await doc_repo.create(
+            Document(
+                id=doc_id,
+                project_id=project_id,
+                name="test.md",
+                type=DocumentType.MARKDOWN,
+                version="1.0.0",
+                content_hash="7" * 64,
+                created_at=now,
+                updated_at=now,
+            )
+        )
+        embeddings = [[1.0] + [0.0] * 1535, [0.9] + [0.1] * 1535, [0.1] + [0.9] * 1535]
+        await KnowledgeRepository(pool).create_batch(
+            [
+                KnowledgeItem(
+                    id=uuid4(),
+                    document_id=doc_id,
+                    chunk_text=f"Chunk {i}",
+                    chunk_index=i,
+                    embedding=embedding,
+                    metadata={},
+                    created_at=now,
+                )
+                for i, embedding in enumerate(embeddings)
+            ]
+        )
+        query_embedding = [1.0] + [0.0] * 1535
+
+        try:
+            # Act
+            results = {}
+            similar = {}
+            for mode in VectorIndexMode:
+                repo = KnowledgeRepository(pool, exact_search_max_chunks=0, vector_index_mode=mode)
+                results[mode] = await repo.vector_search(project_id, query_embedding, top_k=2)
+                similar[mode] = await repo.search_similar(
+                    query_embedding, limit=2, project_id=project_id, similarity_threshold=0.0
+                )
+
+            # Assert
+            full = results[VectorIndexMode.FULL]
+            for mode in (VectorIndexMode.HALFVEC, VectorIndexMode.BINARY):
+                assert [item.id for item, _ in results[mode]] == [item.id for item, _ in full]
+                for (_, score), (_, full_score) in zip(results[mode], full):
+                    assert score == pytest.approx(full_score)
+                assert [item.id for item, _ in similar[mode]] == [item.id for item, _ in full]
+        finally:
+            await cleanup_test_project(pool, project_id)
@@ -3,6 +3,7 @@ import pytest_asyncio
 from uuid import uuid4
 
 from src.domain.models.project import Project
+from src.infrastructure.cache.local_cache import LocalCache
 from src.infrastructure.database.repositories.project_repository import ProjectRepository
 from src.shared.infrastructure.database.connection import init_pool
 
@@ -47,4 +48,25 @@ async def test_crud_project_repository():
     # Delete
     await repo.delete(p.id)
     missing = await repo.get_by_id(p.id)
-    assert missing is None
\ No newline at end of file
+    assert missing is None
+
+
+async def test_project_cache_is_evicted_on_update_and_delete():
+    cache = LocalCache(max_entries=10, ttl=60)
+    repo = ProjectRepository(cache=cache)
+    p = Project(name="CachedRepoTest", owner_id=uuid4())
+    await repo.create(p)
+
+    # Cached reads hand out copies, so changing one does not touch the cache
+    fetched = await repo.get_by_id(p.id)
+    fetched.name = "Changed locally"
+    assert (await repo.get_by_id(p.id)).name == "CachedRepoTest"
+
+    # Update evicts
+    p.name = "CachedRepoTest2"
+    await repo.update(p)
+    assert (await repo.get_by_id(p.id)).name == "CachedRepoTest2"
+
+    # Delete evicts
+    await repo.delete(p.id)
+    assert await repo.get_by_id(p.id) is None
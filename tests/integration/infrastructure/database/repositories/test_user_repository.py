@@ -6,6 +6,7 @@ import pytest
 import asyncpg
 
 from src.domain.models.user import User
+from src.infrastructure.cache.local_cache import LocalCache
 from src.infrastructure.database.repositories.user_repository import UserRepository
 from src.shared.config.settings import load_settings
 from src.shared.utils.errors import UserNotFoundError
@@ -317,6 +318,45 @@ class TestUserRepositoryDelete:
             await pool.close()
 
 
+class TestUserRepositoryCache:
+    """Tests for UserRepository with a user cache."""
+
+    @pytest.mark.asyncio
+    async def test_cached_user_is_evicted_on_rename_and_delete(self):
+        """Test writes evict cached users under both old and new usernames."""
+        # Arrange
+        pool = await get_fresh_pool()
+        cache = LocalCache(max_entries=10, ttl=60)
+        user_repo = UserRepository(pool, cache=cache)
+        
+        user = User(
+            username="testuser10",
+            email="testuser10@example.com",
+            hashed_password="$2b$12$hashedpassword",
+        )
+        
+        try:
+            await user_repo.create(user)
+            await user_repo.get_by_username("testuser10")
+            assert cache.get("testuser10") is not None
+
+            # Act
+            user.username = "testuser10b"
+            await user_repo.update(user)
+
+            # Assert
+            assert cache.get("testuser10") is None
+            assert await user_repo.get_by_username("testuser10") is None
+            assert (await user_repo.get_by_username("testuser10b")).id == user.id
+
+            await user_repo.delete(user.id)
+            assert await user_repo.get_by_username("testuser10b") is None
+        finally:
+            async with pool.acquire() as conn:
+                await conn.execute("DELETE FROM users WHERE username LIKE 'test%'")
+            await pool.close()
+
+
 class TestUserRepositoryGetAll:
     """Tests for UserRepository.get_all()."""
 
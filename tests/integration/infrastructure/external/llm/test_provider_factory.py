@@ -3,6 +3,9 @@
 import pytest
 import os
 from unittest.mock import patch
+from src.infrastructure.external.llm.embedding_cache_provider import CachedEmbeddingProvider
+from src.infrastructure.external.llm.embedding_coalescer import CoalescingEmbeddingProvider
+from src.infrastructure.external.llm.embedding_scheduler import EmbeddingScheduler
 from src.infrastructure.external.llm.provider_factory import ProviderFactory
 from src.infrastructure.external.llm.providers.openai_provider import OpenAIProvider
 from src.infrastructure.external.llm.providers.ollama_provider import OllamaProvider
@@ -109,3 +112,62 @@ class TestProviderFactory:
             # Act & Assert
             with pytest.raises(UnsupportedProviderError, match="embedding"):
                 ProviderFactory.get_embedding_provider()
+
+
+    async def test_get_embedding_provider_is_scheduled_singleton(self):
+        """Test embedding providers are wrapped in one shared scheduler."""
+        # Arrange
+        with patch.dict(os.environ, {
+            'LLM_EMBEDDING_PROVIDER': 'ollama',
+            'CACHE_EMBEDDINGS_ENABLED': 'false',
+        }):
+            # Act
+            provider1 = ProviderFactory.get_embedding_provider()
+            provider2 = ProviderFactory.get_embedding_provider(for_queries=True)
+
+            # Assert - coalescing is opt-in, so queries share the scheduler
+            assert isinstance(provider1, EmbeddingScheduler)
+            assert isinstance(provider1.provider, OllamaProvider)
+            assert provider2 is provider1
+            assert set(ProviderFactory.embedding_metrics()) == {"ollama"}
+
+    async def test_get_query_embedding_provider_coalesces_when_enabled(self):
+        """Test query embeddings go through the coalescer when enabled."""
+        # Arrange
+        with patch.dict(os.environ, {
+            'LLM_EMBEDDING_PROVIDER': 'ollama',
+            'LLM_EMBEDDING_COALESCE_ENABLED': 'true',
+            'LLM_EMBEDDING_COALESCE_WINDOW_MS': '2',
+            'CACHE_EMBEDDINGS_ENABLED': 'false',
+        }):
+            # Act
+            query_provider = ProviderFactory.get_embedding_provider(for_queries=True)
+            ingest_provider = ProviderFactory.get_embedding_provider()
+
+            # Assert
+            assert isinstance(query_provider, CoalescingEmbeddingProvider)
+            assert query_provider.window_ms == 2.0
+            assert query_provider.provider is ingest_provider
+            assert ProviderFactory.get_embedding_provider(for_queries=True) is query_provider
+
+    async def test_get_embedding_provider_shares_cache(self):
+        """Test ingest and query embeddings share one embedding cache in front of the scheduler."""
+        # Arrange
+        with patch.dict(os.environ, {
+            'LLM_EMBEDDING_PROVIDER': 'ollama',
+            'LLM_EMBEDDING_COALESCE_ENABLED': 'true',
+            'CACHE_EMBEDDINGS_REDIS_ENABLED': 'false',
+        }):
+            # Act
+            ingest_provider = ProviderFactory.get_embedding_provider()
+            query_provider = ProviderFactory.get_embedding_provider(for_queries=True)
+
+            # Assert
+            assert isinstance(ingest_provider, CachedEmbeddingProvider)
+            assert isinstance(ingest_provider.provider, EmbeddingScheduler)
+            assert isinstance(query_provider, CachedEmbeddingProvider)
+            assert isinstance(query_provider.provider, CoalescingEmbeddingProvider)
+            assert query_provider.provider.provider is ingest_provider.provider
+            assert query_provider.cache is ingest_provider.cache
+            assert query_provider.cache.redis is None
+            assert ProviderFactory.embedding_cache_metrics()["misses"] == 0
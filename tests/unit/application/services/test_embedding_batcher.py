@@ -0,0 +1,72 @@
+"""Unit tests for EmbeddingBatcher."""
+
+from unittest.mock import AsyncMock
+
+import pytest
+
+from src.application.services.embedding_batcher import EmbeddingBatcher
+
+
+class TestEmbeddingBatcher:
+    """Test cases for EmbeddingBatcher."""
+
+    def test_split_respects_max_items(self):
+        """Test batches hold at most max_items texts."""
+        batcher = EmbeddingBatcher(max_items=2, max_tokens=1000)
+
+        batches = batcher.split(["a", "b", "c", "d", "e"])
+
+        assert batches == [["a", "b"], ["c", "d"], ["e"]]
+
+    def test_split_respects_max_tokens(self):
+        """Test batches stay under the estimated token budget."""
+        batcher = EmbeddingBatcher(max_items=100, max_tokens=10)
+        texts = ["x" * 20, "y" * 16, "z" * 8]  # 5, 4 and 2 estimated tokens
+
+        batches = batcher.split(texts)
+
+        assert batches == [["x" * 20, "y" * 16], ["z" * 8]]
+
+    def test_split_oversized_text_gets_own_batch(self):
+        """Test a text above the token budget is still sent, alone."""
+        batcher = EmbeddingBatcher(max_items=100, max_tokens=10)
+
+        batches = batcher.split(["a", "x" * 400, "b"])
+
+        assert batches == [["a"], ["x" * 400], ["b"]]
+
+    def test_split_empty(self):
+        """Test no batches for no texts."""
+        assert EmbeddingBatcher().split([]) == []
+
+    @pytest.mark.asyncio
+    async def test_iter_batches_matches_split(self):
+        """Test streamed batches equal the batches of the whole list."""
+        batcher = EmbeddingBatcher(max_items=3, max_tokens=10)
+        texts = ["x" * 20, "a", "b", "c", "d", "y" * 400, "e"]
+
+        async def items():
+            for text in texts:
+                yield {"text": text}
+
+        batches = [
+            [item["text"] for item in batch]
+            async for batch in batcher.iter_batches(items(), lambda item: item["text"])
+        ]
+
+        assert batches == batcher.split(texts)
+
+    @pytest.mark.asyncio
+    async def test_embed_one_request_per_batch_in_order(self):
+        """Test embeddings from every batch are concatenated in input order."""
+        batcher = EmbeddingBatcher(max_items=2)
+        provider = AsyncMock()
+        provider.embed_texts = AsyncMock(
+            side_effect=lambda texts: [[float(ord(text))] for text in texts]
+        )
+
+        embeddings = await batcher.embed(provider, ["a", "b", "c"])
+
+        assert embeddings == [[97.0], [98.0], [99.0]]
+        assert provider.embed_texts.await_count == 2
+        provider.embed_text.assert_not_called()
@@ -161,3 +161,23 @@ async def test_merge_results_sorted_by_score(hybrid_service, sample_items):
     # Verify descending order
     scores = [score for _, score in merged]
     assert scores == sorted(scores, reverse=True)
+
+
+@pytest.mark.asyncio
+async def test_merge_results_custom_rrf_k(hybrid_service, sample_items):
+    """Test that the RRF constant k is configurable."""
+    # Arrange
+    vector_results = [(sample_items[0], 0.9)]
+    keyword_results = [(sample_items[0], 10.0)]
+    
+    # Act
+    merged = await hybrid_service.merge_results(
+        vector_results=vector_results,
+        keyword_results=keyword_results,
+        weight_vector=0.7,
+        weight_bm25=0.3,
+        k=10,
+    )
+    
+    # Assert: rank 0 in both lists -> (0.7 + 0.3) / (0 + 10)
+    assert merged[0][1] == pytest.approx(0.1)
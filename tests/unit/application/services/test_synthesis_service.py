@@ -243,3 +243,83 @@ async def test_synthesize_strips_whitespace(mock_llm_provider, mock_settings, sa
     assert result == "Python is a language."
     assert not result.startswith(" ")
     assert not result.endswith(" ")
+
+
+@pytest.mark.asyncio
+async def test_synthesize_stream_yields_tokens(mock_llm_provider, mock_settings, sample_chunks):
+    """Test streaming synthesis yields provider tokens with the synthesis settings."""
+    # Arrange
+    service = SynthesisService()
+
+    async def stream(**kwargs):
+        for token in ["Python ", "", "is a ", "language."]:
+            yield token
+
+    mock_llm_provider.generate_completion_stream = MagicMock(side_effect=stream)
+
+    # Act
+    tokens = [
+        token
+        async for token in service.synthesize_stream(
+            query="What is Python?",
+            chunks=sample_chunks,
+            llm_provider=mock_llm_provider,
+            settings=mock_settings,
+        )
+    ]
+
+    # Assert
+    assert tokens == ["Python ", "is a ", "language."]
+    call_kwargs = mock_llm_provider.generate_completion_stream.call_args.kwargs
+    assert call_kwargs["model"] == mock_settings.agentic_rag_model
+    assert call_kwargs["max_tokens"] == 1000
+    assert "What is Python?" in call_kwargs["messages"][1]["content"]
+    mock_llm_provider.generate_completion.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_synthesize_stream_empty_chunks(mock_llm_provider, mock_settings):
+    """Test streaming synthesis yields nothing without chunks."""
+    # Arrange
+    service = SynthesisService()
+    mock_llm_provider.generate_completion_stream = MagicMock()
+
+    # Act
+    tokens = [
+        token
+        async for token in service.synthesize_stream(
+            query="What is Python?",
+            chunks=[],
+            llm_provider=mock_llm_provider,
+            settings=mock_settings,
+        )
+    ]
+
+    # Assert
+    assert tokens == []
+    mock_llm_provider.generate_completion_stream.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_synthesize_stream_propagates_provider_errors(mock_llm_provider, mock_settings, sample_chunks):
+    """Test streaming synthesis surfaces provider failures to the caller."""
+    # Arrange
+    service = SynthesisService()
+
+    async def stream(**kwargs):
+        yield "Python "
+        raise Exception("LLM API error")
+
+    mock_llm_provider.generate_completion_stream = MagicMock(side_effect=stream)
+
+    # Act & Assert
+    tokens = []
+    with pytest.raises(Exception, match="LLM API error"):
+        async for token in service.synthesize_stream(
+            query="What is Python?",
+            chunks=sample_chunks,
+            llm_provider=mock_llm_provider,
+            settings=mock_settings,
+        ):
+            tokens.append(token)
+    assert tokens == ["Python "]
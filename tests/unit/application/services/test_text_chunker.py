@@ -272,3 +272,48 @@ class TestTextChunkerConfiguration:
         # Assert
         assert len(chunks) > 1
         # Chunks should have significant overlap
+
+
+@pytest.mark.asyncio
+class TestTextChunkerStreaming:
+    """Test chunking text that arrives in fragments."""
+
+    @staticmethod
+    async def fragments(text: str, size: int):
+        for start in range(0, len(text), size):
+            yield text[start : start + size]
+
+    @pytest.mark.parametrize("fragment_size", [1, 7, 100, 10_000])
+    async def test_iter_chunks_matches_semantic_chunk(self, small_chunker, fragment_size):
+        """Test streamed chunks equal the chunks of the whole text."""
+        # Arrange
+        text = " ".join(f"Sentence number {i} ends here." for i in range(60))
+
+        # Act
+        streamed = [
+            chunk async for chunk in small_chunker.iter_chunks(self.fragments(text, fragment_size))
+        ]
+        expected = await small_chunker.semantic_chunk(text)
+
+        # Assert
+        assert [(c.text, c.chunk_index, c.start_char, c.end_char) for c in streamed] == [
+            (c.text, c.chunk_index, c.start_char, c.end_char) for c in expected
+        ]
+
+    async def test_iter_chunks_yields_before_text_ends(self, small_chunker):
+        """Test a chunk is yielded once its text has arrived, not at the end."""
+        # Arrange
+        received: list[str] = []
+
+        async def fragments():
+            for i in range(50):
+                received.append(f"Fragment {i} of the text.")
+                yield received[-1] + " "
+
+        # Act
+        first = await anext(small_chunker.iter_chunks(fragments()))
+
+        # Assert
+        assert first.chunk_index == 0
+        assert len(received) < 50
+
@@ -1,7 +1,11 @@
 """Unit tests for TextExtractor service."""
+import multiprocessing
 import pytest
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 from io import BytesIO
+from unittest.mock import patch
 
+from src.application.services import text_extractor as text_extractor_module
 from src.application.services.text_extractor import TextExtractor
 from src.shared.utils.errors import TextExtractionError
 
@@ -12,6 +16,50 @@ def text_extractor():
     return TextExtractor()
 
 
+def make_pdf(page_texts: list[str]) -> bytes:
+    """Build a minimal PDF with one line of Helvetica text per page."""
+    page_ids = [4 + 2 * i for i in range(len(page_texts))]
+    objects = [
+        b"<< /Type /Catalog /Pages 2 0 R >>",
+        b"<< /Type /Pages /Kids [%s] /Count %d >>"
+        % (b" ".join(b"%d 0 R" % pid for pid in page_ids), len(page_texts)),
+        b"<< /Type /Font /Subtype /Type1 /BaseFont /Helvetica >>",
+    ]
+    for pid, text in zip(page_ids, page_texts):
+        stream = b"BT /F1 12 Tf 72 720 Td (%s) Tj ET" % text.encode("latin-1")
+        objects.append(
+            b"<< /Type /Page /Parent 2 0 R /MediaBox [0 0 612 792] "
+            b"/Resources << /Font << /F1 3 0 R >> >> /Contents %d 0 R >>" % (pid + 1)
+        )
+        objects.append(b"<< /Length %d >>\nstream\n%s\nendstream" % (len(stream), stream))
+
+    pdf = bytearray(b"%PDF-1.4\n")
+    offsets = []
+    for number, body in enumerate(objects, start=1):
+        offsets.append(len(pdf))
+        pdf += b"%d 0 obj\n%s\nendobj\n" % (number, body)
+    xref = len(pdf)
+    pdf += b"xref\n0 %d\n0000000000 65535 f \n" % (len(objects) + 1)
+    pdf += b"".join(b"%010d 00000 n \n" % offset for offset in offsets)
+    pdf += b"trailer\n<< /Size %d /Root 1 0 R >>\nstartxref\n%d\n%%%%EOF\n" % (
+        len(objects) + 1,
+        xref,
+    )
+    return bytes(pdf)
+
+
+class CountingExecutor(ThreadPoolExecutor):
+    """Thread pool that counts submitted tasks."""
+
+    def __init__(self):
+        super().__init__(max_workers=4)
+        self.submitted = 0
+
+    def submit(self, fn, /, *args, **kwargs):
+        self.submitted += 1
+        return super().submit(fn, *args, **kwargs)
+
+
 @pytest.mark.asyncio
 class TestTextExtractorMarkdown:
     """Test markdown text extraction."""
@@ -133,6 +181,98 @@ class TestTextExtractorPDF:
         assert "Failed to extract text from PDF" in str(exc_info.value)
 
 
+    async def test_extract_pdf_pages_in_parallel_ranges(self):
+        """Test PDFs are split into page ranges whose text is joined in page order."""
+        # Arrange
+        pages = [f"Page number {i}" for i in range(5)]
+        pdf = make_pdf(pages)
+        executor = CountingExecutor()
+        extractor = TextExtractor(executor=executor, pdf_pages_per_task=2)
+
+        # Act
+        with patch.object(
+            text_extractor_module,
+            "_extract_pdf_pages",
+            wraps=text_extractor_module._extract_pdf_pages,
+        ) as extract_pages:
+            result = await extractor.extract(pdf, "manual.pdf")
+        executor.shutdown()
+
+        # Assert
+        assert result == "\n\n".join(pages)
+        assert result == TextExtractor()._extract_pdf_sync(pdf)
+        assert [call.args[1:] for call in extract_pages.call_args_list] == [
+            (0, 2),
+            (2, 4),
+            (4, 5),
+        ]
+
+    async def test_extract_pdf_in_process_pool(self):
+        """Test PDF extraction runs in worker processes."""
+        # Arrange
+        pages = [f"Section {i}" for i in range(3)]
+        executor = ProcessPoolExecutor(
+            max_workers=2, mp_context=multiprocessing.get_context("spawn")
+        )
+        extractor = TextExtractor(executor=executor, pdf_pages_per_task=1)
+
+        # Act
+        try:
+            result = await extractor.extract(make_pdf(pages), "manual.pdf")
+        finally:
+            executor.shutdown()
+
+        # Assert
+        assert result == "\n\n".join(pages)
+
+    async def test_iter_text_yields_pdf_pages_as_extracted(self):
+        """Test streamed PDF text concatenates to the extracted text."""
+        # Arrange
+        pages = [f"Chapter {i}" for i in range(5)]
+        executor = CountingExecutor()
+        extractor = TextExtractor(executor=executor, pdf_pages_per_task=2)
+
+        # Act
+        pieces = [piece async for piece in extractor.iter_text(make_pdf(pages), "book.pdf")]
+        text = await extractor.extract(make_pdf(pages), "book.pdf")
+        executor.shutdown()
+
+        # Assert
+        assert pieces == ["Chapter 0"] + [f"\n\nChapter {i}" for i in range(1, 5)]
+        assert "".join(pieces) == text
+
+    async def test_iter_text_bounds_pdf_ranges_ahead_of_consumer(self):
+        """Test at most two page ranges per worker are extracted ahead of the consumer."""
+        # Arrange
+        executor = CountingExecutor()
+        extractor = TextExtractor(executor=executor, pdf_pages_per_task=1, max_workers=1)
+        pieces = extractor.iter_text(make_pdf([f"Page {i}" for i in range(6)]), "book.pdf")
+
+        # Act
+        first = await pieces.__anext__()
+        submitted = executor.submitted
+        await pieces.aclose()
+        executor.shutdown()
+
+        # Assert
+        assert first == "Page 0"
+        assert submitted == 3  # page count, then two ranges
+
+    async def test_iter_text_invalid_pdf(self, text_extractor):
+        """Test streaming an invalid PDF raises TextExtractionError."""
+        # Act & Assert
+        with pytest.raises(TextExtractionError, match="Failed to extract text from PDF"):
+            [piece async for piece in text_extractor.iter_text(b"Not a PDF file", "bad.pdf")]
+
+    async def test_iter_text_other_formats_in_one_piece(self, text_extractor):
+        """Test non-PDF files are streamed as a single piece."""
+        # Act
+        pieces = [piece async for piece in text_extractor.iter_text(b"# Title", "notes.md")]
+
+        # Assert
+        assert pieces == ["# Title"]
+
+
 @pytest.mark.asyncio
 class TestTextExtractorDOCX:
     """Test DOCX text extraction."""
@@ -208,3 +348,28 @@ class TestTextExtractorErrorHandling:
         # Act & Assert
         with pytest.raises(TextExtractionError):
             await text_extractor.extract(content, "")
+
+
+@pytest.mark.asyncio
+class TestTextExtractorOffload:
+    """Test routing of HTML and DOCX parsing by file size."""
+
+    async def test_only_large_html_is_sent_to_executor(self):
+        """Test small files parse in the default thread pool and large ones in the executor."""
+        # Arrange
+        executor = CountingExecutor()
+        extractor = TextExtractor(executor=executor, offload_min_bytes=1024)
+        small = b"<html><body><p>Small page</p></body></html>"
+        large = b"<html><body>" + b"<p>Large page</p>" * 100 + b"</body></html>"
+
+        # Act
+        small_text = await extractor.extract(small, "small.html")
+        submitted_after_small = executor.submitted
+        large_text = await extractor.extract(large, "large.html")
+        executor.shutdown()
+
+        # Assert
+        assert small_text == "Small page"
+        assert large_text.count("Large page") == 100
+        assert submitted_after_small == 0
+        assert executor.submitted == 1
@@ -0,0 +1,138 @@
+"""Unit tests for IngestKnowledgeUseCase."""
+
+import asyncio
+from io import BytesIO
+from unittest.mock import AsyncMock, MagicMock
+from uuid import uuid4
+
+import pytest
+from fastapi import UploadFile
+
+from src.application.services.embedding_batcher import EmbeddingBatcher
+from src.application.services.text_chunker import TextChunker
+from src.application.services.text_extractor import TextExtractor
+from src.application.use_cases.ingest_knowledge import IngestKnowledgeUseCase
+from src.shared.utils.errors import EmbeddingError
+
+
+@pytest.fixture
+def mock_document_repo():
+    """Mock document repository returning the document it is given."""
+    repo = AsyncMock()
+    repo.create = AsyncMock(side_effect=lambda document: document)
+    return repo
+
+
+@pytest.fixture
+def mock_knowledge_repo():
+    """Mock knowledge repository."""
+    repo = AsyncMock()
+    repo.delete_by_document = AsyncMock(return_value=0)
+    return repo
+
+
+@pytest.fixture
+def mock_cache_service():
+    """Mock RAG query cache."""
+    return AsyncMock()
+
+
+def make_upload(text: str) -> UploadFile:
+    """Create an uploaded Markdown file."""
+    return UploadFile(file=BytesIO(text.encode()), filename="notes.md")
+
+
+def make_use_case(document_repo, knowledge_repo, provider, cache_service=None, **kwargs):
+    """Create the use case with small chunks and batches."""
+    return IngestKnowledgeUseCase(
+        document_repository=document_repo,
+        knowledge_repository=knowledge_repo,
+        text_extractor=TextExtractor(),
+        text_chunker=TextChunker(chunk_size_chars=100, overlap_chars=0),
+        llm_provider=provider,
+        embedding_batcher=EmbeddingBatcher(max_items=2),
+        cache_service=cache_service,
+        **kwargs,
+    )
+
+
+@pytest.mark.asyncio
+class TestIngestKnowledgeUseCase:
+    """Test cases for IngestKnowledgeUseCase."""
+
+    async def test_saves_chunks_in_bounded_batches(
+        self, mock_document_repo, mock_knowledge_repo, mock_cache_service
+    ):
+        """Test chunks are embedded and saved batch by batch, with few in flight."""
+        # Arrange
+        text = " ".join(f"Sentence {i} is long enough to fill most of a chunk." for i in range(10))
+        in_flight = 0
+        max_in_flight = 0
+
+        async def embed_texts(texts):
+            nonlocal in_flight, max_in_flight
+            in_flight += 1
+            max_in_flight = max(max_in_flight, in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+            return [[0.1] for _ in texts]
+
+        provider = MagicMock()
+        provider.embed_texts = AsyncMock(side_effect=embed_texts)
+        use_case = make_use_case(
+            mock_document_repo,
+            mock_knowledge_repo,
+            provider,
+            mock_cache_service,
+            max_pending_batches=2,
+        )
+        project_id = uuid4()
+
+        # Act
+        document_id = await use_case.execute(make_upload(text), project_id)
+
+        # Assert
+        saved = [
+            item for call in mock_knowledge_repo.create_batch.await_args_list for item in call.args[0]
+        ]
+        assert mock_knowledge_repo.create_batch.await_count == 5
+        assert sorted(item.chunk_index for item in saved) == list(range(10))
+        assert all(item.document_id == document_id for item in saved)
+        assert max_in_flight == 2
+        mock_knowledge_repo.delete_by_document.assert_not_called()
+        mock_cache_service.bump_generation.assert_awaited_once_with(project_id)
+
+    async def test_embedding_failure_discards_saved_knowledge(
+        self, mock_document_repo, mock_knowledge_repo, mock_cache_service
+    ):
+        """Test a failing batch removes the batches already saved for the document."""
+        # Arrange
+        text = " ".join(f"Sentence {i} is long enough to fill most of a chunk." for i in range(10))
+        calls = 0
+
+        async def embed_texts(texts):
+            nonlocal calls
+            calls += 1
+            if calls == 3:
+                raise RuntimeError("rate limited")
+            return [[0.1] for _ in texts]
+
+        provider = MagicMock()
+        provider.embed_texts = AsyncMock(side_effect=embed_texts)
+        mock_knowledge_repo.delete_by_document = AsyncMock(return_value=4)
+        use_case = make_use_case(
+            mock_document_repo,
+            mock_knowledge_repo,
+            provider,
+            mock_cache_service,
+            max_pending_batches=1,
+        )
+        project_id = uuid4()
+
+        # Act & Assert
+        with pytest.raises(EmbeddingError):
+            await use_case.execute(make_upload(text), project_id)
+
+        document = mock_document_repo.create.await_args.args[0]
+        mock_knowledge_repo.delete_by_document.assert_awaited_once_with(document.id)
+        mock_cache_service.bump_generation.assert_awaited_once_with(project_id)
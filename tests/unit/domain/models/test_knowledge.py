@@ -1,10 +1,11 @@
 """Unit tests for KnowledgeItem domain model."""
 
 import pytest
+from array import array
 from datetime import datetime
 from uuid import uuid4
 
-from src.domain.models.knowledge import KnowledgeItem
+from src.domain.models.knowledge import IterativeScanMode, KnowledgeItem, SearchEffort
 
 
 class TestKnowledgeItem:
@@ -210,3 +211,88 @@ class TestKnowledgeItem:
             )
 
             assert len(item.embedding) == dim
+
+    def test_float_array_embedding_is_valid(self):
+        """Test that a compact array('f') embedding (as decoded from pgvector) is valid."""
+        item = KnowledgeItem(
+            id=uuid4(),
+            document_id=uuid4(),
+            chunk_text="Test chunk",
+            chunk_index=0,
+            embedding=array("f", [0.1] * 1536),
+            metadata={},
+            created_at=datetime.utcnow(),
+        )
+
+        assert len(item.embedding) == 1536
+
+    def test_unloaded_embedding_is_valid(self):
+        """Test that an item read without its embedding (None) is valid."""
+        item = KnowledgeItem(
+            id=uuid4(),
+            document_id=uuid4(),
+            chunk_text="Test chunk",
+            chunk_index=0,
+            embedding=None,
+            metadata={},
+            created_at=datetime.utcnow(),
+        )
+
+        assert item.embedding is None
+
+    def test_non_float_array_embedding_raises_error(self):
+        """Test that a non-float array embedding raises ValueError."""
+        with pytest.raises(ValueError, match="All embedding values must be numeric"):
+            KnowledgeItem(
+                id=uuid4(),
+                document_id=uuid4(),
+                chunk_text="Test chunk",
+                chunk_index=0,
+                embedding=array("u", "abc"),
+                metadata={},
+                created_at=datetime.utcnow(),
+            )
+
+    def test_project_id_defaults_to_none(self):
+        """Test that project_id is optional and resolved by the repository when unset."""
+        item = KnowledgeItem(
+            id=uuid4(),
+            document_id=uuid4(),
+            chunk_text="Test chunk",
+            chunk_index=0,
+            embedding=[0.1] * 10,
+            metadata={},
+            created_at=datetime.utcnow(),
+        )
+
+        assert item.project_id is None
+
+
+class TestSearchEffort:
+    """Test cases for SearchEffort value object."""
+
+    def test_defaults_match_pgvector_defaults(self):
+        """Test that the default effort mirrors pgvector's server defaults."""
+        effort = SearchEffort()
+
+        assert effort.ef_search == 40
+        assert effort.iterative_scan == IterativeScanMode.OFF
+        assert effort.max_scan_tuples == 20000
+
+    def test_ef_search_out_of_range_raises_error(self):
+        """Test that ef_search outside 1-1000 raises ValueError."""
+        with pytest.raises(ValueError, match="ef_search must be between 1 and 1000"):
+            SearchEffort(ef_search=0)
+
+        with pytest.raises(ValueError, match="ef_search must be between 1 and 1000"):
+            SearchEffort(ef_search=1001)
+
+    def test_non_positive_max_scan_tuples_raises_error(self):
+        """Test that a non-positive max_scan_tuples raises ValueError."""
+        with pytest.raises(ValueError, match="max_scan_tuples must be positive"):
+            SearchEffort(max_scan_tuples=0)
+
+    def test_invalid_iterative_scan_raises_error(self):
+        """Test that a raw string iterative scan mode is rejected."""
+        with pytest.raises(ValueError, match="Invalid iterative scan mode"):
+            SearchEffort(iterative_scan="relaxed_order")
@@ -0,0 +1,25 @@
+"""Unit tests for the shared Redis cache service lifecycle."""
+
+from unittest.mock import AsyncMock, patch
+
+import pytest
+
+from src.infrastructure.cache import connection
+
+
+@pytest.mark.asyncio
+async def test_init_cache_service_is_shared_and_closed():
+    """Test the service is created once, survives Redis being down, and closes."""
+    with patch.object(
+        connection.RedisCacheService, "ping", AsyncMock(return_value=False)
+    ), patch.object(connection.RedisCacheService, "close", AsyncMock()) as close:
+        first = await connection.init_cache_service()
+        second = await connection.init_cache_service()
+
+        assert first is second
+
+        await connection.close_cache_service()
+
+        close.assert_awaited_once()
+        assert await connection.init_cache_service() is not first
+        await connection.close_cache_service()
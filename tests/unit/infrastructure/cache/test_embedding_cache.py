@@ -0,0 +1,115 @@
+"""Unit tests for LocalCache and EmbeddingCache."""
+
+import hashlib
+from array import array
+from unittest.mock import AsyncMock, patch
+
+import pytest
+
+from src.infrastructure.cache.embedding_cache import EmbeddingCache
+from src.infrastructure.cache.local_cache import LocalCache
+
+
+def test_local_cache_evicts_least_recently_used():
+    """Test the least recently used entry is evicted when full."""
+    cache = LocalCache(max_entries=2, ttl=60)
+    cache.set("a", 1)
+    cache.set("b", 2)
+    cache.get("a")
+    cache.set("c", 3)
+
+    assert cache.get("a") == 1
+    assert cache.get("b") is None
+    assert cache.get("c") == 3
+    assert len(cache) == 2
+
+
+def test_local_cache_expires_entries():
+    """Test entries older than the TTL are treated as misses and dropped."""
+    cache = LocalCache(max_entries=10, ttl=5)
+    with patch("src.infrastructure.cache.local_cache.time.monotonic", return_value=100.0):
+        cache.set("a", 1)
+    with patch("src.infrastructure.cache.local_cache.time.monotonic", return_value=106.0):
+        assert cache.get("a") is None
+    assert len(cache) == 0
+
+
+def test_local_cache_evicts_to_stay_within_byte_bound():
+    """Test entries are evicted by size and oversized values are not stored."""
+    cache = LocalCache(max_entries=10, ttl=60, max_bytes=100)
+    cache.set("a", 1, size=40)
+    cache.set("b", 2, size=40)
+    cache.set("c", 3, size=40)
+
+    assert cache.get("a") is None
+    assert cache.size_bytes == 80
+
+    cache.set("b", 4, size=150)
+    assert cache.get("b") is None
+    assert cache.size_bytes == 40
+
+
+def test_cache_key_uses_model_and_text_hash():
+    """Test keys are namespaced by model and content-addressed by SHA256."""
+    cache = EmbeddingCache(LocalCache(max_entries=10, ttl=60), key_prefix="emb:")
+
+    key = cache.cache_key("text-embedding-3-small", "hello")
+
+    assert key == f"emb:text-embedding-3-small:{hashlib.sha256(b'hello').hexdigest()}"
+    assert cache.cache_key("other-model", "hello") != key
+
+
+@pytest.mark.asyncio
+async def test_get_many_reads_local_then_redis():
+    """Test lookups fall through to Redis and promote its hits to the local tier."""
+    redis = AsyncMock()
+    redis.get_many = AsyncMock(return_value=[EmbeddingCache._encode(array("f", [0.5, 0.25])), None])
+    cache = EmbeddingCache(LocalCache(max_entries=10, ttl=60), redis=redis)
+    cache.local.set(cache.cache_key("m", "local"), array("f", [1.0]))
+
+    results = await cache.get_many("m", ["local", "remote", "missing"])
+
+    assert results == [[1.0], [0.5, 0.25], None]
+    redis.get_many.assert_awaited_once_with(
+        [cache.cache_key("m", "remote"), cache.cache_key("m", "missing")]
+    )
+    assert cache.local.get(cache.cache_key("m", "remote")) == array("f", [0.5, 0.25])
+    metrics = cache.metrics()
+    assert (metrics["local_hits"], metrics["redis_hits"], metrics["misses"]) == (1, 1, 1)
+    assert metrics["hit_rate"] == pytest.approx(2 / 3)
+
+
+@pytest.mark.asyncio
+async def test_set_many_writes_both_tiers():
+    """Test stored embeddings land in the local tier and in one Redis call."""
+    redis = AsyncMock()
+    cache = EmbeddingCache(LocalCache(max_entries=10, ttl=60), redis=redis, ttl=120)
+
+    await cache.set_many("m", ["a", "b"], [[1.0], [2.0]])
+
+    assert cache.local.get(cache.cache_key("m", "a")) == array("f", [1.0])
+    stored, ttl = redis.set_many.await_args.args
+    assert ttl == 120
+    assert EmbeddingCache._decode(stored[cache.cache_key("m", "b")]) == array("f", [2.0])
+
+
+@pytest.mark.asyncio
+async def test_local_tier_is_bounded_by_bytes():
+    """Test local entries are float32 arrays sized against the tier's byte bound."""
+    cache = EmbeddingCache(LocalCache(max_entries=10, ttl=60, max_bytes=3 * 4 * 4))
+
+    await cache.set_many("m", ["a", "b", "c", "d"], [[0.5] * 4 for _ in range(4)])
+
+    assert cache.metrics()["local_bytes"] == 3 * 4 * 4
+    assert await cache.get_many("m", ["a", "d"]) == [None, [0.5] * 4]
+
+
+@pytest.mark.asyncio
+async def test_undecodable_redis_value_is_a_miss():
+    """Test a corrupt Redis entry is ignored rather than returned."""
+    redis = AsyncMock()
+    redis.get_many = AsyncMock(return_value=["not-base64!"])
+    cache = EmbeddingCache(LocalCache(max_entries=10, ttl=60), redis=redis)
+
+    assert await cache.get_many("m", ["a"]) == [None]
+    assert cache.metrics()["misses"] == 1
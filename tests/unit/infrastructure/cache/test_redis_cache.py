@@ -5,6 +5,7 @@ import pytest
 from unittest.mock import AsyncMock, patch
 from uuid import uuid4
 
+from src.domain.models.knowledge import IterativeScanMode, SearchEffort
 from src.infrastructure.cache.redis_cache import RedisCacheService
 
 
@@ -321,3 +322,187 @@ async def test_close_connection(cache_service, mock_redis_client):
         # Assert
         mock_redis_client.aclose.assert_awaited_once()
         assert cache_service._client is None, "Client should be set to None after close"
+
+
+@pytest.mark.asyncio
+async def test_get_many_uses_single_mget(cache_service, mock_redis_client):
+    """Test multi-key retrieval is one MGET round trip."""
+    # Arrange
+    mock_redis_client.mget = AsyncMock(return_value=["v1", None])
+
+    async def mock_from_url(*args, **kwargs):
+        return mock_redis_client
+
+    with patch("redis.asyncio.from_url", side_effect=mock_from_url):
+        # Act
+        result = await cache_service.get_many(["k1", "k2"])
+
+        # Assert
+        assert result == ["v1", None]
+        mock_redis_client.mget.assert_awaited_once_with(["k1", "k2"])
+
+
+@pytest.mark.asyncio
+async def test_get_many_redis_error_handling(cache_service, mock_redis_client):
+    """Test multi-key retrieval degrades to misses on Redis errors."""
+    # Arrange
+    mock_redis_client.mget = AsyncMock(side_effect=Exception("Redis connection failed"))
+
+    async def mock_from_url(*args, **kwargs):
+        return mock_redis_client
+
+    with patch("redis.asyncio.from_url", side_effect=mock_from_url):
+        # Act
+        result = await cache_service.get_many(["k1", "k2"])
+
+        # Assert
+        assert result == [None, None], "Should return misses on error"
+
+
+@pytest.mark.asyncio
+async def test_slow_redis_is_bounded_by_timeout(redis_url, mock_redis_client):
+    """Test a call slower than the timeout is abandoned and treated as a miss."""
+    # Arrange
+    import asyncio
+    import time
+
+    async def slow_get(key):
+        await asyncio.sleep(5)
+
+    mock_redis_client.get = AsyncMock(side_effect=slow_get)
+    cache_service = RedisCacheService(redis_url=redis_url, timeout=0.05)
+
+    async def mock_from_url(*args, **kwargs):
+        return mock_redis_client
+
+    with patch("redis.asyncio.from_url", side_effect=mock_from_url):
+        # Act
+        start = time.perf_counter()
+        result = await cache_service.get("rag:query:test-key")
+
+        # Assert
+        assert result is None, "Should return None on timeout"
+        assert time.perf_counter() - start < 1
+
+
+@pytest.mark.asyncio
+async def test_from_settings_uses_bounded_pool():
+    """Test the settings-based service shares a bounded, blocking connection pool."""
+    # Arrange
+    import redis.asyncio as redis
+
+    from src.shared.config.settings import RedisSettings
+
+    settings = RedisSettings(
+        host="localhost", port=6379, db=2, max_connections=7, timeout=0.1, health_check_interval=15
+    )
+    cache_service = RedisCacheService.from_settings(settings)
+
+    # Act
+    client = await cache_service._get_client()
+
+    # Assert
+    pool = client.connection_pool
+    assert isinstance(pool, redis.BlockingConnectionPool)
+    assert pool.max_connections == 7
+    assert pool.connection_kwargs["socket_timeout"] == 0.1
+    assert pool.connection_kwargs["health_check_interval"] == 15
+    assert pool.connection_kwargs["db"] == 2
+    await cache_service.close()
+
+
+@pytest.mark.asyncio
+async def test_acquire_and_release_lock(cache_service, mock_redis_client):
+    """Test locks are taken with SET NX PX and released by token."""
+    # Arrange
+    mock_redis_client.set = AsyncMock(side_effect=[True, None])
+    mock_redis_client.eval = AsyncMock(return_value=1)
+
+    async def mock_from_url(*args, **kwargs):
+        return mock_redis_client
+
+    with patch("redis.asyncio.from_url", side_effect=mock_from_url):
+        # Act
+        token = await cache_service.acquire_lock("rag:query:key:lock", 30)
+        second = await cache_service.acquire_lock("rag:query:key:lock", 30)
+        await cache_service.release_lock("rag:query:key:lock", token)
+
+        # Assert
+        assert token, "First caller should get the lock"
+        assert second is None, "Second caller should find the lock taken"
+        mock_redis_client.set.assert_any_await(
+            "rag:query:key:lock", token, nx=True, px=30000
+        )
+        assert mock_redis_client.eval.await_args.args[1:] == (1, "rag:query:key:lock", token)
+
+
+@pytest.mark.asyncio
+async def test_bump_generation_changes_cache_key(redis_url, mock_redis_client):
+    """Test bumping a project's generation moves it to new cache keys."""
+    # Arrange
+    cache_service = RedisCacheService(redis_url=redis_url, generation_ttl=60)
+    project_id = uuid4()
+    mock_redis_client.get = AsyncMock(return_value=None)
+    mock_redis_client.incr = AsyncMock(return_value=1)
+
+    async def mock_from_url(*args, **kwargs):
+        return mock_redis_client
+
+    with patch("redis.asyncio.from_url", side_effect=mock_from_url):
+        # Act
+        before = await cache_service.get_generation(project_id)
+        await cache_service.bump_generation(project_id)
+        after = await cache_service.get_generation(project_id)
+
+        # Assert
+        assert (before, after) == (0, 1)
+        mock_redis_client.incr.assert_awaited_once_with(f"rag:gen:{project_id}")
+        assert mock_redis_client.get.await_count == 1, "Generation should be reused in-process"
+        keys = {
+            cache_service.generate_cache_key(
+                project_id, "query", True, True, False, 5, "rag:query:", generation=generation
+            )
+            for generation in (before, after)
+        }
+        assert len(keys) == 2
+
+
+def test_generate_cache_key_includes_search_effort(cache_service):
+    """Test results computed with different HNSW search effort get different keys."""
+    # Arrange
+    project_id = uuid4()
+    efforts = [
+        None,
+        SearchEffort(),
+        SearchEffort(ef_search=200),
+        SearchEffort(iterative_scan=IterativeScanMode.RELAXED_ORDER),
+        SearchEffort(max_scan_tuples=50000),
+    ]
+
+    # Act
+    keys = {
+        cache_service.generate_cache_key(
+            project_id, "query", True, True, False, 5, "rag:query:", effort=effort
+        )
+        for effort in efforts
+    }
+
+    # Assert
+    assert len(keys) == len(efforts)
+
+
+@pytest.mark.asyncio
+async def test_get_generation_redis_error_handling(cache_service, mock_redis_client):
+    """Test an unreadable generation is reported as None so callers skip the cache."""
+    # Arrange
+    mock_redis_client.get = AsyncMock(side_effect=Exception("Redis connection error"))
+
+    async def mock_from_url(*args, **kwargs):
+        return mock_redis_client
+
+    with patch("redis.asyncio.from_url", side_effect=mock_from_url):
+        # Act
+        generation = await cache_service.get_generation(uuid4())
+
+        # Assert
+        assert generation is None
@@ -0,0 +1,81 @@
+"""Unit tests for SemanticQueryCache."""
+
+import asyncio
+from unittest.mock import patch
+
+import pytest
+
+from src.infrastructure.cache.semantic_query_cache import (
+    MAX_ENTRIES_PER_SCOPE,
+    SemanticQueryCache,
+)
+
+
+def test_find_returns_most_similar_match_above_threshold():
+    """Test the best match is returned with its cosine similarity."""
+    cache = SemanticQueryCache(threshold=0.9)
+    cache.add("scope", [1.0, 0.0], "key-a")
+    cache.add("scope", [1.0, 0.2], "key-b")
+
+    cache_key, similarity = cache.find("scope", [2.0, 0.3])
+
+    assert cache_key == "key-b"
+    assert similarity == pytest.approx(0.9995, abs=1e-3)
+
+
+@pytest.mark.asyncio
+async def test_find_many_matches_each_query_against_the_scope():
+    """Test a batch lookup returns one match or None per query, in order."""
+    cache = SemanticQueryCache(threshold=0.95)
+    cache.add("scope", [1.0, 0.0], "key-a")
+    cache.add("scope", [0.0, 1.0], "key-b")
+
+    with patch(
+        "src.infrastructure.cache.semantic_query_cache.asyncio.to_thread",
+        wraps=asyncio.to_thread,
+    ) as to_thread:
+        matches = await cache.find_many("scope", [[0.0, 2.0], [0.7, 0.7], [1.0, 0.01]])
+
+    to_thread.assert_called_once()
+
+    assert [match and match[0] for match in matches] == ["key-b", None, "key-a"]
+    assert (cache.metrics()["hits"], cache.metrics()["misses"]) == (2, 1)
+
+
+def test_max_entries_is_capped():
+    """Test a per-scope size above MAX_ENTRIES_PER_SCOPE is clamped."""
+    cache = SemanticQueryCache(max_entries=MAX_ENTRIES_PER_SCOPE * 10)
+
+    assert cache.max_entries == MAX_ENTRIES_PER_SCOPE
+
+
+def test_find_misses_below_threshold_and_in_other_scopes():
+    """Test dissimilar queries and other scopes never match."""
+    cache = SemanticQueryCache(threshold=0.95)
+    cache.add("scope", [1.0, 0.0], "key-a")
+
+    assert cache.find("scope", [0.7, 0.7]) is None
+    assert cache.find("other-scope", [1.0, 0.0]) is None
+    assert cache.metrics()["misses"] == 2
+
+
+def test_entries_expire_and_are_bounded_per_scope():
+    """Test expired entries are skipped and the oldest entries are dropped."""
+    cache = SemanticQueryCache(threshold=0.99, max_entries=2, ttl=10)
+    with patch("src.infrastructure.cache.semantic_query_cache.time.monotonic", return_value=0.0):
+        cache.add("scope", [1.0, 0.0, 0.0], "key-a")
+        cache.add("scope", [0.0, 1.0, 0.0], "key-b")
+        cache.add("scope", [0.0, 0.0, 1.0], "key-c")
+        assert cache.find("scope", [1.0, 0.0, 0.0]) is None
+        assert cache.find("scope", [0.0, 1.0, 0.0])[0] == "key-b"
+    with patch("src.infrastructure.cache.semantic_query_cache.time.monotonic", return_value=11.0):
+        assert cache.find("scope", [0.0, 1.0, 0.0]) is None
+
+
+def test_zero_vectors_are_ignored():
+    """Test a zero embedding is neither stored nor matched."""
+    cache = SemanticQueryCache()
+    cache.add("scope", [0.0, 0.0], "key-a")
+
+    assert cache.find("scope", [0.0, 0.0]) is None
+    assert cache.metrics()["scopes"] == 0
@@ -1,11 +1,16 @@
 """Comprehensive unit tests for all LLM providers."""
 
+import json
+
+import httpx
 import pytest
 from src.infrastructure.external.llm.providers.openai_provider import OpenAIProvider
 from src.infrastructure.external.llm.providers.anthropic_provider import AnthropicProvider
 from src.infrastructure.external.llm.providers.ollama_provider import OllamaProvider
 from src.infrastructure.external.llm.providers.openrouter_provider import OpenRouterProvider
 from src.shared.config.settings import LLMSettings
+from src.infrastructure.external.llm.providers.base import parse_retry_after
+from src.shared.utils.errors import LLMProviderError, LLMRateLimitError
 
 
 @pytest.fixture
@@ -89,6 +94,65 @@ class TestOpenAIProvider:
         with pytest.raises(ValueError, match="API key"):
             OpenAIProvider(settings)
 
+    async def test_embed_texts_single_request_in_input_order(self, openai_settings):
+        """Test batch embeddings use one array-input request and follow response indexes."""
+        requests = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            requests.append(json.loads(request.content))
+            return httpx.Response(
+                200,
+                json={
+                    "data": [
+                        {"index": 1, "embedding": [2.0]},
+                        {"index": 0, "embedding": [1.0]},
+                    ]
+                },
+            )
+
+        provider = OpenAIProvider(openai_settings)
+        await provider.close()
+        provider._client = httpx.AsyncClient(
+            base_url=provider.BASE_URL, transport=httpx.MockTransport(handler)
+        )
+
+        embeddings = await provider.embed_texts(["first", "second"])
+
+        assert embeddings == [[1.0], [2.0]]
+        assert requests == [{"input": ["first", "second"], "model": "text-embedding-3-small"}]
+        await provider.close()
+
+    async def test_embed_texts_rejects_short_response(self, openai_settings):
+        """Test a response with fewer embeddings than inputs is an error."""
+        provider = OpenAIProvider(openai_settings)
+        await provider.close()
+        provider._client = httpx.AsyncClient(
+            base_url=provider.BASE_URL,
+            transport=httpx.MockTransport(
+                lambda request: httpx.Response(200, json={"data": [{"index": 0, "embedding": [1.0]}]})
+            ),
+        )
+
+        with pytest.raises(LLMProviderError, match="1 embeddings for 2 inputs"):
+            await provider.embed_texts(["first", "second"])
+        await provider.close()
+
+    async def test_rate_limit_carries_retry_after(self, openai_settings):
+        """Test a 429 response exposes the Retry-After delay on the error."""
+        provider = OpenAIProvider(openai_settings)
+        await provider.close()
+        provider._client = httpx.AsyncClient(
+            base_url=provider.BASE_URL,
+            transport=httpx.MockTransport(
+                lambda request: httpx.Response(429, headers={"Retry-After": "2"}, text="slow down")
+            ),
+        )
+
+        with pytest.raises(LLMRateLimitError) as exc_info:
+            await provider.embed_texts(["first"])
+        assert exc_info.value.retry_after == 2.0
+        await provider.close()
+
     async def test_close(self, openai_settings):
         """Test provider cleanup."""
         provider = OpenAIProvider(openai_settings)
@@ -126,6 +190,8 @@ class TestAnthropicProvider:
         provider = AnthropicProvider(anthropic_settings)
         with pytest.raises(NotImplementedError, match="embeddings"):
             await provider.embed_text("test")
+        with pytest.raises(NotImplementedError, match="embeddings"):
+            await provider.embed_texts(["test"])
         await provider.close()
 
     async def test_close(self, anthropic_settings):
@@ -145,6 +211,28 @@ class TestOllamaProvider:
         assert provider._client is not None
         await provider.close()
 
+    async def test_embed_texts_uses_batch_endpoint(self, ollama_settings):
+        """Test batch embeddings are sent to /api/embed in one request."""
+        requests = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            requests.append((request.url.path, json.loads(request.content)))
+            return httpx.Response(200, json={"embeddings": [[1.0], [2.0]]})
+
+        provider = OllamaProvider(ollama_settings)
+        await provider.close()
+        provider._client = httpx.AsyncClient(
+            base_url=ollama_settings.ollama_base_url, transport=httpx.MockTransport(handler)
+        )
+
+        embeddings = await provider.embed_texts(["first", "second"])
+
+        assert embeddings == [[1.0], [2.0]]
+        assert requests == [
+            ("/api/embed", {"model": "nomic-embed-text", "input": ["first", "second"]})
+        ]
+        await provider.close()
+
     async def test_close(self, ollama_settings):
         """Test provider cleanup."""
         provider = OllamaProvider(ollama_settings)
@@ -182,6 +270,8 @@ class TestOpenRouterProvider:
         provider = OpenRouterProvider(openrouter_settings)
         with pytest.raises(NotImplementedError, match="embedding"):
             await provider.embed_text("test")
+        with pytest.raises(NotImplementedError, match="embedding"):
+            await provider.embed_texts(["test"])
         await provider.close()
 
     async def test_close(self, openrouter_settings):
@@ -189,3 +279,17 @@ class TestOpenRouterProvider:
         provider = OpenRouterProvider(openrouter_settings)
         await provider.close()
         assert provider._client.is_closed
+
+
+@pytest.mark.parametrize(
+    "headers, expected",
+    [
+        ({"retry-after": "3"}, 3.0),
+        ({"retry-after-ms": "250", "retry-after": "1"}, 0.25),
+        ({"retry-after": "Wed, 21 Oct 2015 07:28:00 GMT"}, None),
+        ({}, None),
+    ],
+)
+def test_parse_retry_after(headers, expected):
+    """Test Retry-After parsing for seconds, milliseconds and unsupported values."""
+    assert parse_retry_after(httpx.Headers(headers)) == expected
@@ -0,0 +1,73 @@
+"""Unit tests for CachedEmbeddingProvider."""
+
+from unittest.mock import AsyncMock
+
+import pytest
+
+from src.infrastructure.cache.embedding_cache import EmbeddingCache
+from src.infrastructure.cache.local_cache import LocalCache
+from src.infrastructure.external.llm.embedding_cache_provider import CachedEmbeddingProvider
+
+
+def echo_provider() -> AsyncMock:
+    """Provider whose embedding of a text is [len(text)]."""
+    provider = AsyncMock()
+    provider.embed_text = AsyncMock(side_effect=lambda text, model=None: [float(len(text))])
+    provider.embed_texts = AsyncMock(
+        side_effect=lambda texts, model=None: [[float(len(text))] for text in texts]
+    )
+    return provider
+
+
+def cached_provider(provider: AsyncMock) -> CachedEmbeddingProvider:
+    cache = EmbeddingCache(LocalCache(max_entries=100, ttl=60))
+    return CachedEmbeddingProvider(provider, cache, default_model="default-model")
+
+
+@pytest.mark.asyncio
+class TestCachedEmbeddingProvider:
+    """Test cases for CachedEmbeddingProvider."""
+
+    async def test_embed_text_hits_cache_on_repeat(self):
+        """Test a repeated text is embedded once."""
+        provider = echo_provider()
+        cached = cached_provider(provider)
+
+        assert await cached.embed_text("abc") == [3.0]
+        assert await cached.embed_text("abc") == [3.0]
+
+        provider.embed_text.assert_awaited_once_with("abc", None)
+        assert cached.cache.metrics()["local_hits"] == 1
+
+    async def test_embed_texts_embeds_only_misses(self):
+        """Test only uncached, de-duplicated texts are sent to the provider."""
+        provider = echo_provider()
+        cached = cached_provider(provider)
+        await cached.embed_texts(["a", "bb"])
+
+        results = await cached.embed_texts(["bb", "ccc", "a", "ccc"])
+
+        assert results == [[2.0], [3.0], [1.0], [3.0]]
+        assert provider.embed_texts.await_args_list[-1].args == (["ccc"], None)
+
+    async def test_cache_is_keyed_by_model(self):
+        """Test the same text under another model is not served from the cache."""
+        provider = echo_provider()
+        cached = cached_provider(provider)
+
+        await cached.embed_texts(["a"])
+        await cached.embed_texts(["a"], model="default-model")
+        await cached.embed_texts(["a"], model="other-model")
+
+        assert provider.embed_texts.await_count == 2
+
+    async def test_provider_errors_are_not_cached(self):
+        """Test a failed request propagates and leaves the texts uncached."""
+        provider = echo_provider()
+        provider.embed_texts.side_effect = RuntimeError("boom")
+        cached = cached_provider(provider)
+
+        with pytest.raises(RuntimeError):
+            await cached.embed_texts(["a"])
+
+        assert len(cached.cache.local) == 0
@@ -0,0 +1,81 @@
+"""Unit tests for CoalescingEmbeddingProvider."""
+
+import asyncio
+from unittest.mock import AsyncMock
+
+import pytest
+
+from src.infrastructure.external.llm.embedding_coalescer import CoalescingEmbeddingProvider
+from src.shared.utils.errors import LLMProviderError
+
+
+def echo_provider() -> AsyncMock:
+    """Provider whose embedding of a text is [len(text)]."""
+    provider = AsyncMock()
+    provider.embed_texts = AsyncMock(
+        side_effect=lambda texts, model=None: [[float(len(text))] for text in texts]
+    )
+    return provider
+
+
+@pytest.mark.asyncio
+class TestCoalescingEmbeddingProvider:
+    """Test cases for CoalescingEmbeddingProvider."""
+
+    async def test_concurrent_calls_share_one_request(self):
+        """Test calls within the window are sent together and fanned back out."""
+        provider = echo_provider()
+        coalescer = CoalescingEmbeddingProvider(provider, window_ms=5, max_batch=64)
+
+        results = await asyncio.gather(
+            coalescer.embed_text("a"), coalescer.embed_text("bb"), coalescer.embed_text("ccc")
+        )
+
+        assert results == [[1.0], [2.0], [3.0]]
+        provider.embed_texts.assert_awaited_once_with(["a", "bb", "ccc"], None)
+        provider.embed_text.assert_not_called()
+
+    async def test_max_batch_flushes_without_waiting(self):
+        """Test a full batch is sent immediately, the remainder after the window."""
+        provider = echo_provider()
+        coalescer = CoalescingEmbeddingProvider(provider, window_ms=1000, max_batch=2)
+
+        first = asyncio.gather(coalescer.embed_text("a"), coalescer.embed_text("bb"))
+        assert await asyncio.wait_for(first, timeout=0.5) == [[1.0], [2.0]]
+        provider.embed_texts.assert_awaited_once_with(["a", "bb"], None)
+
+    async def test_models_are_batched_separately(self):
+        """Test calls for different models never share a request."""
+        provider = echo_provider()
+        coalescer = CoalescingEmbeddingProvider(provider, window_ms=5)
+
+        await asyncio.gather(
+            coalescer.embed_text("a", model="m1"),
+            coalescer.embed_text("b", model="m2"),
+            coalescer.embed_text("c", model="m1"),
+        )
+
+        calls = sorted(call.args for call in provider.embed_texts.await_args_list)
+        assert calls == [(["a", "c"], "m1"), (["b"], "m2")]
+
+    async def test_batch_error_reaches_every_caller(self):
+        """Test a failed batch request fails all of its callers."""
+        provider = AsyncMock()
+        provider.embed_texts = AsyncMock(side_effect=LLMProviderError("boom"))
+        coalescer = CoalescingEmbeddingProvider(provider, window_ms=5)
+
+        results = await asyncio.gather(
+            coalescer.embed_text("a"), coalescer.embed_text("b"), return_exceptions=True
+        )
+
+        assert all(isinstance(result, LLMProviderError) for result in results)
+        provider.embed_texts.assert_awaited_once()
+
+    async def test_embed_texts_passes_through(self):
+        """Test multi-text requests are not delayed or regrouped."""
+        provider = echo_provider()
+        coalescer = CoalescingEmbeddingProvider(provider, window_ms=1000)
+
+        result = await asyncio.wait_for(coalescer.embed_texts(["a", "bb"]), timeout=0.5)
+
+        assert result == [[1.0], [2.0]]
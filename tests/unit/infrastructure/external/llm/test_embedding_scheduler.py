@@ -0,0 +1,163 @@
+"""Unit tests for EmbeddingScheduler."""
+
+import asyncio
+from unittest.mock import AsyncMock
+
+import pytest
+
+from src.infrastructure.external.llm.embedding_scheduler import EmbeddingScheduler
+from src.shared.utils.errors import (
+    LLMAuthenticationError,
+    LLMConnectionError,
+    LLMRateLimitError,
+)
+
+
+def make_scheduler(provider, **kwargs) -> EmbeddingScheduler:
+    """Create a scheduler with near-zero backoff for fast tests."""
+    kwargs.setdefault("backoff_base", 0.001)
+    return EmbeddingScheduler(provider, name="test", **kwargs)
+
+
+@pytest.mark.asyncio
+class TestEmbeddingScheduler:
+    """Test cases for EmbeddingScheduler."""
+
+    async def test_successes_increase_concurrency_additively(self):
+        """Test the limit grows by about one slot per window of successes."""
+        provider = AsyncMock()
+        provider.embed_texts = AsyncMock(return_value=[[0.1]])
+        scheduler = make_scheduler(provider, initial_concurrency=2, max_concurrency=3)
+
+        await scheduler.embed_texts(["text"])
+        assert scheduler.concurrency_limit == 2  # 2.5: below a full slot
+
+        for _ in range(2):
+            await scheduler.embed_texts(["text"])
+        assert scheduler.concurrency_limit == 3
+
+        for _ in range(10):
+            await scheduler.embed_texts(["text"])
+        assert scheduler.concurrency_limit == 3  # capped at max_concurrency
+
+    async def test_rate_limit_halves_concurrency_and_retries(self):
+        """Test a 429 halves the limit once and the request is retried."""
+        provider = AsyncMock()
+        provider.embed_texts = AsyncMock(
+            side_effect=[LLMRateLimitError("slow down", retry_after=0.01), [[0.1]]]
+        )
+        scheduler = make_scheduler(provider, initial_concurrency=8)
+
+        result = await scheduler.embed_texts(["text"])
+
+        assert result == [[0.1]]
+        assert provider.embed_texts.await_count == 2
+        metrics = scheduler.metrics()
+        assert metrics["concurrency_limit"] == 4
+        assert metrics["rate_limited"] == 1
+        assert metrics["retries"] == 1
+        assert metrics["failures"] == 0
+
+    async def test_retry_waits_for_retry_after(self):
+        """Test the retry is not sent before the provider's Retry-After elapses."""
+        provider = AsyncMock()
+        provider.embed_text = AsyncMock(
+            side_effect=[LLMRateLimitError("slow down", retry_after=0.05), [0.1]]
+        )
+        scheduler = make_scheduler(provider)
+        loop = asyncio.get_running_loop()
+
+        start = loop.time()
+        await scheduler.embed_text("text")
+
+        assert loop.time() - start >= 0.05
+
+    async def test_concurrency_never_exceeds_limit(self):
+        """Test in-flight requests stay within the limit and the rest queue."""
+        running = 0
+        peak = 0
+        queue_depths = []
+        scheduler = None
+
+        async def embed_texts(texts, model=None):
+            nonlocal running, peak
+            running += 1
+            peak = max(peak, running)
+            queue_depths.append(scheduler.metrics()["queue_depth"])
+            await asyncio.sleep(0.01)
+            running -= 1
+            return [[0.1]]
+
+        provider = AsyncMock()
+        provider.embed_texts = AsyncMock(side_effect=embed_texts)
+        scheduler = make_scheduler(provider, initial_concurrency=2, max_concurrency=2)
+
+        await asyncio.gather(*(scheduler.embed_texts(["text"]) for _ in range(6)))
+
+        assert peak == 2
+        assert max(queue_depths) > 0
+        assert scheduler.metrics()["in_flight"] == 0
+        assert scheduler.metrics()["queue_depth"] == 0
+
+    async def test_cancelled_request_frees_its_slot(self):
+        """Test a request cancelled while releasing its slot does not leak it."""
+        returned = asyncio.Event()
+
+        async def embed_text(text, model=None):
+            await returned.wait()
+            return [0.1]
+
+        provider = AsyncMock()
+        provider.embed_text = AsyncMock(side_effect=embed_text)
+        scheduler = make_scheduler(provider, initial_concurrency=1, max_concurrency=1)
+        task = asyncio.create_task(scheduler.embed_text("text"))
+        await asyncio.sleep(0)
+        assert scheduler.metrics()["in_flight"] == 1
+
+        # The request finishes while another coroutine holds the scheduler's lock,
+        # and is cancelled while waiting for it
+        async with scheduler._condition:
+            returned.set()
+            await asyncio.sleep(0.01)
+            task.cancel()
+            await asyncio.sleep(0)
+        with pytest.raises(asyncio.CancelledError):
+            await task
+
+        assert scheduler.metrics()["in_flight"] == 0
+        assert await asyncio.wait_for(scheduler.embed_text("text"), timeout=1) == [0.1]
+
+    async def test_gives_up_after_max_retries(self):
+        """Test the last error is raised once retries are exhausted."""
+        provider = AsyncMock()
+        provider.embed_texts = AsyncMock(side_effect=LLMConnectionError("down"))
+        scheduler = make_scheduler(provider, max_retries=2)
+
+        with pytest.raises(LLMConnectionError):
+            await scheduler.embed_texts(["text"])
+
+        assert provider.embed_texts.await_count == 3
+        assert scheduler.metrics()["failures"] == 1
+
+    async def test_non_transient_errors_are_not_retried(self):
+        """Test authentication errors fail immediately."""
+        provider = AsyncMock()
+        provider.embed_texts = AsyncMock(side_effect=LLMAuthenticationError("bad key"))
+        scheduler = make_scheduler(provider)
+
+        with pytest.raises(LLMAuthenticationError):
+            await scheduler.embed_texts(["text"])
+
+        assert provider.embed_texts.await_count == 1
+        assert scheduler.metrics()["retries"] == 0
+
+    async def test_completions_are_delegated(self):
+        """Test completion calls go straight to the wrapped provider."""
+        provider = AsyncMock()
+        provider.generate_completion = AsyncMock(return_value="answer")
+        scheduler = make_scheduler(provider)
+
+        result = await scheduler.generate_completion([{"role": "user", "content": "hi"}])
+
+        assert result == "answer"
+        assert scheduler.metrics()["requests"] == 0
@@ -0,0 +1,74 @@
+"""Unit tests for the binary pgvector codec."""
+
+import struct
+from array import array
+from unittest.mock import AsyncMock
+
+import pytest
+
+from src.shared.infrastructure.database.vector_codec import (
+    decode_vector,
+    encode_vector,
+    register_vector_codec,
+)
+
+
+class TestVectorCodec:
+    """Tests for encode_vector / decode_vector."""
+
+    def test_encode_matches_pgvector_wire_format(self):
+        """Encoded payload is big-endian dim, reserved field, then float4 values."""
+        payload = encode_vector([1.0, -2.5, 0.25])
+
+        assert payload == struct.pack(">HHfff", 3, 0, 1.0, -2.5, 0.25)
+
+    def test_round_trip_returns_float_array(self):
+        """Decoding an encoded vector returns an equal array('f')."""
+        values = [0.5, -0.125, 3.0, 0.0]
+
+        decoded = decode_vector(encode_vector(values))
+
+        assert isinstance(decoded, array)
+        assert decoded.typecode == "f"
+        assert list(decoded) == values
+
+    def test_encode_accepts_float_array(self):
+        """array('f') inputs encode identically to lists and are not mutated."""
+        values = array("f", [0.1, 0.2, 0.3])
+        snapshot = array("f", values)
+
+        assert encode_vector(values) == encode_vector(list(values))
+        assert values == snapshot
+
+    def test_encode_accepts_integers(self):
+        """Integer components are encoded as floats."""
+        assert list(decode_vector(encode_vector([1, 2, 3]))) == [1.0, 2.0, 3.0]
+
+    def test_decode_ignores_trailing_bytes(self):
+        """Only the declared number of dimensions is decoded."""
+        payload = encode_vector([1.0, 2.0]) + b"\x00\x00\x00\x00"
+
+        assert list(decode_vector(payload)) == [1.0, 2.0]
+
+
+@pytest.mark.asyncio
+async def test_register_vector_codec_sets_binary_codec():
+    """The pool init callback registers a binary codec for public.vector."""
+    conn = AsyncMock()
+
+    await register_vector_codec(conn)
+
+    conn.set_type_codec.assert_awaited_once()
+    args, kwargs = conn.set_type_codec.call_args
+    assert args == ("vector",)
+    assert kwargs["schema"] == "public"
+    assert kwargs["format"] == "binary"
+
+
+@pytest.mark.asyncio
+async def test_register_vector_codec_tolerates_missing_extension():
+    """A database without pgvector does not break connection setup."""
+    conn = AsyncMock()
+    conn.set_type_codec.side_effect = ValueError("unknown type: public.vector")
+
+    await register_vector_codec(conn)